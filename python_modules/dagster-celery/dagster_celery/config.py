@@ -10,6 +10,10 @@ from dagster.core.execution.config import (
 
 DEFAULT_PRIORITY = 5
 
+MIN_PRIORITY = 0
+
+MAX_PRIORITY = 10
+
 DEFAULT_QUEUE = 'dagster'
 
 DEFAULT_CONFIG = {
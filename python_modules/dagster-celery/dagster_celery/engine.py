@@ -1,16 +1,32 @@
-import time
+import threading
 from collections import defaultdict
 
 from dagster import check
+from dagster.core.engine.critical_path import (
+    critical_path_lengths,
+    critical_path_priorities,
+    expected_step_durations,
+)
 from dagster.core.engine.engine_base import Engine
+from dagster.core.events import DagsterEventType
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
 
-from .config import DEFAULT_PRIORITY, DEFAULT_QUEUE, CeleryConfig
+from .config import DEFAULT_QUEUE, MAX_PRIORITY, MIN_PRIORITY, CeleryConfig
 from .tasks import create_task, make_app
 
+CELERY_PRIORITY_KEY = 'dagster-celery/priority'
+
 TICK_SECONDS = 1
+'''The longest the engine waits for the event log storage to notify it of new events before it
+checks whether any step has finished, e.g. because a worker died before logging that its step
+finished -- default 1s.'''
+
+STEP_END_EVENT_TYPES = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+}
 
 
 class CeleryEngine(Engine):
@@ -48,11 +64,24 @@ class CeleryEngine(Engine):
         task_signatures = {}  # Dict[step_key, celery.Signature]
         apply_kwargs = defaultdict(dict)  # Dict[step_key, Dict[str, Any]]
 
-        sort_by_priority = lambda step_key: (-1 * apply_kwargs[step_key]['priority'])
+        # Steps are prioritized by their critical path through the plan, estimated from the
+        # durations of the steps in recent runs of the pipeline, unless they set a priority
+        path_lengths = critical_path_lengths(
+            execution_plan,
+            expected_step_durations(
+                pipeline_context.instance, pipeline_name, execution_plan, CELERY_PRIORITY_KEY
+            ),
+        )
+        path_priorities = critical_path_priorities(path_lengths, MIN_PRIORITY, MAX_PRIORITY)
+
+        sort_by_priority = lambda step_key: (
+            -1 * apply_kwargs[step_key]['priority'],
+            -1 * path_lengths[step_key],
+        )
 
         for step_key in execution_plan.step_keys_to_execute:
             step = execution_plan.get_step_by_key(step_key)
-            priority = step.metadata.get('dagster-celery/priority', DEFAULT_PRIORITY)
+            priority = step.metadata.get(CELERY_PRIORITY_KEY, int(round(path_priorities[step_key])))
             queue = step.metadata.get('dagster-celery/queue', DEFAULT_QUEUE)
             task = create_task(app)
 
@@ -72,48 +101,76 @@ class CeleryEngine(Engine):
                 'routing_key': '{queue}.execute_query'.format(queue=queue),
             }
 
-        step_results = {}  # Dict[ExecutionStep, celery.AsyncResult]
+        step_results = {}  # Dict[step_key, celery.AsyncResult]
         completed_steps = set({})  # Set[step_key]
 
-        while pending_steps or step_results:
-
-            results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: sort_by_priority(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except Exception:  # pylint: disable=broad-except
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                    for step_event in step_events:
-                        yield deserialize_json_to_dagster_namedtuple(step_event)
-                    results_to_pop.append(step_key)
-                    completed_steps.add(step_key)
-            for step_key in results_to_pop:
-                if step_key in step_results:
-                    del step_results[step_key]
-
-            pending_to_pop = []
-            for step_key, requirements in pending_steps.items():
-                if requirements.issubset(completed_steps):
-                    pending_to_pop.append(step_key)
-
-            # This is a slight refinement. If we have n workers idle and schedule m > n steps for
-            # execution, the first n steps will be picked up by the idle workers in the order in
-            # which they are scheduled (and the following m-n steps will be executed in priority
-            # order, provided that it takes longer to execute a step than to schedule it). The test
-            # case has m >> n to exhibit this behavior in the absence of this sort step.
-            to_execute = sorted(pending_to_pop, key=sort_by_priority)
-            for step_key in to_execute:
-                step_results[step_key] = task_signatures[step_key].apply_async(
-                    **apply_kwargs[step_key]
-                )
-
-            for step_key in pending_to_pop:
-                if step_key in pending_steps:
-                    del pending_steps[step_key]
-
-            time.sleep(TICK_SECONDS)
+        # Workers log the events of their steps to the instance as the steps execute. Rather than
+        # waiting for each step's task to finish, the engine tails the run's event log, yielding
+        # the events of its steps as they are logged and scheduling the steps that depend on a
+        # step as soon as it has logged that it finished.
+        instance = pipeline_context.instance
+        cursor = instance.get_event_count(run_id) - 1
+        new_events = threading.Event()
+
+        def _on_new_event(_record):
+            new_events.set()
+
+        def _read_step_events():
+            records = instance.logs_after(run_id, cursor)
+            step_events = [
+                record.dagster_event
+                for record in records
+                if record.is_dagster_event and record.dagster_event.step_key in task_signatures
+            ]
+            return cursor + len(records), step_events
+
+        instance.watch_event_logs(run_id, cursor, _on_new_event)
+        try:
+            while pending_steps or step_results:
+                new_events.clear()
+
+                cursor, step_events = _read_step_events()
+                for step_event in step_events:
+                    yield step_event
+                    if step_event.event_type in STEP_END_EVENT_TYPES:
+                        completed_steps.add(step_event.step_key)
+
+                # A step whose task has finished is complete even if it never logged that it
+                # finished, e.g. because the task failed
+                # We will want to do more to handle failed tasks here.. maybe subclass Task
+                # Certainly yield an engine or pipeline event
+                for step_key, result in list(step_results.items()):
+                    if result.ready():
+                        del step_results[step_key]
+                        completed_steps.add(step_key)
+
+                pending_to_pop = []
+                for step_key, requirements in pending_steps.items():
+                    if requirements.issubset(completed_steps):
+                        pending_to_pop.append(step_key)
+
+                # This is a slight refinement. If we have n workers idle and schedule m > n steps
+                # for execution, the first n steps will be picked up by the idle workers in the
+                # order in which they are scheduled (and the following m-n steps will be executed
+                # in priority order, provided that it takes longer to execute a step than to
+                # schedule it). The test case has m >> n to exhibit this behavior in the absence
+                # of this sort step.
+                to_execute = sorted(pending_to_pop, key=sort_by_priority)
+                for step_key in to_execute:
+                    step_results[step_key] = task_signatures[step_key].apply_async(
+                        **apply_kwargs[step_key]
+                    )
+
+                for step_key in pending_to_pop:
+                    if step_key in pending_steps:
+                        del pending_steps[step_key]
+
+                if pending_steps or step_results:
+                    new_events.wait(TICK_SECONDS)
+
+            # Every task has finished, so every event its step logged is in the event log
+            cursor, step_events = _read_step_events()
+            for step_event in step_events:
+                yield step_event
+        finally:
+            instance.end_watch_event_logs(run_id, _on_new_event)
@@ -1,7 +1,7 @@
 import os
 
 from celery import Celery
-from dagster_celery.config import CeleryConfig
+from dagster_celery.config import DEFAULT_PRIORITY, MAX_PRIORITY, CeleryConfig
 from dagster_graphql.client.mutations import execute_execute_plan_mutation
 from kombu import Queue
 
@@ -33,13 +33,13 @@ def make_app(config=CeleryConfig()):
     app_ = Celery('dagster', **dict({'broker': DEFAULT_BROKER}, **(config._asdict())))
     app_.loader.import_module('celery.contrib.testing.tasks')
     app_.conf.task_queues = [
-        Queue('dagster', routing_key='dagster.#', queue_arguments={'x-max-priority': 10})
+        Queue('dagster', routing_key='dagster.#', queue_arguments={'x-max-priority': MAX_PRIORITY})
     ]
     app_.conf.task_routes = {
         'execute_query': {'queue': 'dagster', 'routing_key': 'dagster.execute_query'}
     }
-    app_.conf.task_queue_max_priority = 10
-    app_.conf.task_default_priority = 5
+    app_.conf.task_queue_max_priority = MAX_PRIORITY
+    app_.conf.task_default_priority = DEFAULT_PRIORITY
     return app_
 
 
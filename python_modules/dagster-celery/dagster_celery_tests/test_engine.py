@@ -0,0 +1,210 @@
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+from dagster_celery import celery_executor
+from dagster_celery import engine as celery_engine
+from dagster_celery.engine import CeleryEngine
+
+from dagster import (
+    ExecutionTargetHandle,
+    ModeDefinition,
+    RunConfig,
+    default_executors,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.execution.api import create_execution_plan, execute_plan
+from dagster.core.execution.context_creation_pipeline import scoped_pipeline_context
+from dagster.core.instance import DagsterInstance, InstanceType
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.local_compute_log_manager import NoOpComputeLogManager
+from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import InMemoryRunStorage
+
+ENVIRONMENT_DICT = {'execution': {'celery': {}}, 'storage': {'filesystem': {}}}
+
+
+@solid
+def simple(_):
+    return 1
+
+
+@solid
+def add_one(_, num):
+    return num + 1
+
+
+def define_serial_pipeline():
+    @pipeline(mode_defs=[ModeDefinition(executor_defs=default_executors + [celery_executor])])
+    def serial_pipeline():
+        add_one(simple())
+
+    return serial_pipeline
+
+
+class FakeAsyncResult(object):
+    def __init__(self, thread=None):
+        self.thread = thread
+
+    def ready(self):
+        return self.thread is None or not self.thread.is_alive()
+
+
+class FakeSignature(object):
+    def __init__(self, task, handle_dict, variables):
+        self.task = task
+        self.handle_dict = handle_dict
+        self.variables = variables
+
+    def apply_async(self, **_kwargs):
+        step_keys = self.variables['executionParams']['stepKeys']
+        self.task.scheduled.extend(step_keys)
+        if set(step_keys) & self.task.dead_step_keys:
+            # The worker died before it logged any event of the step
+            return FakeAsyncResult()
+
+        thread = threading.Thread(target=self.execute_step)
+        thread.start()
+        self.task.threads.append(thread)
+        return FakeAsyncResult(thread)
+
+    def execute_step(self):
+        # Executes the step as a worker would, logging its events to the shared instance
+        execution_params = self.variables['executionParams']
+        pipeline_def = ExecutionTargetHandle.from_dict(self.handle_dict).build_pipeline_definition()
+        environment_dict = execution_params['environmentConfigData']
+        run_id = execution_params['executionMetadata']['runId']
+        execution_plan = create_execution_plan(
+            pipeline_def, environment_dict, RunConfig(run_id=run_id)
+        )
+        try:
+            execute_plan(
+                execution_plan.build_subset_plan(execution_params['stepKeys']),
+                self.task.instance,
+                PipelineRun.create_empty_run(pipeline_def.name, run_id, environment_dict),
+                environment_dict=environment_dict,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            # As with a real task, the error fails the task rather than the engine
+            self.task.errors.append(err)
+
+
+class FakeTask(object):
+    def __init__(self, instance, dead_step_keys=None):
+        self.instance = instance
+        self.dead_step_keys = set(dead_step_keys or [])
+        self.scheduled = []
+        self.threads = []
+        self.errors = []
+
+    def si(self, handle_dict, variables, _instance_ref_dict):
+        return FakeSignature(self, handle_dict, variables)
+
+
+@pytest.fixture
+def instance(monkeypatch):
+    # The Celery executor requires a persistent instance, which the fake workers share in memory
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance(
+            instance_type=InstanceType.PERSISTENT,
+            local_artifact_storage=LocalArtifactStorage(temp_dir),
+            run_storage=InMemoryRunStorage(),
+            event_storage=InMemoryEventLogStorage(),
+            compute_log_manager=NoOpComputeLogManager(temp_dir),
+        )
+        monkeypatch.setattr(instance, 'get_ref', lambda: _FakeInstanceRef())
+        yield instance
+
+
+@contextmanager
+def _execute_on_fake_celery(monkeypatch, instance, task):
+    monkeypatch.setattr(celery_engine, 'make_app', lambda _config: None)
+    monkeypatch.setattr(celery_engine, 'create_task', lambda _app: task)
+
+    handle = ExecutionTargetHandle.for_pipeline_python_file(__file__, 'define_serial_pipeline')
+    pipeline_def = handle.build_pipeline_definition()
+    pipeline_run = PipelineRun.create_empty_run(pipeline_def.name, 'fake_celery', ENVIRONMENT_DICT)
+    execution_plan = create_execution_plan(
+        pipeline_def, ENVIRONMENT_DICT, RunConfig(run_id=pipeline_run.run_id)
+    )
+
+    try:
+        with scoped_pipeline_context(
+            pipeline_def, ENVIRONMENT_DICT, pipeline_run, instance
+        ) as pipeline_context:
+            yield CeleryEngine.execute(pipeline_context, execution_plan)
+    finally:
+        for thread in task.threads:
+            thread.join()
+
+
+class _FakeInstanceRef(object):
+    def to_dict(self):
+        return {}
+
+
+def test_step_events_yielded_in_order_exactly_once(
+    monkeypatch, instance
+):  # pylint: disable=redefined-outer-name
+    task = FakeTask(instance)
+
+    with _execute_on_fake_celery(monkeypatch, instance, task) as step_events:
+        events = list(step_events)
+
+    logged_events = [
+        record.dagster_event
+        for record in instance.all_logs('fake_celery')
+        if record.is_dagster_event and record.dagster_event.step_key
+    ]
+    assert events == logged_events
+    assert [
+        (event.event_type_value, event.step_key) for event in events if event.is_step_success
+    ] == [('STEP_SUCCESS', 'simple.compute'), ('STEP_SUCCESS', 'add_one.compute')]
+    assert task.scheduled == ['simple.compute', 'add_one.compute']
+
+
+def test_task_finished_without_step_end_event(
+    monkeypatch, instance
+):  # pylint: disable=redefined-outer-name
+    monkeypatch.setattr(celery_engine, 'TICK_SECONDS', 0.2)
+    task = FakeTask(instance, dead_step_keys=['simple.compute'])
+
+    start = time.time()
+    with _execute_on_fake_celery(monkeypatch, instance, task) as step_events:
+        events = list(step_events)
+
+    # Nothing is logged for the step whose worker died, so only the tick wakes the engine to find
+    # that its task has finished and to schedule the step that depends on it
+    assert time.time() - start >= 0.2
+    assert task.scheduled == ['simple.compute', 'add_one.compute']
+    assert not [event for event in events if event.step_key == 'simple.compute']
+
+    # The step that depends on it can't find its input
+    assert len(task.errors) == 1
+
+
+def test_watch_ended_when_closed_early(
+    monkeypatch, instance
+):  # pylint: disable=redefined-outer-name
+    task = FakeTask(instance)
+
+    ended_watches = []
+    end_watch_event_logs = instance.end_watch_event_logs
+
+    def _end_watch_event_logs(run_id, cb):
+        ended_watches.append(run_id)
+        return end_watch_event_logs(run_id, cb)
+
+    monkeypatch.setattr(instance, 'end_watch_event_logs', _end_watch_event_logs)
+
+    with _execute_on_fake_celery(monkeypatch, instance, task) as step_events:
+        first_event = next(step_events)
+        assert first_event.step_key == 'simple.compute'
+        assert ended_watches == []
+
+        step_events.close()
+        assert ended_watches == ['fake_celery']
@@ -3,6 +3,11 @@ import dask.distributed
 from dagster_graphql.client.mutations import execute_execute_plan_mutation
 
 from dagster import check
+from dagster.core.engine.critical_path import (
+    critical_path_lengths,
+    critical_path_priorities,
+    expected_step_durations,
+)
 from dagster.core.engine.engine_base import Engine
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
@@ -13,6 +18,14 @@ from .config import DaskConfig
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = 'dagster-dask/resource_requirements'
 
+# Dask task priorities are specified under this key; steps that don't specify one are prioritized
+# by their critical path, on a scale from MIN_PRIORITY to MAX_PRIORITY
+DASK_PRIORITY_KEY = 'dagster-dask/priority'
+
+MIN_PRIORITY = 0
+
+MAX_PRIORITY = 10
+
 
 def query_on_dask_worker(
     handle, variables, dependencies, instance_ref=None
@@ -71,6 +84,15 @@ class DaskEngine(Engine):  # pylint: disable=no-init
 
         instance = pipeline_context.instance
 
+        path_priorities = critical_path_priorities(
+            critical_path_lengths(
+                execution_plan,
+                expected_step_durations(instance, pipeline_name, execution_plan, DASK_PRIORITY_KEY),
+            ),
+            MIN_PRIORITY,
+            MAX_PRIORITY,
+        )
+
         with dask.distributed.Client(**dask_config.build_dict(pipeline_name)) as client:
             execution_futures = []
             execution_futures_dict = {}
@@ -107,6 +129,7 @@ class DaskEngine(Engine):  # pylint: disable=no-init
                         instance.get_ref(),
                         key=dask_task_name,
                         resources=step.metadata.get(DASK_RESOURCE_REQUIREMENTS_KEY, {}),
+                        priority=step.metadata.get(DASK_PRIORITY_KEY, path_priorities[step.key]),
                     )
 
                     execution_futures.append(future)
@@ -1,10 +1,18 @@
-from dagster import ExecutionTargetHandle, check
+from collections import OrderedDict
+
+from dagster import ExecutionTargetHandle, RunConfig, check
 from dagster.core.definitions.partition import PartitionScheduleDefinition
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun
 
 from .pipeline_execution_manager import PipelineExecutionManager
 from .reloader import Reloader
 
+MAX_CACHED_EXECUTION_PLANS = 32
+'''The number of runs whose execution plans are kept, to decorate the events of subscriptions to
+their logs. The least recently used plan is discarded when another is needed.'''
+
 
 class DagsterGraphQLContext(object):
     def __init__(self, handle, execution_manager, instance, reloader=None, version=None):
@@ -21,6 +29,7 @@ class DagsterGraphQLContext(object):
             artifacts_dir=self.instance.schedules_directory()
         )
         self._cached_pipelines = {}
+        self._cached_execution_plans = OrderedDict()
 
         self.partitions_handle = self.get_handle().build_partitions_handle()
 
@@ -76,3 +85,19 @@ class DagsterGraphQLContext(object):
             )
             return pipeline_def
         return self.get_handle().with_pipeline_name(pipeline_name).build_pipeline_definition()
+
+    def get_execution_plan_for_run(self, pipeline_run, pipeline_def):
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+
+        run_id = pipeline_run.run_id
+        if run_id in self._cached_execution_plans:
+            execution_plan = self._cached_execution_plans.pop(run_id)
+        else:
+            execution_plan = create_execution_plan(
+                pipeline_def, pipeline_run.environment_dict, RunConfig(mode=pipeline_run.mode)
+            )
+            if len(self._cached_execution_plans) >= MAX_CACHED_EXECUTION_PLANS:
+                self._cached_execution_plans.popitem(last=False)
+
+        self._cached_execution_plans[run_id] = execution_plan
+        return execution_plan
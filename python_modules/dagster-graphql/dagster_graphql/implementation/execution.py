@@ -261,8 +261,9 @@ def get_pipeline_run_observable(graphene_info, run_id, after=None):
     if not isinstance(pipeline, DauphinPipeline):
         return Observable.empty()  # pylint: disable=no-member
 
-    execution_plan = create_execution_plan(
-        pipeline.get_dagster_pipeline(), run.environment_dict, RunConfig(mode=run.mode)
+    # Every subscription to the logs of a run decorates its events with the same plan
+    execution_plan = graphene_info.context.get_execution_plan_for_run(
+        run, pipeline.get_dagster_pipeline()
     )
 
     # pylint: disable=E1101
@@ -4,7 +4,9 @@ from dagster import RunConfig, check
 from dagster.core.definitions import create_environment_schema
 from dagster.core.definitions.pipeline import ExecutionSelector, PipelineRunsFilter
 from dagster.core.execution.api import create_execution_plan
-from dagster.core.types.config.evaluator.validate import validate_config
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.event_log import DagsterEventLogInvalidForRun
+from dagster.core.system_config.cache import process_environment_config
 
 from .fetch_pipelines import (
     get_dauphin_pipeline_from_selector_or_raise,
@@ -20,7 +22,9 @@ def get_validated_config(graphene_info, dauphin_pipeline, environment_dict, mode
 
     environment_schema = create_environment_schema(pipeline, mode)
 
-    validated_config = validate_config(environment_schema.environment_type, environment_dict)
+    validated_config = process_environment_config(
+        environment_schema.environment_type, environment_dict
+    )
 
     if not validated_config.success:
         raise UserFacingGraphQLError(
@@ -78,7 +82,46 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     else:
         runs = instance.all_runs(cursor=cursor, limit=limit)
 
-    return [graphene_info.schema.type_named('PipelineRun')(run) for run in runs]
+    return get_dauphin_runs(graphene_info, runs)
+
+
+class RunStatsLoader(object):
+    '''Loads the stats for a list of runs, in the manner of a DataLoader.
+
+    The stats for every run in the list are fetched with a single call to the instance the first
+    time the stats for any one of them are requested, so that resolving the stats for a list of N
+    runs costs one event log query rather than N.
+    '''
+
+    def __init__(self, instance, run_ids):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._run_ids = check.list_param(run_ids, 'run_ids', of_type=str)
+        self._stats = None
+
+    def get_stats(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        if self._stats is None:
+            try:
+                self._stats = self._instance.get_runs_stats(self._run_ids)
+            except DagsterEventLogInvalidForRun:
+                # Fall back to fetching the stats for each run on its own, so that an invalid event
+                # log is reported only for the run it belongs to
+                self._stats = {}
+
+        if run_id in self._stats:
+            return self._stats[run_id]
+
+        return self._instance.get_run_stats(run_id)
+
+
+def get_dauphin_runs(graphene_info, runs):
+    '''Build the PipelineRun for each of a list of runs, sharing a RunStatsLoader between them.'''
+    stats_loader = RunStatsLoader(graphene_info.context.instance, [run.run_id for run in runs])
+    return [
+        graphene_info.schema.type_named('PipelineRun')(run, stats_loader=stats_loader)
+        for run in runs
+    ]
 
 
 @capture_dauphin_error
@@ -109,6 +152,11 @@ def get_execution_plan(graphene_info, selector, environment_dict, mode):
 
 
 @capture_dauphin_error
-def get_stats(graphene_info, run_id):
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+def get_stats(graphene_info, run_id, stats_loader=None):
+    check.opt_inst_param(stats_loader, 'stats_loader', RunStatsLoader)
+
+    if stats_loader is not None:
+        stats = stats_loader.get_stats(run_id)
+    else:
+        stats = graphene_info.context.instance.get_run_stats(run_id)
     return graphene_info.schema.type_named('PipelineRunStatsSnapshot')(stats)
@@ -15,5 +15,11 @@ class PipelineRunObservableSubscribe(object):
         cursor = len(events) + int(self.after_cursor)
         self.instance.watch_event_logs(self.run_id, cursor, self.handle_new_event)
 
+        # Stop watching the run's logs once the subscription is disposed of
+        return self.dispose
+
+    def dispose(self):
+        self.instance.end_watch_event_logs(self.run_id, self.handle_new_event)
+
     def handle_new_event(self, new_event):
         self.observer.on_next([new_event])
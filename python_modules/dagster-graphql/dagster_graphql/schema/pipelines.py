@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 from dagster_graphql import dauphin
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
 
 from dagster import (
     LoggerDefinition,
@@ -75,10 +76,10 @@ class DauphinPipeline(dauphin.ObjectType):
         )
 
     def resolve_runs(self, graphene_info):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs_with_pipeline_name(self._pipeline.name)
-        ]
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs_with_pipeline_name(self._pipeline.name),
+        )
 
     def get_dagster_pipeline(self):
         return self._pipeline
@@ -5,7 +5,7 @@ import logging
 import yaml
 from dagster_graphql import dauphin
 from dagster_graphql.implementation.fetch_pipelines import get_pipeline_reference_or_raise
-from dagster_graphql.implementation.fetch_runs import get_stats
+from dagster_graphql.implementation.fetch_runs import RunStatsLoader, get_stats
 
 from dagster import RunConfig, check, seven
 from dagster.core.definitions.events import (
@@ -78,7 +78,15 @@ class DauphinPipelineRun(dauphin.ObjectType):
     status = dauphin.NonNull('PipelineRunStatus')
     pipeline = dauphin.NonNull('PipelineReference')
     stats = dauphin.NonNull('PipelineRunStatsOrError')
-    logs = dauphin.NonNull('LogMessageConnection')
+    logs = dauphin.Field(
+        dauphin.NonNull('LogMessageConnection'),
+        cursor=dauphin.Argument('Cursor'),
+        limit=dauphin.Argument(dauphin.Int),
+        description='''
+        The events logged by the run. If a cursor is given, only the events after it are returned,
+        and if a limit is given, at most that many events are returned
+        ''',
+    )
     computeLogs = dauphin.Field(
         dauphin.NonNull('ComputeLogs'),
         stepKey=dauphin.Argument(dauphin.NonNull(dauphin.String)),
@@ -93,20 +101,23 @@ class DauphinPipelineRun(dauphin.ObjectType):
     tags = dauphin.non_null_list('PipelineTag')
     canCancel = dauphin.NonNull(dauphin.Boolean)
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, stats_loader=None):
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._stats_loader = check.opt_inst_param(stats_loader, 'stats_loader', RunStatsLoader)
 
     def resolve_pipeline(self, graphene_info):
         return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
 
-    def resolve_logs(self, graphene_info):
-        return graphene_info.schema.type_named('LogMessageConnection')(self._pipeline_run)
+    def resolve_logs(self, graphene_info, cursor=None, limit=None):
+        return graphene_info.schema.type_named('LogMessageConnection')(
+            self._pipeline_run, cursor=cursor, limit=limit
+        )
 
     def resolve_stats(self, graphene_info):
-        return get_stats(graphene_info, self.run_id)
+        return get_stats(graphene_info, self.run_id, self._stats_loader)
 
     def resolve_computeLogs(self, graphene_info, stepKey):
         return graphene_info.schema.type_named('ComputeLogs')(runId=self.run_id, stepKey=stepKey)
@@ -239,8 +250,21 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
     nodes = dauphin.non_null_list('PipelineRunEvent')
     pageInfo = dauphin.NonNull('PageInfo')
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, cursor=None, limit=None):
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._cursor = check.opt_int_param(cursor, 'cursor')
+        self._limit = check.opt_int_param(limit, 'limit')
+        self._logs = None
+
+    def _get_logs(self, graphene_info):
+        # Both nodes and pageInfo need the logs, which are fetched at most once per request
+        if self._logs is None:
+            self._logs = graphene_info.context.instance.logs_after(
+                self._pipeline_run.run_id,
+                self._cursor if self._cursor is not None else -1,
+                limit=self._limit,
+            )
+        return self._logs
 
     def resolve_nodes(self, graphene_info):
         pipeline = get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
@@ -257,20 +281,24 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
 
         return [
             from_event_record(graphene_info, log, pipeline, execution_plan)
-            for log in graphene_info.context.instance.all_logs(self._pipeline_run.run_id)
+            for log in self._get_logs(graphene_info)
         ]
 
     def resolve_pageInfo(self, graphene_info):
-        count = len(graphene_info.context.instance.all_logs(self._pipeline_run.run_id))
-        lastCursor = None
-        if count > 0:
-            lastCursor = str(count - 1)
+        cursor = self._cursor if self._cursor is not None else -1
+        count = len(self._get_logs(graphene_info))
+        if self._cursor is None and self._limit is None:
+            total_count = count
+        else:
+            total_count = graphene_info.context.instance.get_event_count(self._pipeline_run.run_id)
+
+        last_cursor = cursor + count
         return graphene_info.schema.type_named('PageInfo')(
-            lastCursor=lastCursor,
-            hasNextPage=None,
-            hasPreviousPage=None,
+            lastCursor=last_cursor if last_cursor >= 0 else None,
+            hasNextPage=last_cursor + 1 < total_count,
+            hasPreviousPage=cursor >= 0,
             count=count,
-            totalCount=count,
+            totalCount=total_count,
         )
 
 
@@ -4,6 +4,7 @@ import os
 
 import yaml
 from dagster_graphql import dauphin
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
 from dagster_graphql.implementation.fetch_schedules import (
     get_dagster_schedule_def,
     get_schedule_attempt_filenames,
@@ -174,12 +175,12 @@ class DauphinRunningSchedule(dauphin.ObjectType):
         return scheduler.log_path_for_schedule(self._schedule.name)
 
     def resolve_runs(self, graphene_info, **kwargs):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs_with_matching_tags(
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs_with_matching_tags(
                 [("dagster/schedule_id", self._schedule.schedule_id)], limit=kwargs.get('limit')
-            )
-        ]
+            ),
+        )
 
     def resolve_runs_count(self, graphene_info):
         return graphene_info.context.instance.get_run_count_with_matching_tags(
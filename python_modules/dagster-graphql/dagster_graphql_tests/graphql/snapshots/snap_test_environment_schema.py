@@ -25,7 +25,7 @@ snapshots['test_basic_invalid_config_on_environment_schema 1'] = {
                 {
                     '__typename': 'FieldNotDefinedConfigError',
                     'fieldName': 'nope',
-                    'message': 'Field "nope" is not defined at document config root. Expected: "{ execution?: { in_process?: { } multiprocess?: { config?: { max_concurrent?: Int } } } loggers?: { console?: { config?: { log_level?: String name?: String } } } resources?: { } solids: { sum_solid: { inputs: { num: Path } outputs?: [{ result?: Path }] } sum_sq_solid?: { outputs?: [{ result?: Path }] } } storage?: { filesystem?: { config?: { base_dir?: String } } in_memory?: { } } }"',
+                    'message': 'Field "nope" is not defined at document config root. Expected: "{ execution?: { in_process?: { config?: { gc_intermediates?: Bool } } multiprocess?: { config?: { gc_intermediates?: Bool max_concurrent?: Int reuse_workers?: Bool } } } loggers?: { console?: { config?: { log_level?: String name?: String } } } resources?: { } solids: { sum_solid: { inputs: { num: Path } outputs?: [{ result?: Path }] } sum_sq_solid?: { outputs?: [{ result?: Path }] } } storage?: { filesystem?: { config?: { base_dir?: String content_addressed?: Bool max_concurrent_reads?: Int prefetch_inputs?: Bool } } in_memory?: { } } }"',
                     'reason': 'FIELD_NOT_DEFINED',
                     'stack': {
                         'entries': [
@@ -107,6 +107,12 @@ snapshots['test_successful_enviroment_schema 1'] = {
             {
                 'name': None
             },
+            {
+                'name': None
+            },
+            {
+                'name': None
+            },
             {
                 'name': 'Any'
             },
@@ -60,6 +60,12 @@ snapshots['test_query_multi_mode 1'] = {
             {
                 'name': None
             },
+            {
+                'name': None
+            },
+            {
+                'name': None
+            },
             {
                 'name': 'Any'
             },
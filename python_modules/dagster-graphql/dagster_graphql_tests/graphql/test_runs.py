@@ -1,5 +1,6 @@
 import copy
 
+import mock
 from dagster_graphql.test.utils import execute_dagster_graphql
 
 from dagster.core.instance import DagsterInstance
@@ -58,6 +59,28 @@ mutation DeleteRun($runId: String!) {
 '''
 
 
+RUN_LOGS_QUERY = '''
+query RunLogsQuery($runId: ID!, $cursor: Cursor, $limit: Int) {
+  pipelineRunOrError(runId: $runId) {
+    ... on PipelineRun {
+      logs(cursor: $cursor, limit: $limit) {
+        nodes {
+          __typename
+        }
+        pageInfo {
+          lastCursor
+          hasNextPage
+          hasPreviousPage
+          count
+          totalCount
+        }
+      }
+    }
+  }
+}
+'''
+
+
 def _get_runs_data(result, run_id):
     for run_data in result.data['pipeline']['runs']:
         if run_data['runId'] == run_id:
@@ -136,3 +159,124 @@ def test_get_runs_over_graphql():
         read_context, DELETE_RUN_MUTATION, variables={'runId': run_id_two}
     )
     assert result.data['deletePipelineRun']['__typename'] == 'PipelineRunNotFoundError'
+
+
+def test_get_run_logs_paged_over_graphql():
+    payload = sync_execute_get_run_log_data(
+        {
+            'executionParams': {
+                'selector': {'name': 'multi_mode_with_resources'},
+                'mode': 'add_mode',
+                'environmentConfigData': {'resources': {'op': {'config': 2}}},
+            }
+        }
+    )
+    run_id = payload['run']['runId']
+    all_typenames = [msg['__typename'] for msg in payload['messages']]
+    total_count = len(all_typenames)
+    assert total_count > 3
+
+    read_context = define_context(instance=DagsterInstance.local_temp())
+
+    def _get_logs(**variables):
+        result = execute_dagster_graphql(
+            read_context, RUN_LOGS_QUERY, variables=dict(runId=run_id, **variables)
+        )
+        return result.data['pipelineRunOrError']['logs']
+
+    logs = _get_logs()
+    assert [node['__typename'] for node in logs['nodes']] == all_typenames
+    assert logs['pageInfo'] == {
+        'lastCursor': total_count - 1,
+        'hasNextPage': False,
+        'hasPreviousPage': False,
+        'count': total_count,
+        'totalCount': total_count,
+    }
+
+    logs = _get_logs(limit=2)
+    assert [node['__typename'] for node in logs['nodes']] == all_typenames[:2]
+    assert logs['pageInfo'] == {
+        'lastCursor': 1,
+        'hasNextPage': True,
+        'hasPreviousPage': False,
+        'count': 2,
+        'totalCount': total_count,
+    }
+
+    logs = _get_logs(cursor=logs['pageInfo']['lastCursor'], limit=2)
+    assert [node['__typename'] for node in logs['nodes']] == all_typenames[2:4]
+    assert logs['pageInfo']['lastCursor'] == 3
+    assert logs['pageInfo']['hasPreviousPage']
+
+    logs = _get_logs(cursor=total_count - 2)
+    assert [node['__typename'] for node in logs['nodes']] == all_typenames[-1:]
+    assert logs['pageInfo'] == {
+        'lastCursor': total_count - 1,
+        'hasNextPage': False,
+        'hasPreviousPage': True,
+        'count': 1,
+        'totalCount': total_count,
+    }
+
+
+RUNS_STATS_QUERY = '''
+query PipelineRunsStatsQuery($name: String!) {
+  pipeline(params: { name: $name }) {
+    ... on Pipeline {
+      runs {
+        runId
+        stats {
+          __typename
+          ... on PipelineRunStatsSnapshot {
+            runId
+            stepsSucceeded
+            stepsFailed
+            startTime
+            endTime
+          }
+        }
+      }
+    }
+  }
+}
+'''
+
+
+def test_get_runs_stats_batched_over_graphql():
+    run_ids = [
+        sync_execute_get_run_log_data(
+            {
+                'executionParams': {
+                    'selector': {'name': 'multi_mode_with_resources'},
+                    'mode': 'add_mode',
+                    'environmentConfigData': {'resources': {'op': {'config': config}}},
+                }
+            }
+        )['run']['runId']
+        for config in [2, 3]
+    ]
+
+    instance = DagsterInstance.local_temp()
+    read_context = define_context(instance=instance)
+
+    with mock.patch.object(
+        instance, 'get_runs_stats', wraps=instance.get_runs_stats
+    ) as get_runs_stats, mock.patch.object(
+        instance, 'get_run_stats', wraps=instance.get_run_stats
+    ) as get_run_stats:
+        result = execute_dagster_graphql(
+            read_context, RUNS_STATS_QUERY, variables={'name': 'multi_mode_with_resources'}
+        )
+
+    assert get_runs_stats.call_count == 1
+    assert get_run_stats.call_count == 0
+
+    runs_data = {run_data['runId']: run_data for run_data in result.data['pipeline']['runs']}
+    for run_id in run_ids:
+        stats = runs_data[run_id]['stats']
+        assert stats['__typename'] == 'PipelineRunStatsSnapshot'
+        assert stats['runId'] == run_id
+        assert stats['stepsSucceeded'] == 1
+        assert stats['stepsFailed'] == 0
+        assert stats['startTime'] <= stats['endTime']
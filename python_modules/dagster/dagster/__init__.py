@@ -35,6 +35,7 @@ from dagster.core.definitions import (
     SystemStorageDefinition,
     TextMetadataEntryData,
     TypeCheck,
+    TypeCheckMode,
     UrlMetadataEntryData,
     composite_solid,
     daily_schedule,
@@ -219,6 +220,7 @@ __all__ = [
     'String',
     'SerializationStrategy',
     'Nothing',
+    'TypeCheckMode',
     # type creation
     'as_dagster_type',
     'dagster_type',
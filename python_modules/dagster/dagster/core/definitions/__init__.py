@@ -35,6 +35,7 @@ from .events import (
     PathMetadataEntryData,
     TextMetadataEntryData,
     TypeCheck,
+    TypeCheckMode,
     UrlMetadataEntryData,
 )
 from .executor import (
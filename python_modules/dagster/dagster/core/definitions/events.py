@@ -305,6 +305,23 @@ class TypeCheck(namedtuple('_TypeCheck', 'success description metadata_entries')
         )
 
 
+class TypeCheckMode(Enum):
+    '''How the values of a Dagster type are type checked as they are yielded and received by solids.
+
+    Attributes:
+        FULL: Every value is type checked in full, both as an output and as an input.
+        SAMPLE: Every value is type checked, but only on a sample of it, e.g. of the rows of a
+            dataframe, drawn by the type's ``type_check_sample_fn``. Values of types without a
+            ``type_check_sample_fn`` are type checked in full.
+        ONCE: Values are type checked in full as outputs. Inputs that receive the outputs of steps
+            of the same Dagster type are not type checked again.
+    '''
+
+    FULL = 'FULL'
+    SAMPLE = 'SAMPLE'
+    ONCE = 'ONCE'
+
+
 class Failure(Exception):
     '''Event indicating solid failure.
 
@@ -4,7 +4,7 @@ from dagster import check
 from dagster.core.execution.config import InProcessExecutorConfig, MultiprocessExecutorConfig
 from dagster.core.types.config.field import Field
 from dagster.core.types.config.field_utils import check_user_facing_opt_config_param
-from dagster.core.types.wrapping import Int
+from dagster.core.types.wrapping import Bool, Int
 
 
 class ExecutorDefinition(object):
@@ -110,7 +110,10 @@ class _ExecutorDecoratorCallable(object):
         return executor_def
 
 
-@executor(name='in_process')
+@executor(
+    name='in_process',
+    config={'gc_intermediates': Field(Bool, is_optional=True, default_value=False)},
+)
 def in_process_executor(init_context):
     '''The default in-process executor.
 
@@ -123,16 +126,29 @@ def in_process_executor(init_context):
         execution:
           in_process:
 
+    If ``gc_intermediates`` is set, each intermediate value is removed from system storage as
+    soon as every step that consumes it has succeeded, rather than being kept until the end of the
+    run. Values that are not consumed by any other step in the run are always kept. Note that
+    collected intermediates are not available to inspect after the run, or to re-execute steps
+    from.
+
     '''
     from dagster.core.engine.init import InitExecutorContext
 
     check.inst_param(init_context, 'init_context', InitExecutorContext)
 
-    return InProcessExecutorConfig()
+    return InProcessExecutorConfig(
+        gc_intermediates=init_context.executor_config['gc_intermediates']
+    )
 
 
 @executor(
-    name='multiprocess', config={'max_concurrent': Field(Int, is_optional=True, default_value=0)}
+    name='multiprocess',
+    config={
+        'max_concurrent': Field(Int, is_optional=True, default_value=0),
+        'reuse_workers': Field(Bool, is_optional=True, default_value=False),
+        'gc_intermediates': Field(Bool, is_optional=True, default_value=False),
+    },
 )
 def multiprocess_executor(init_context):
     '''The default multiprocess executor.
@@ -151,6 +167,20 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    If ``reuse_workers`` is set, steps are executed by a pool of long-lived worker processes
+    rather than a new process per step. Each worker loads the pipeline, execution plan and instance
+    once and reuses them for every step it executes, which can substantially reduce overhead for
+    pipelines with many short steps.
+
+    ``gc_intermediates`` behaves as for the :py:func:`in_process_executor`: each intermediate value
+    is removed from system storage once every step that consumes it has succeeded.
+
+    Each step is launched as soon as all of the steps it depends on have completed. When more steps
+    are ready than there are free processes, steps whose ``dagster/priority`` metadata is higher are
+    launched first. This metadata must be an integer, and is only read by this executor: the Celery
+    and Dask executors prioritize steps by their ``dagster-celery/priority`` and
+    ``dagster-dask/priority`` metadata.
+
     '''
     from dagster.core.definitions.handle import ExecutionTargetHandle
     from dagster.core.engine.init import InitExecutorContext
@@ -159,7 +189,10 @@ def multiprocess_executor(init_context):
 
     handle, _ = ExecutionTargetHandle.get_handle(init_context.pipeline_def)
     return MultiprocessExecutorConfig(
-        handle=handle, max_concurrent=init_context.executor_config['max_concurrent']
+        handle=handle,
+        max_concurrent=init_context.executor_config['max_concurrent'],
+        reuse_workers=init_context.executor_config['reuse_workers'],
+        gc_intermediates=init_context.executor_config['gc_intermediates'],
     )
 
 
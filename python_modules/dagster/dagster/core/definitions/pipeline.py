@@ -3,6 +3,7 @@ from collections import namedtuple
 from dagster import check
 from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster.core.serdes import whitelist_for_serdes
+from dagster.core.system_config.cache import BoundedCache
 from dagster.core.types.runtime.runtime_type import construct_runtime_type_dictionary
 
 from .container import IContainSolids, create_execution_structure, validate_dependency_dict
@@ -196,6 +197,7 @@ class PipelineDefinition(IContainSolids, object):
         self._selector = ExecutionSelector(self.name, list(solid_dict.keys()))
 
         self._cached_enviroment_schemas = {}
+        self._cached_sub_pipelines = BoundedCache()
 
     def get_environment_schema(self, mode=None):
         check.str_param(mode, 'mode')
@@ -381,7 +383,16 @@ class PipelineDefinition(IContainSolids, object):
         return name in self._all_solid_defs
 
     def build_sub_pipeline(self, solid_subset):
-        return self if solid_subset is None else _build_sub_pipeline(self, solid_subset)
+        if solid_subset is None:
+            return self
+
+        # Sub pipelines are cached so that, like their parents, they are built once along with
+        # their environment schemas, and so that the config processed for them is cached. Only the
+        # most recently used subsets are kept, whatever the order in which their solids are named
+        check.list_param(solid_subset, 'solid_subset', of_type=str)
+        return self._cached_sub_pipelines.get_or_compute(
+            frozenset(solid_subset), lambda: _build_sub_pipeline(self, solid_subset)
+        )
 
     def get_presets(self):
         return list(self._preset_dict.values())
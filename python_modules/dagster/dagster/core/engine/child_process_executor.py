@@ -1,17 +1,25 @@
 '''Facilities for running arbitrary commands in child processes.'''
 
-import multiprocessing
 import os
+import pickle
 import sys
+import time
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 
 import six
 
 from dagster import check
-from dagster.utils import get_multiprocessing_context
+from dagster.seven import pickle5
+from dagster.utils import get_multiprocessing_context, start_termination_thread
 from dagster.utils.error import serializable_error_info_from_exc_info
 
+try:
+    from multiprocessing.connection import wait as wait_for_connections
+except ImportError:
+    # Not available on Python 2
+    wait_for_connections = None
+
 
 class ChildProcessEvent(object):
     pass
@@ -31,6 +39,49 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class PickledWithBuffers(namedtuple('_PickledWithBuffers', 'data buffer_sizes')):
+    '''Sent ahead of the buffers that were pickled out-of-band from an object.'''
+
+
+def _send(conn, obj):
+    '''Send obj over conn.
+
+    Where pickle protocol 5 is available, buffers that support it, e.g. the data of large NumPy
+    arrays, are pickled out-of-band: rather than being copied into the pickle stream, each buffer
+    is written to the pipe straight from memory, after the stream.'''
+    if pickle5 is None:
+        conn.send(obj)
+        return
+
+    buffers = []
+    data = pickle5.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    if not buffers and pickle.HIGHEST_PROTOCOL >= 5:
+        # Most events hold no large buffers, and the stream is then loaded by conn.recv as is
+        conn.send_bytes(data)
+        return
+
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    conn.send(PickledWithBuffers(data, [raw_buffer.nbytes for raw_buffer in raw_buffers]))
+    for raw_buffer in raw_buffers:
+        conn.send_bytes(raw_buffer)
+
+
+def _recv(conn):
+    '''Receive an object sent over conn by _send.'''
+    message = conn.recv()
+    if not isinstance(message, PickledWithBuffers):
+        return message
+
+    buffers = []
+    for buffer_size in message.buffer_sizes:
+        # Buffers are received into writable memory, so that e.g. NumPy arrays stay writable
+        buffer = bytearray(buffer_size)
+        conn.recv_bytes_into(buffer)
+        buffers.append(buffer)
+
+    return pickle5.loads(message.data, buffers=buffers)
+
+
 class ChildProcessCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     '''Inherit from this class in order to use this library.
 
@@ -47,62 +98,131 @@ class ChildProcessCrashException(Exception):
     '''Thrown when the child process crashes.'''
 
 
-def _execute_command_in_child_process(queue, command):
-    '''Wraps the execution of a ChildProcessCommand.
-
-    Handles errors and communicates across a queue with the parent process.'''
-
+def _run_command_in_child_process(conn, command):
     check.inst_param(command, 'command', ChildProcessCommand)
 
     pid = os.getpid()
-    queue.put(ChildProcessStartEvent(pid=pid))
+    _send(conn, ChildProcessStartEvent(pid=pid))
     try:
         for step_event in command.execute():
-            queue.put(step_event)
-        queue.put(ChildProcessDoneEvent(pid=pid))
+            _send(conn, step_event)
+        _send(conn, ChildProcessDoneEvent(pid=pid))
     except (Exception, KeyboardInterrupt):  # pylint: disable=broad-except
-        queue.put(
+        _send(
+            conn,
             ChildProcessSystemErrorEvent(
                 pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
-            )
+            ),
         )
+
+
+def _execute_command_in_child_process(conn, command):
+    '''Wraps the execution of a ChildProcessCommand.
+
+    Handles errors and communicates across a pipe with the parent process.'''
+
+    try:
+        _run_command_in_child_process(conn, command)
     finally:
-        queue.close()
+        conn.close()
+
+
+def _execute_commands_in_child_process(command_queue, conn, term_event):
+    '''Executes the ChildProcessCommands received over command_queue one at a time, until a None
+    is received.
+
+    Each command is wrapped exactly as in _execute_command_in_child_process, so that the parent
+    process sees the same sequence of events for every command.'''
+
+    if term_event is not None:
+        start_termination_thread(term_event)
+
+    try:
+        while True:
+            command = command_queue.get()
+            if command is None:
+                break
+            _run_command_in_child_process(conn, command)
+    finally:
+        conn.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
-'''The minimum interval at which to check for child process liveness -- default 20ms.'''
+'''The interval at which to check for child process events and liveness when
+multiprocessing.connection.wait is not available (Python 2) -- default 20ms.'''
 
 PROCESS_DEAD_AND_QUEUE_EMPTY = 'PROCESS_DEAD_AND_QUEUE_EMPTY'
 '''Sentinel value.'''
 
 
-def _poll_for_event(process, queue):
+class ChildProcessEventSelector(object):
+    '''Multiplexes the event channels of any number of child processes.
+
+    Rather than polling each child process in turn, the parent process can block in wait() until
+    at least one of the registered child processes has sent an event or died.'''
+
+    def __init__(self):
+        self._processes_by_conn = {}
+
+    def register(self, process, conn):
+        self._processes_by_conn[conn] = process
+
+    def unregister(self, conn):
+        self._processes_by_conn.pop(conn, None)
+
+    def wait(self, timeout=None):
+        '''Block until any registered child process has an event available or has died, or until
+        timeout seconds have elapsed.'''
+        if not self._processes_by_conn:
+            return
+
+        if wait_for_connections is not None:
+            wait_for_connections(
+                list(self._processes_by_conn.keys())
+                + [process.sentinel for process in self._processes_by_conn.values()],
+                timeout,
+            )
+            return
+
+        start = time.time()
+        while timeout is None or time.time() - start < timeout:
+            for conn, process in self._processes_by_conn.items():
+                if conn.poll() or not process.is_alive():
+                    return
+            time.sleep(TICK)
+
+
+def _recv_event(conn):
     try:
-        return queue.get(block=True, timeout=TICK)
-    except KeyboardInterrupt as e:
-        return e
-    except multiprocessing.queues.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return queue.get(block=False)
-            except multiprocessing.queues.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+        return _recv(conn)
+    except EOFError:
+        # The child process has closed its end of the pipe
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
+
+
+def _poll_for_event(process, conn):
+    if conn.poll():
+        return _recv_event(conn)
+
+    if not process.is_alive():
+        # There is a possibility that after the last poll the process sent another event and
+        # then died. In that case we want to continue draining the pipe.
+        if conn.poll():
+            return _recv_event(conn)
+
+        # If the pipe is empty we know that there are no more events and that the process has
+        # died.
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
 
     return None
 
 
-def execute_child_process_command(command):
+def execute_child_process_command(command, selector=None):
     '''Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; reads the events yielded by the child process from a pipe
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -111,7 +231,7 @@ def execute_child_process_command(command):
         * ChildProcessEvent - Family of objects that communicates state changes in the child process
 
         * KeyboardInterrupt - Yielded in the case that an interrupt was recieved while
-            polling the child process. Yielded instead of raised to allow forwarding of the
+            waiting on the child process. Yielded instead of raised to allow forwarding of the
             interrupt to the child and completion of the iterator for this child and
             any others that may be executing
 
@@ -119,37 +239,122 @@ def execute_child_process_command(command):
 
     Args:
         command (ChildProcessCommand): The command to execute in the child process.
+        selector (Optional[ChildProcessEventSelector]): If provided, the child process is
+            registered with the selector and this function never blocks: it yields None whenever
+            no event is available, and the caller is responsible for waiting on the selector. If
+            not provided, this function blocks until the child process sends an event or dies.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     '''
 
     check.inst_param(command, 'command', ChildProcessCommand)
+    check.opt_inst_param(selector, 'selector', ChildProcessEventSelector)
 
     multiprocessing_context = get_multiprocessing_context()
-    queue = multiprocessing_context.Queue()
+    parent_conn, child_conn = multiprocessing_context.Pipe(duplex=False)
 
     process = multiprocessing_context.Process(
-        target=_execute_command_in_child_process, args=(queue, command)
+        target=_execute_command_in_child_process, args=(child_conn, command)
     )
 
     process.start()
+    child_conn.close()
+
+    try:
+        for event in _poll_for_command_events(process, parent_conn, selector):
+            yield event
+    finally:
+        parent_conn.close()
 
-    completed_properly = False
+    process.join()
+
+
+def _poll_for_command_events(process, conn, selector):
+    should_wait = selector is None
+    if should_wait:
+        selector = ChildProcessEventSelector()
+
+    selector.register(process, conn)
+    try:
+        completed_properly = False
+
+        while not completed_properly:
+            event = _poll_for_event(process, conn)
 
-    while not completed_properly:
-        event = _poll_for_event(process, queue)
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
 
-        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-            break
+            if event is None and should_wait:
+                try:
+                    selector.wait()
+                except KeyboardInterrupt as e:
+                    event = e
 
-        yield event
+            yield event
 
-        if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
-            completed_properly = True
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+    finally:
+        selector.unregister(conn)
 
     if not completed_properly:
         # TODO Gather up stderr and the process exit code
         raise ChildProcessCrashException()
 
-    process.join()
+
+class ChildProcessWorker(object):
+    '''A long-lived child process that executes ChildProcessCommands one at a time.
+
+    Unlike execute_child_process_command, which starts a new process for every command, a worker
+    amortizes process startup and any state the commands cache at module level across all of the
+    commands it executes. Commands are sent to the worker over a queue and so, unlike with
+    execute_child_process_command, must not hold multiprocessing synchronization primitives.
+
+    Args:
+        term_event (Optional[multiprocessing.Event]): If set, the worker process is interrupted
+            when this event is set.
+    '''
+
+    def __init__(self, term_event=None):
+        multiprocessing_context = get_multiprocessing_context()
+        self.term_event = term_event
+        self._command_queue = multiprocessing_context.Queue()
+        self._conn, child_conn = multiprocessing_context.Pipe(duplex=False)
+        self._process = multiprocessing_context.Process(
+            target=_execute_commands_in_child_process,
+            args=(self._command_queue, child_conn, term_event),
+        )
+        self._process.start()
+        child_conn.close()
+
+    def execute(self, command, selector=None):
+        '''Execute a ChildProcessCommand in the worker process.
+
+        Yields the same objects, and accepts the same selector, as execute_child_process_command.
+        '''
+        check.inst_param(command, 'command', ChildProcessCommand)
+        check.opt_inst_param(selector, 'selector', ChildProcessEventSelector)
+
+        self._command_queue.put(command)
+
+        for event in _poll_for_command_events(self._process, self._conn, selector):
+            yield event
+
+    def is_alive(self):
+        return self._process.is_alive()
+
+    def shutdown(self):
+        '''Ask the worker to exit once it has finished any command it is executing.'''
+        if self._process.is_alive():
+            self._command_queue.put(None)
+        self._process.join()
+        self._command_queue.close()
+        self._conn.close()
+
+    def terminate(self):
+        '''Kill the worker without waiting for any command it is executing.'''
+        self._process.terminate()
+        self._process.join()
+        self._command_queue.close()
+        self._conn.close()
@@ -0,0 +1,142 @@
+'''Prioritizing the steps of an execution plan by the critical path through them.
+
+A step's critical path length is the time it takes to execute the step and, after it, the longest
+chain of steps that depend on it. Engines that launch steps with the longest critical paths first
+keep the slowest chains of steps moving, and so finish runs sooner, when there are more ready steps
+than workers to execute them.
+'''
+
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.instance import DagsterInstance
+
+HISTORY_RUN_LIMIT = 5
+'''The number of the most recent runs of a pipeline from which step durations are estimated.'''
+
+DEFAULT_STEP_DURATION = 1.0
+'''The duration, in seconds, assumed for every step when no step has a recorded duration.'''
+
+
+def historical_step_durations(instance, pipeline_name, run_limit=HISTORY_RUN_LIMIT):
+    '''The mean duration of each step that succeeded in the most recent runs of a pipeline.
+
+    Only the step success events of the runs are read from the event log.
+
+    Args:
+        instance (DagsterInstance): The instance whose event logs record the runs.
+        pipeline_name (str): The name of the pipeline.
+        run_limit (Optional[int]): The number of the most recent runs of the pipeline to read.
+
+    Returns:
+        Dict[str, float]: The mean duration in seconds of each step, by step key.
+    '''
+    check.inst_param(instance, 'instance', DagsterInstance)
+    check.str_param(pipeline_name, 'pipeline_name')
+    check.int_param(run_limit, 'run_limit')
+
+    run_ids = [
+        run.run_id for run in instance.get_runs_with_pipeline_name(pipeline_name, limit=run_limit)
+    ]
+
+    durations = defaultdict(list)
+    for records in instance.get_events_for_runs(run_ids, [DagsterEventType.STEP_SUCCESS]).values():
+        for record in records:
+            durations[record.dagster_event.step_key].append(
+                record.dagster_event.event_specific_data.duration_ms / 1000.0
+            )
+
+    return {
+        step_key: sum(step_durations) / len(step_durations)
+        for step_key, step_durations in durations.items()
+    }
+
+
+def expected_step_durations(instance, pipeline_name, execution_plan, priority_key):
+    '''The expected duration of the steps to execute in a plan, from which to compute their
+    priorities, unless every one of them sets its priority explicitly.
+
+    Args:
+        instance (DagsterInstance): The instance whose event logs record the runs of the pipeline.
+        pipeline_name (str): The name of the pipeline.
+        execution_plan (ExecutionPlan): The plan.
+        priority_key (str): The step metadata key with which steps set their priority.
+
+    Returns:
+        Dict[str, float]: The mean duration in seconds of each step in recent runs, by step key,
+            or an empty dict if no step needs a computed priority.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.str_param(priority_key, 'priority_key')
+
+    if all(
+        priority_key in execution_plan.get_step_by_key(step_key).metadata
+        for step_key in execution_plan.step_keys_to_execute
+    ):
+        return {}
+
+    return historical_step_durations(instance, pipeline_name)
+
+
+def critical_path_lengths(execution_plan, step_durations=None):
+    '''The critical path length of each step to execute in a plan.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan.
+        step_durations (Optional[Dict[str, float]]): The expected duration of steps, by step key.
+            Steps without an expected duration are assumed to take the mean of the durations that
+            are given, or DEFAULT_STEP_DURATION if none are.
+
+    Returns:
+        Dict[str, float]: The critical path length of each step to execute, by step key.
+    '''
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    step_durations = check.opt_dict_param(step_durations, 'step_durations', key_type=str)
+
+    default_duration = (
+        float(sum(step_durations.values())) / len(step_durations)
+        if step_durations
+        else DEFAULT_STEP_DURATION
+    )
+
+    lengths = {}
+    # Every step's dependents come after it in topological order
+    for step in reversed(execution_plan.topological_steps()):
+        if step.key not in execution_plan.step_key_set:
+            continue
+
+        longest_downstream = max(
+            [lengths[step_key] for step_key in execution_plan.execution_dependents(step.key)]
+            or [0.0]
+        )
+        lengths[step.key] = step_durations.get(step.key, default_duration) + longest_downstream
+
+    return lengths
+
+
+def critical_path_priorities(path_lengths, min_priority, max_priority):
+    '''Scale critical path lengths to priorities, so that the step with the longest critical path
+    has max_priority.
+
+    Args:
+        path_lengths (Dict[str, float]): The critical path length of steps, by step key.
+        min_priority (Union[int, float]): The priority of a step with a critical path length of 0.
+        max_priority (Union[int, float]): The priority of the step with the longest critical path.
+
+    Returns:
+        Dict[str, float]: The priority of each step, by step key.
+    '''
+    check.dict_param(path_lengths, 'path_lengths', key_type=str)
+    check.numeric_param(min_priority, 'min_priority')
+    check.numeric_param(max_priority, 'max_priority')
+
+    longest = max(list(path_lengths.values()) or [0.0])
+    if longest <= 0:
+        return {step_key: max_priority for step_key in path_lengths}
+
+    return {
+        step_key: min_priority + (max_priority - min_priority) * length / longest
+        for step_key, length in path_lengths.items()
+    }
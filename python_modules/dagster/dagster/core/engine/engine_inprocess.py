@@ -2,7 +2,15 @@ import os
 import sys
 
 from dagster import check
-from dagster.core.definitions import ExpectationResult, Failure, Materialization, Output, TypeCheck
+from dagster.core.definitions import (
+    EventMetadataEntry,
+    ExpectationResult,
+    Failure,
+    Materialization,
+    Output,
+    TypeCheck,
+    TypeCheckMode,
+)
 from dagster.core.errors import (
     DagsterError,
     DagsterExecutionStepExecutionError,
@@ -12,13 +20,21 @@ from dagster.core.errors import (
     DagsterUserCodeExecutionError,
     user_code_error_boundary,
 )
-from dagster.core.events import DagsterEvent, EngineEventData
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster.core.execution.compute_logs import mirror_step_io
 from dagster.core.execution.config import ExecutorConfig
 from dagster.core.execution.context.system import (
     SystemPipelineExecutionContext,
     SystemStepExecutionContext,
 )
+from dagster.core.execution.intermediates_gc import (
+    IntermediatesRefCounter,
+    collect_intermediates,
+)
+from dagster.core.execution.intermediates_loader import (
+    IntermediatesLoader,
+    intermediate_sources_for_step,
+)
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
 from dagster.core.execution.plan.objects import (
     StepFailureData,
@@ -30,12 +46,15 @@ from dagster.core.execution.plan.objects import (
     UserFailureData,
 )
 from dagster.core.execution.plan.plan import ExecutionPlan
-from dagster.core.storage.object_store import ObjectStoreOperation
+from dagster.core.storage.object_store import ObjectStoreOperation, ObjectStoreOperationType
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
 
 from .engine_base import Engine
 
+DAGSTER_TYPE_CHECK_MODE_TAG = 'dagster/type_check_mode'
+'''The step metadata key with which a solid overrides the TypeCheckMode of its inputs and outputs.'''
+
 
 class InProcessEngine(Engine):  # pylint: disable=no-init
     @staticmethod
@@ -68,60 +87,110 @@ class InProcessEngine(Engine):  # pylint: disable=no-init
 
             failed_or_skipped_steps = set()
 
-            # It would be good to implement a reference tracking algorithm here to
-            # garbage collect results that are no longer needed by any steps
-            # https://github.com/dagster-io/dagster/issues/811
-            for step_level in step_levels:
-                for step in step_level:
-                    step_context = pipeline_context.for_step(step)
-
-                    with mirror_step_io(step_context):
-                        # capture all of the logs for this step
-
-                        failed_inputs = []
-                        for step_input in step.step_inputs:
-                            failed_inputs.extend(
-                                failed_or_skipped_steps.intersection(step_input.dependency_keys)
-                            )
-
-                        if failed_inputs:
-                            step_context.log.info(
-                                (
-                                    'Dependencies for step {step} failed: {failed_inputs}. Not executing.'
-                                ).format(step=step.key, failed_inputs=failed_inputs)
-                            )
-                            failed_or_skipped_steps.add(step.key)
-                            yield DagsterEvent.step_skipped_event(step_context)
-                            continue
+            ref_counter = (
+                IntermediatesRefCounter(execution_plan)
+                if pipeline_context.executor_config.gc_intermediates
+                else None
+            )
 
-                        uncovered_inputs = pipeline_context.intermediates_manager.uncovered_inputs(
-                            step_context, step
-                        )
-                        if uncovered_inputs:
-                            # In partial pipeline execution, we may end up here without having validated the
-                            # missing dependent outputs were optional
-                            _assert_missing_inputs_optional(
-                                uncovered_inputs, execution_plan, step.key
-                            )
+            # The step that follows each step, whose inputs may be prefetched while it executes
+            steps = [step for step_level in step_levels for step in step_level]
+            next_steps = {step.key: next_step for step, next_step in zip(steps, steps[1:])}
+            stored_handles = set()
+
+            with IntermediatesLoader(
+                pipeline_context.intermediates_manager
+            ) as intermediates_loader:
+                for step_level in step_levels:
+                    for step in step_level:
+                        step_context = pipeline_context.for_step(step)
+
+                        with mirror_step_io(step_context):
+                            # capture all of the logs for this step
+
+                            failed_inputs = []
+                            for step_input in step.step_inputs:
+                                failed_inputs.extend(
+                                    failed_or_skipped_steps.intersection(step_input.dependency_keys)
+                                )
+
+                            if failed_inputs:
+                                step_context.log.info(
+                                    (
+                                        'Dependencies for step {step} failed: {failed_inputs}. Not executing.'
+                                    ).format(step=step.key, failed_inputs=failed_inputs)
+                                )
+                                failed_or_skipped_steps.add(step.key)
+                                yield DagsterEvent.step_skipped_event(step_context)
+                                continue
 
-                            step_context.log.info(
-                                (
-                                    'Not all inputs covered for {step}. Not executing. Output missing for '
-                                    'inputs: {uncovered_inputs}'
-                                ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                            uncovered_inputs = pipeline_context.intermediates_manager.uncovered_inputs(
+                                step_context, step
                             )
-                            failed_or_skipped_steps.add(step.key)
-                            yield DagsterEvent.step_skipped_event(step_context)
-                            continue
-
-                        for step_event in check.generator(
-                            dagster_event_sequence_for_step(step_context)
-                        ):
-                            check.inst(step_event, DagsterEvent)
-                            if step_event.is_step_failure:
+                            if uncovered_inputs:
+                                # In partial pipeline execution, we may end up here without having validated the
+                                # missing dependent outputs were optional
+                                _assert_missing_inputs_optional(
+                                    uncovered_inputs, execution_plan, step.key
+                                )
+
+                                step_context.log.info(
+                                    (
+                                        'Not all inputs covered for {step}. Not executing. Output missing for '
+                                        'inputs: {uncovered_inputs}'
+                                    ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                                )
                                 failed_or_skipped_steps.add(step.key)
+                                yield DagsterEvent.step_skipped_event(step_context)
+                                continue
 
-                            yield step_event
+                            next_step_context = (
+                                pipeline_context.for_step(next_steps[step.key])
+                                if intermediates_loader.prefetch_inputs and step.key in next_steps
+                                else None
+                            )
+                            if next_step_context:
+                                _prefetch_step_inputs(
+                                    intermediates_loader,
+                                    next_step_context,
+                                    execution_plan,
+                                    stored_handles,
+                                )
+
+                            for step_event in check.generator(
+                                dagster_event_sequence_for_step(
+                                    step_context, intermediates_loader, execution_plan
+                                )
+                            ):
+                                check.inst(step_event, DagsterEvent)
+                                if step_event.is_step_failure:
+                                    failed_or_skipped_steps.add(step.key)
+
+                                yield step_event
+
+                                if intermediates_loader.prefetch_inputs and _is_set_object_event(
+                                    step_event
+                                ):
+                                    stored_handles.add(
+                                        StepOutputHandle(
+                                            step.key, step_event.event_specific_data.value_name
+                                        )
+                                    )
+                                    if next_step_context:
+                                        _prefetch_step_inputs(
+                                            intermediates_loader,
+                                            next_step_context,
+                                            execution_plan,
+                                            stored_handles,
+                                        )
+
+                            if ref_counter and step.key not in failed_or_skipped_steps:
+                                for event in collect_intermediates(
+                                    pipeline_context,
+                                    execution_plan,
+                                    ref_counter.step_succeeded(step.key),
+                                ):
+                                    yield event
 
         yield DagsterEvent.engine_event(
             pipeline_context,
@@ -147,28 +216,48 @@ def _assert_missing_inputs_optional(uncovered_inputs, execution_plan, step_key):
         )
 
 
+def _is_set_object_event(step_event):
+    return (
+        step_event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and ObjectStoreOperationType(step_event.event_specific_data.op)
+        == ObjectStoreOperationType.SET_OBJECT
+    )
+
+
+def _prefetch_step_inputs(intermediates_loader, step_context, execution_plan, stored_handles):
+    # Inputs are prefetched once they are stored by steps in this execution, or immediately if
+    # they were produced by an earlier execution
+    for step_output_handle, runtime_type in intermediate_sources_for_step(step_context.step):
+        if (
+            step_output_handle in stored_handles
+            or step_output_handle.step_key not in execution_plan.step_key_set
+        ):
+            intermediates_loader.prefetch(step_context, step_output_handle, runtime_type)
+
+
 class MultipleStepOutputsListWrapper(list):
     pass
 
 
-def _input_values_from_intermediates_manager(step_context):
+def _input_values_from_intermediates_manager(step_context, intermediates_loader=None):
+    if intermediates_loader is None:
+        with IntermediatesLoader(step_context.intermediates_manager) as intermediates_loader:
+            return _input_values_from_intermediates_manager(step_context, intermediates_loader)
+
     step = step_context.step
 
+    intermediates = intermediates_loader.get_intermediates(
+        step_context, intermediate_sources_for_step(step)
+    )
+
     input_values = {}
     for step_input in step.step_inputs:
         if step_input.runtime_type.is_nothing:
             continue
 
         if step_input.is_from_multiple_outputs:
-            if hasattr(step_input.runtime_type, 'inner_type'):
-                runtime_type = step_input.runtime_type.inner_type
-            else:  # This is the case where the fan-in is typed Any
-                runtime_type = step_input.runtime_type
             _input_value = [
-                step_context.intermediates_manager.get_intermediate(
-                    step_context, runtime_type, source_handle
-                )
-                for source_handle in step_input.source_handles
+                intermediates[source_handle] for source_handle in step_input.source_handles
             ]
             # When we're using an object store-backed intermediate store, we wrap the
             # ObjectStoreOperation[] representing the fan-in values in a MultipleStepOutputsListWrapper
@@ -179,9 +268,7 @@ def _input_values_from_intermediates_manager(step_context):
                 input_value = _input_value
 
         elif step_input.is_from_single_output:
-            input_value = step_context.intermediates_manager.get_intermediate(
-                step_context, step_input.runtime_type, step_input.source_handles[0]
-            )
+            input_value = intermediates[step_input.source_handles[0]]
 
         else:  # is from config
             input_value = step_input.runtime_type.input_hydration_config.construct_from_config_value(
@@ -202,10 +289,15 @@ def _step_failure_event_from_exc_info(step_context, exc_info, user_failure_data=
     )
 
 
-def dagster_event_sequence_for_step(step_context):
+def dagster_event_sequence_for_step(step_context, intermediates_loader=None, execution_plan=None):
     '''
     Yield a sequence of dagster events for the given step with the step context.
 
+    The inputs of the step are loaded with intermediates_loader, which an engine may share across
+    steps in order to prefetch inputs. If it is not provided, a loader is created for the step.
+    The execution_plan the step belongs to, if given, is used to skip the type checks of inputs
+    whose values were already type checked as outputs (see TypeCheckMode.ONCE).
+
     Thie function also processes errors. It handles a few error cases:
 
         (1) The user-space code has raised an Exception. It has been
@@ -236,9 +328,15 @@ def dagster_event_sequence_for_step(step_context):
     '''
 
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.opt_inst_param(intermediates_loader, 'intermediates_loader', IntermediatesLoader)
+    check.opt_inst_param(execution_plan, 'execution_plan', ExecutionPlan)
 
     try:
-        for step_event in check.generator(_core_dagster_event_sequence_for_step(step_context)):
+        for step_event in check.generator(
+            _core_dagster_event_sequence_for_step(
+                step_context, intermediates_loader, execution_plan
+            )
+        ):
             yield step_event
 
     # case (1) in top comment
@@ -333,7 +431,48 @@ def _step_output_error_checked_user_event_sequence(step_context, user_event_sequ
                 )
 
 
-def _do_type_check(runtime_type, value):
+def _type_check_mode(step, runtime_type):
+    mode = step.metadata.get(DAGSTER_TYPE_CHECK_MODE_TAG)
+    if mode is None:
+        return runtime_type.type_check_mode
+
+    try:
+        return TypeCheckMode(mode)
+    except ValueError:
+        raise DagsterInvariantViolationError(
+            'Invalid value {mode} for step metadata key {key} on step {step_key}, expected one of '
+            '{modes}.'.format(
+                mode=repr(mode),
+                key=DAGSTER_TYPE_CHECK_MODE_TAG,
+                step_key=step.key,
+                modes=[member.value for member in TypeCheckMode],
+            )
+        )
+
+
+def _with_type_check_mode(type_check, mode):
+    if mode == TypeCheckMode.FULL:
+        return type_check
+
+    return TypeCheck(
+        success=type_check.success,
+        description=type_check.description,
+        metadata_entries=type_check.metadata_entries
+        + [
+            EventMetadataEntry.text(
+                mode.value, 'type_check_mode', 'How the value was type checked.'
+            )
+        ],
+    )
+
+
+def _do_type_check(runtime_type, value, mode=TypeCheckMode.FULL):
+    if mode == TypeCheckMode.SAMPLE:
+        if runtime_type.type_check_sample_fn is None:
+            mode = TypeCheckMode.FULL
+        else:
+            value = runtime_type.type_check_sample_fn(value)
+
     type_check = runtime_type.type_check(value)
     if not isinstance(type_check, TypeCheck):
         return TypeCheck(
@@ -345,7 +484,40 @@ def _do_type_check(runtime_type, value):
                 type_name=runtime_type.name, return_type=type(type_check), runtime_type=type(value)
             ),
         )
-    return type_check
+    return _with_type_check_mode(type_check, mode)
+
+
+def _source_steps_type_checked(execution_plan, step_input):
+    '''Whether every value an input receives was type checked in full as an output of the same
+    Dagster type, so that it need not be type checked again as the input.'''
+    if execution_plan is None or not step_input.is_from_output:
+        return False
+
+    runtime_type = step_input.runtime_type
+    if step_input.is_from_multiple_outputs:
+        # Fan-in inputs are checked as a list of the values of their inner type
+        if not hasattr(runtime_type, 'inner_type'):
+            return False
+        runtime_type = runtime_type.inner_type
+
+    return all(
+        _output_type_checked_in_full(execution_plan, source_handle, runtime_type)
+        for source_handle in step_input.source_handles
+    )
+
+
+def _output_type_checked_in_full(execution_plan, step_output_handle, runtime_type):
+    source_step = execution_plan.get_step_by_key(step_output_handle.step_key)
+    source_runtime_type = source_step.step_output_named(step_output_handle.output_name).runtime_type
+    if source_runtime_type.key != runtime_type.key:
+        return False
+
+    # The source step may check its outputs in another mode than the one in which the input would
+    # be checked, e.g. only on a sample of the value
+    mode = _type_check_mode(source_step, source_runtime_type)
+    if mode == TypeCheckMode.SAMPLE:
+        return source_runtime_type.type_check_sample_fn is None
+    return mode in (TypeCheckMode.FULL, TypeCheckMode.ONCE)
 
 
 def _create_step_input_event(step_context, input_name, type_check, success):
@@ -379,11 +551,37 @@ def _type_check_from_failure(failure):
     )
 
 
-def _type_checked_event_sequence_for_input(step_context, input_name, input_value):
+def _type_checked_event_sequence_for_input(
+    step_context, input_name, input_value, execution_plan=None
+):
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
     check.str_param(input_name, 'input_name')
+    check.opt_inst_param(execution_plan, 'execution_plan', ExecutionPlan)
 
     step_input = step_context.step.step_input_named(input_name)
+    mode = _type_check_mode(step_context.step, step_input.runtime_type)
+
+    if mode == TypeCheckMode.ONCE and _source_steps_type_checked(execution_plan, step_input):
+        type_check = _with_type_check_mode(
+            TypeCheck(
+                success=True,
+                description='Type checked as the output of {step_keys}.'.format(
+                    step_keys=', '.join(
+                        sorted(
+                            set(
+                                source_handle.step_key
+                                for source_handle in step_input.source_handles
+                            )
+                        )
+                    )
+                ),
+            ),
+            mode,
+        )
+        yield _create_step_input_event(
+            step_context, input_name, type_check=type_check, success=type_check.success
+        )
+        return
     with user_code_error_boundary(
         DagsterTypeCheckError,
         lambda: (
@@ -401,7 +599,7 @@ def _type_checked_event_sequence_for_input(step_context, input_name, input_value
         ),
     ):
         try:
-            type_check = _do_type_check(step_input.runtime_type, input_value)
+            type_check = _do_type_check(step_input.runtime_type, input_value, mode)
         except Exception as exc:  # pylint: disable=broad-except
             type_check = _type_check_from_failure(exc)
 
@@ -459,7 +657,11 @@ def _type_checked_step_output_event_sequence(step_context, output):
         ),
     ):
         try:
-            type_check = _do_type_check(step_output.runtime_type, output.value)
+            type_check = _do_type_check(
+                step_output.runtime_type,
+                output.value,
+                _type_check_mode(step_context.step, step_output.runtime_type),
+            )
         except Exception as exc:  # pylint: disable=broad-except
             type_check = _type_check_from_failure(exc)
         yield _create_step_output_event(
@@ -477,7 +679,9 @@ def _type_checked_step_output_event_sequence(step_context, output):
             )
 
 
-def _core_dagster_event_sequence_for_step(step_context):
+def _core_dagster_event_sequence_for_step(
+    step_context, intermediates_loader=None, execution_plan=None
+):
     '''
     Execute the step within the step_context argument given the in-memory
     events. This function yields a sequence of DagsterEvents, but without
@@ -485,11 +689,15 @@ def _core_dagster_event_sequence_for_step(step_context):
     of the step.
     '''
     check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+    check.opt_inst_param(intermediates_loader, 'intermediates_loader', IntermediatesLoader)
+    check.opt_inst_param(execution_plan, 'execution_plan', ExecutionPlan)
 
     yield DagsterEvent.step_start_event(step_context)
 
     inputs = {}
-    for input_name, input_value in _input_values_from_intermediates_manager(step_context).items():
+    for input_name, input_value in _input_values_from_intermediates_manager(
+        step_context, intermediates_loader
+    ).items():
         if isinstance(input_value, ObjectStoreOperation):
             yield DagsterEvent.object_store_operation(
                 step_context, ObjectStoreOperation.serializable(input_value, value_name=input_name)
@@ -506,7 +714,9 @@ def _core_dagster_event_sequence_for_step(step_context):
 
     for input_name, input_value in inputs.items():
         for evt in check.generator(
-            _type_checked_event_sequence_for_input(step_context, input_name, input_value)
+            _type_checked_event_sequence_for_input(
+                step_context, input_name, input_value, execution_plan
+            )
         ):
             yield evt
 
@@ -1,3 +1,4 @@
+import heapq
 import os
 
 from dagster import check
@@ -6,8 +7,12 @@ from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster.core.execution.config import MultiprocessExecutorConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.intermediates_gc import (
+    IntermediatesRefCounter,
+    collect_intermediates,
+)
 from dagster.core.execution.memoization import copy_required_intermediates_for_execution
-from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.plan import DAGSTER_PRIORITY_TAG, ExecutionPlan
 from dagster.core.instance import DagsterInstance
 from dagster.utils import get_multiprocessing_context, start_termination_thread
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -15,11 +20,15 @@ from dagster.utils.timing import format_duration, time_execution_scope
 from .child_process_executor import (
     ChildProcessCommand,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
     execute_child_process_command,
 )
 from .engine_base import Engine
 
+DEFAULT_PRIORITY = 0
+
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -34,35 +43,98 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
 
     def execute(self):
         check.inst(self.executor_config, MultiprocessExecutorConfig)
-        pipeline_def = self.executor_config.handle.build_pipeline_definition()
         environment_dict = dict(self.environment_dict, execution={'in_process': {}})
 
-        start_termination_thread(self.term_event)
+        if self.term_event is not None:
+            start_termination_thread(self.term_event)
 
-        execution_plan = create_execution_plan(
-            pipeline_def, environment_dict, self.pipeline_run
-        ).build_subset_plan([self.step_key])
+        if self.executor_config.reuse_workers:
+            execution_plan, instance = _get_worker_run_resources(
+                self.executor_config.handle, environment_dict, self.pipeline_run, self.instance_ref
+            )
+        else:
+            pipeline_def = self.executor_config.handle.build_pipeline_definition()
+            execution_plan = create_execution_plan(
+                pipeline_def, environment_dict, self.pipeline_run
+            )
+            instance = DagsterInstance.from_ref(self.instance_ref)
 
         for step_event in execute_plan_iterator(
-            execution_plan,
+            execution_plan.build_subset_plan([self.step_key]),
             self.pipeline_run,
             environment_dict=environment_dict,
-            instance=DagsterInstance.from_ref(self.instance_ref),
+            instance=instance,
         ):
             yield step_event
 
 
-def execute_step_out_of_process(step_context, step, errors, term_events):
+# Only populated in reusable worker processes, where every step the worker executes for a run
+# shares a single pipeline definition, execution plan and instance.
+_worker_run_resources = {}
+
+
+def _get_worker_run_resources(handle, environment_dict, pipeline_run, instance_ref):
+    run_id = pipeline_run.run_id
+    if run_id not in _worker_run_resources:
+        _worker_run_resources.clear()
+        pipeline_def = handle.build_pipeline_definition()
+        _worker_run_resources[run_id] = (
+            create_execution_plan(pipeline_def, environment_dict, pipeline_run),
+            DagsterInstance.from_ref(instance_ref),
+        )
+    return _worker_run_resources[run_id]
+
+
+class ChildProcessWorkerPool(object):
+    '''Hands out idle ChildProcessWorkers, starting new ones only when none are available.'''
+
+    def __init__(self):
+        self._workers = []
+        self._idle_workers = []
+
+    def acquire(self):
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.is_alive():
+                return worker
+
+        worker = ChildProcessWorker(term_event=get_multiprocessing_context().Event())
+        self._workers.append(worker)
+        return worker
+
+    def release(self, worker):
+        check.inst_param(worker, 'worker', ChildProcessWorker)
+        self._idle_workers.append(worker)
+
+    def shutdown(self):
+        for worker in self._workers:
+            if worker in self._idle_workers:
+                worker.shutdown()
+            else:
+                worker.terminate()
+        self._workers = []
+        self._idle_workers = []
+
+
+def execute_step_out_of_process(step_context, step, errors, term_events, selector, worker=None):
     command = InProcessExecutorChildProcessCommand(
         step_context.environment_dict,
         step_context.pipeline_run,
         step_context.executor_config,
         step.key,
         step_context.instance.get_ref(),
-        term_events[step.key],
+        # multiprocessing events can only be shared with a process when it is started, so reused
+        # workers are handed their termination event at startup instead
+        term_events[step.key] if worker is None else None,
     )
 
-    for ret in execute_child_process_command(command):
+    events = (
+        worker.execute(command, selector)
+        if worker
+        else execute_child_process_command(command, selector)
+    )
+
+    for ret in events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -80,51 +152,141 @@ def execute_step_out_of_process(step_context, step, errors, term_events):
             check.failed('Unexpected return value from child process {}'.format(type(ret)))
 
 
-def bounded_parallel_executor(pipeline_context, step_contexts, limit):
-    pending_execution = list(step_contexts)
+def _step_priority(step):
+    # Steps may opt into being scheduled ahead of other ready steps by setting this tag; higher
+    # values are launched first. Ties are broken by step key for determinism. The value has been
+    # checked to be an integer when the plan was built.
+    return int(step.metadata.get(DAGSTER_PRIORITY_TAG, DEFAULT_PRIORITY))
+
+
+def bounded_parallel_executor(pipeline_context, execution_plan, limit):
+    '''Execute the steps of the plan in child processes, at most limit at a time.
+
+    Rather than draining the plan level by level, each step is launched as soon as all of its own
+    upstream steps have completed, so a single slow step only holds back its own dependents. Ready
+    steps are ordered by the value of their ``dagster/priority`` tag.
+    '''
+    intermediates_manager = pipeline_context.intermediates_manager
+
+    remaining_deps = {
+        step_key: len(deps) for step_key, deps in execution_plan.execution_deps().items()
+    }
+
+    ready_heap = []
+
+    def _mark_ready(step_key):
+        step = execution_plan.get_step_by_key(step_key)
+        heapq.heappush(ready_heap, (-_step_priority(step), step_key))
+
+    def _mark_resolved(step_key):
+        for downstream_key in execution_plan.execution_dependents(step_key):
+            remaining_deps[downstream_key] -= 1
+            if remaining_deps[downstream_key] == 0:
+                _mark_ready(downstream_key)
+
+    for step_key in sorted(step_key for step_key, count in remaining_deps.items() if count == 0):
+        _mark_ready(step_key)
+
+    worker_pool = (
+        ChildProcessWorkerPool() if pipeline_context.executor_config.reuse_workers else None
+    )
+    active_workers = {}
+
+    ref_counter = (
+        IntermediatesRefCounter(execution_plan)
+        if pipeline_context.executor_config.gc_intermediates
+        else None
+    )
+    succeeded_steps = set()
+
+    selector = ChildProcessEventSelector()
     active_iters = {}
     errors = {}
     term_events = {}
     stopping = False
 
-    while (not stopping and pending_execution) or active_iters:
-        try:
-            while len(active_iters) < limit and pending_execution and not stopping:
-                step_context = pending_execution.pop(0)
-                step = step_context.step
-                term_events[step.key] = get_multiprocessing_context().Event()
-                active_iters[step.key] = execute_step_out_of_process(
-                    step_context, step, errors, term_events
-                )
+    try:
+        while (not stopping and ready_heap) or active_iters:
+            try:
+                while len(active_iters) < limit and ready_heap and not stopping:
+                    _, step_key = heapq.heappop(ready_heap)
+                    step = execution_plan.get_step_by_key(step_key)
+                    step_context = pipeline_context.for_step(step)
 
-            empty_iters = []
-            for key, step_iter in active_iters.items():
-                try:
-                    event_or_none = next(step_iter)
-                    if event_or_none is None:
+                    if not intermediates_manager.all_inputs_covered(step_context, step):
+                        uncovered_inputs = intermediates_manager.uncovered_inputs(
+                            step_context, step
+                        )
+                        step_context.log.error(
+                            (
+                                'Not all inputs covered for {step}. Not executing.'
+                                'Output missing for inputs: {uncovered_inputs}'
+                            ).format(uncovered_inputs=uncovered_inputs, step=step.key)
+                        )
+                        _mark_resolved(step_key)
                         continue
+
+                    if worker_pool:
+                        worker = worker_pool.acquire()
+                        active_workers[step.key] = worker
+                        term_events[step.key] = worker.term_event
                     else:
-                        yield event_or_none
+                        worker = None
+                        term_events[step.key] = get_multiprocessing_context().Event()
 
-                except StopIteration:
-                    empty_iters.append(key)
+                    active_iters[step.key] = execute_step_out_of_process(
+                        step_context, step, errors, term_events, selector, worker
+                    )
 
-            for key in empty_iters:
-                del active_iters[key]
-                if term_events[key].is_set():
-                    stopping = True
-                del term_events[key]
+                received_event = False
+                empty_iters = []
+                for key, step_iter in active_iters.items():
+                    try:
+                        event_or_none = next(step_iter)
+                        if event_or_none is None:
+                            continue
+                        else:
+                            received_event = True
+                            if event_or_none.is_step_success:
+                                succeeded_steps.add(key)
+                            yield event_or_none
 
-        # In the very small chance that we get interrupted in this coordination section and not
-        # polling the subprocesses for events - try to clean up greacefully
-        except KeyboardInterrupt:
-            yield DagsterEvent.engine_event(
-                pipeline_context,
-                'Multiprocess engine: received KeyboardInterrupt - forwarding to active child processes',
-                EngineEventData.interrupted(list(term_events.keys())),
-            )
-            for event in term_events.values():
-                event.set()
+                    except StopIteration:
+                        empty_iters.append(key)
+
+                # Rather than polling each child process in turn, sleep until any of them has
+                # sent an event or died
+                if not received_event and not empty_iters:
+                    selector.wait()
+
+                for key in empty_iters:
+                    del active_iters[key]
+                    if term_events[key].is_set():
+                        stopping = True
+                    del term_events[key]
+                    if key in active_workers:
+                        worker_pool.release(active_workers.pop(key))
+                    _mark_resolved(key)
+
+                    if ref_counter and key in succeeded_steps:
+                        for event in collect_intermediates(
+                            pipeline_context, execution_plan, ref_counter.step_succeeded(key)
+                        ):
+                            yield event
+
+            # In the very small chance that we get interrupted in this coordination section and not
+            # polling the subprocesses for events - try to clean up greacefully
+            except KeyboardInterrupt:
+                yield DagsterEvent.engine_event(
+                    pipeline_context,
+                    'Multiprocess engine: received KeyboardInterrupt - forwarding to active child processes',
+                    EngineEventData.interrupted(list(term_events.keys())),
+                )
+                for event in term_events.values():
+                    event.set()
+    finally:
+        if worker_pool:
+            worker_pool.shutdown()
 
     errs = {pid: err for pid, err in errors.items() if err}
     if errs:
@@ -147,10 +309,7 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
         check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
         check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
 
-        step_levels = execution_plan.execution_step_levels()
-        step_key_set = set(step.key for step_level in step_levels for step in step_level)
-
-        intermediates_manager = pipeline_context.intermediates_manager
+        step_key_set = set(execution_plan.step_keys_to_execute)
 
         limit = pipeline_context.executor_config.max_concurrent
 
@@ -164,37 +323,14 @@ class MultiprocessEngine(Engine):  # pylint: disable=no-init
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collection results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
         with time_execution_scope() as timer_result:
             for event in copy_required_intermediates_for_execution(
                 pipeline_context, execution_plan
             ):
                 yield event
 
-            for step_level in step_levels:
-                step_contexts_to_execute = []
-                for step in step_level:
-                    step_context = pipeline_context.for_step(step)
-
-                    if not intermediates_manager.all_inputs_covered(step_context, step):
-                        uncovered_inputs = intermediates_manager.uncovered_inputs(
-                            step_context, step
-                        )
-                        step_context.log.error(
-                            (
-                                'Not all inputs covered for {step}. Not executing.'
-                                'Output missing for inputs: {uncovered_inputs}'
-                            ).format(uncovered_inputs=uncovered_inputs, step=step.key)
-                        )
-                        continue
-
-                    step_contexts_to_execute.append(step_context)
-                for step_event in bounded_parallel_executor(
-                    pipeline_context, step_contexts_to_execute, limit
-                ):
-                    yield step_event
+            for step_event in bounded_parallel_executor(pipeline_context, execution_plan, limit):
+                yield step_event
 
         yield DagsterEvent.engine_event(
             pipeline_context,
@@ -562,6 +562,14 @@ class DagsterEvent(
                 key=object_store_operation_result.key,
                 dest_key=object_store_operation_result.dest_key,
             )
+        elif (
+            ObjectStoreOperationType(object_store_operation_result.op)
+            == ObjectStoreOperationType.RM_OBJECT
+        ):
+            message = (
+                'Removed intermediate object for output {value_name} from '
+                '{object_store_name}object store.'
+            ).format(value_name=value_name, object_store_name=object_store_name)
         else:
             message = ''
 
@@ -1,17 +1,19 @@
 from __future__ import print_function
 
+import errno
 import io
 import os
 import signal
 import subprocess
 import sys
+import threading
 import time
 from contextlib import contextmanager
 
 from dagster import check
 from dagster.core.execution.context.system import SystemStepExecutionContext
 from dagster.core.storage.compute_log_manager import ComputeIOType
-from dagster.seven import IS_WINDOWS
+from dagster.seven import IS_WINDOWS, selectors
 from dagster.utils import ensure_file
 
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = '''\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m'''
@@ -33,7 +35,7 @@ def mirror_step_io(step_context):
     )
 
     manager.on_compute_start(step_context)
-    with mirror_io(outpath, errpath):
+    with mirror_io(outpath, errpath, in_process=manager.capture_in_process(step_context)):
         # compute function executed here
         yield
     manager.on_compute_finish(step_context)
@@ -55,10 +57,186 @@ def warn_if_compute_logs_disabled():
 
 
 @contextmanager
-def mirror_io(outpath, errpath, buffering=1):
-    with mirror_stream(outpath, ComputeIOType.STDOUT, buffering):
-        with mirror_stream(errpath, ComputeIOType.STDERR, buffering):
+def mirror_io(outpath, errpath, buffering=1, in_process=False):
+    # Select cannot wait on pipes on Windows, so there the files are always tailed by a subprocess
+    if in_process and not IS_WINDOWS:
+        with tee_io(outpath, errpath, buffering):
             yield
+    else:
+        with mirror_stream(outpath, ComputeIOType.STDOUT, buffering):
+            with mirror_stream(errpath, ComputeIOType.STDERR, buffering):
+                yield
+
+
+TEE_READ_SIZE = 64 * 1024
+'''The maximum number of bytes read from a pipe at once. Together with the capacity of the pipes
+themselves, this bounds the amount of output held in memory.'''
+
+TEE_JOIN_TIMEOUT = 5
+'''The number of seconds to wait for the output that remains in the pipes to be copied. Processes
+started by the compute function that outlive it may hold the pipes open for longer, in which case
+their output continues to be copied in the background.'''
+
+
+@contextmanager
+def tee_io(outpath, errpath, buffering=1):
+    '''Capture the stdout and stderr of the current process, including the output of subprocesses.
+
+    The stdout and stderr file descriptors are redirected into pipes. A single thread reads from
+    both pipes, appending everything it reads to the files at outpath and errpath respectively and
+    copying it to the original stdout and stderr. If reading from the pipes fails, the original
+    stdout and stderr are restored, so that the compute function never blocks on writing output
+    that is no longer read.
+
+    The files are opened in binary mode, which has no line buffering: with the default buffering
+    of 1, as with 0, everything read from a pipe is written to the file at once.
+    '''
+    check.str_param(outpath, 'outpath')
+    check.str_param(errpath, 'errpath')
+    check.int_param(buffering, 'buffering')
+
+    tees = []
+    reader = None
+    try:
+        for path, from_stream in [(outpath, sys.stdout), (errpath, sys.stderr)]:
+            from_fd = _fileno(from_stream)
+            if from_fd is None:
+                continue
+
+            ensure_file(path)
+            tees.append(_Tee(path, from_stream, from_fd, buffering))
+
+        reader = threading.Thread(target=_read_tees, args=(tees,), name='dagster-compute-logs')
+        reader.daemon = True
+        reader.start()
+
+        yield
+    finally:
+        for tee in tees:
+            tee.restore()
+
+        # Once the file descriptors have been restored, the pipes are closed as soon as any
+        # subprocesses that inherited them have exited
+        if reader is not None:
+            reader.join(TEE_JOIN_TIMEOUT)
+        else:
+            for tee in tees:
+                tee.close()
+
+
+class _Tee(object):
+    def __init__(self, path, from_stream, from_fd, buffering):
+        self.from_stream = from_stream
+        self.from_fd = from_fd
+
+        self.to_file = open(path, 'ab', 0 if buffering == 1 else buffering)
+        self.console_fd = os.dup(from_fd)
+        self.file_failed = False
+        self.console_failed = False
+
+        self.read_fd, write_fd = os.pipe()
+
+        # Both the thread that runs the compute function and the reader thread may restore the
+        # original file descriptor, which must not happen once the console fd has been closed
+        self._lock = threading.Lock()
+        self._restored = False
+        self._closed = False
+
+        from_stream.flush()
+        os.dup2(write_fd, from_fd)
+        os.close(write_fd)
+
+    def restore(self, flush=True):
+        try:
+            if flush:
+                self.from_stream.flush()
+        finally:
+            with self._lock:
+                if not self._restored:
+                    os.dup2(self.console_fd, self.from_fd)
+                    self._restored = True
+
+    def write(self, data):
+        # If the file or the console can no longer be written, e.g. because the disk is full or
+        # the parent process closed the console, the output must still be drained from the pipe so
+        # that the compute function never blocks on writing it
+        if not self.file_failed:
+            try:
+                self.to_file.write(data)
+            except (IOError, OSError):
+                self.file_failed = True
+
+        if not self.console_failed:
+            try:
+                while data:
+                    data = data[os.write(self.console_fd, data) :]
+            except OSError:
+                self.console_failed = True
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            # Once the console fd is closed, it can no longer be used to restore the original
+            # file descriptor
+            self._restored = True
+
+        os.close(self.read_fd)
+        os.close(self.console_fd)
+        self.to_file.close()
+
+
+def _read_tees(tees):
+    open_tees = list(tees)
+    selector = selectors.DefaultSelector()
+    try:
+        for tee in tees:
+            selector.register(tee.read_fd, selectors.EVENT_READ, tee)
+
+        while open_tees:
+            for key, _ in selector.select():
+                tee = key.data
+                data = _read(tee)
+                if data:
+                    tee.write(data)
+                else:
+                    # Every write end of the pipe has been closed
+                    selector.unregister(tee.read_fd)
+                    open_tees.remove(tee)
+                    tee.close()
+    except Exception:
+        # Output that is no longer read would fill the pipes and block the compute function and its
+        # subprocesses, so the original file descriptors are restored and whatever is still written
+        # to the pipes is discarded until they are closed
+        for tee in open_tees:
+            tee.restore(flush=False)
+            drainer = threading.Thread(
+                target=_drain_tee, args=(tee,), name='dagster-compute-logs-drain'
+            )
+            drainer.daemon = True
+            drainer.start()
+        raise
+    finally:
+        selector.close()
+
+
+def _read(tee):
+    while True:
+        try:
+            return os.read(tee.read_fd, TEE_READ_SIZE)
+        except OSError as exc:
+            # Python 2 does not retry calls interrupted by signals
+            if exc.errno != errno.EINTR:
+                raise
+
+
+def _drain_tee(tee):
+    try:
+        while _read(tee):
+            pass
+    finally:
+        tee.close()
 
 
 @contextmanager
@@ -132,6 +132,9 @@ class RunConfig(
 
 
 class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
+    # Whether engines remove each intermediate as soon as every step that consumes it has succeeded
+    gc_intermediates = False
+
     @abstractmethod
     def check_requirements(self, instance, system_storage_def):
         '''Check whether this executor config is valid given the instance and system storage.
@@ -149,6 +152,9 @@ class ExecutorConfig(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
 
 
 class InProcessExecutorConfig(ExecutorConfig):
+    def __init__(self, gc_intermediates=False):
+        self.gc_intermediates = check.bool_param(gc_intermediates, 'gc_intermediates')
+
     def check_requirements(self, _instance, _system_storage_def):
         pass
 
@@ -159,7 +165,7 @@ class InProcessExecutorConfig(ExecutorConfig):
 
 
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, max_concurrent=None):
+    def __init__(self, handle, max_concurrent=None, reuse_workers=False, gc_intermediates=False):
         from dagster import ExecutionTargetHandle
 
         # TODO: These gnomic process boundary/execution target handle exceptions should link to
@@ -175,6 +181,8 @@ class MultiprocessExecutorConfig(ExecutorConfig):
 
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.reuse_workers = check.bool_param(reuse_workers, 'reuse_workers')
+        self.gc_intermediates = check.bool_param(gc_intermediates, 'gc_intermediates')
 
     def check_requirements(self, instance, system_storage_def):
         check_persistent_storage_requirement(system_storage_def)
@@ -234,6 +234,16 @@ def create_executor_config(context_creation_data):
         context_creation_data.pipeline_run,
     )
 
+    executor_config = environment_config.execution.execution_engine_config
+    # The default executor is used when no execution config is provided at all, in which case its
+    # config has not been populated with defaults
+    if (
+        not executor_config
+        and executor_def.config_field
+        and executor_def.config_field.default_provided
+    ):
+        executor_config = executor_def.config_field.default_value
+
     return construct_executor_config(
         InitExecutorContext(
             pipeline_def=pipeline_def,
@@ -241,7 +251,7 @@ def create_executor_config(context_creation_data):
             executor_def=executor_def,
             pipeline_run=pipeline_run,
             environment_config=environment_config,
-            executor_config=environment_config.execution.execution_engine_config,
+            executor_config=executor_config,
         )
     )
 
@@ -0,0 +1,92 @@
+'''Reference counting for the intermediates produced during an execution.
+
+See https://github.com/dagster-io/dagster/issues/811.
+'''
+
+from collections import defaultdict
+
+from dagster import check
+from dagster.core.definitions.events import ObjectStoreOperation
+from dagster.core.events import DagsterEvent
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.execution.plan.plan import ExecutionPlan
+
+
+class IntermediatesRefCounter(object):
+    '''Tracks, for every step output that is read during an execution, the steps that have yet to
+    read it.
+
+    An output may be collected once every step that consumes it has succeeded. Outputs that are
+    consumed by any step that is not part of the execution are never collected, so that they remain
+    available to later executions of those steps. Neither are the inputs of failed or skipped steps,
+    so that those steps can be retried.
+
+    Args:
+        execution_plan (ExecutionPlan): The plan being executed.
+    '''
+
+    def __init__(self, execution_plan):
+        self._execution_plan = check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+
+        consumers = defaultdict(set)
+        for step in execution_plan.steps:
+            for step_input in step.step_inputs:
+                for step_output_handle in step_input.source_handles:
+                    consumers[step_output_handle].add(step.key)
+
+        self._remaining_consumers = {
+            step_output_handle: step_keys
+            for step_output_handle, step_keys in consumers.items()
+            if step_keys.issubset(execution_plan.step_key_set)
+        }
+
+    def step_succeeded(self, step_key):
+        '''Record that a step has succeeded and so will not read its inputs again.
+
+        Args:
+            step_key (str): The key of the step that succeeded.
+
+        Returns:
+            List[StepOutputHandle]: The outputs that no remaining step will read.
+        '''
+        check.str_param(step_key, 'step_key')
+
+        released = []
+        step = self._execution_plan.get_step_by_key(step_key)
+        for step_input in step.step_inputs:
+            for step_output_handle in step_input.source_handles:
+                remaining = self._remaining_consumers.get(step_output_handle)
+                if remaining is None or step_key not in remaining:
+                    continue
+
+                remaining.remove(step_key)
+                if not remaining:
+                    del self._remaining_consumers[step_output_handle]
+                    released.append(step_output_handle)
+
+        return released
+
+
+def collect_intermediates(pipeline_context, execution_plan, step_output_handles):
+    '''Remove the given intermediates from the intermediates manager, yielding an event for each
+    intermediate removed from an object store.
+    '''
+    check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
+    check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
+    check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+
+    intermediates_manager = pipeline_context.intermediates_manager
+    for step_output_handle in step_output_handles:
+        step_context = pipeline_context.for_step(
+            execution_plan.get_step_by_key(step_output_handle.step_key)
+        )
+        if not intermediates_manager.has_intermediate(step_context, step_output_handle):
+            continue
+
+        res = intermediates_manager.rm_intermediate(step_context, step_output_handle)
+        if isinstance(res, ObjectStoreOperation):
+            yield DagsterEvent.object_store_operation(
+                step_context,
+                ObjectStoreOperation.serializable(res, value_name=step_output_handle.output_name),
+            )
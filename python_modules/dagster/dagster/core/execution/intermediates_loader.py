@@ -0,0 +1,141 @@
+'''Concurrent loading and prefetching of the intermediates that are the inputs of steps.'''
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dagster import check
+from dagster.core.execution.context.system import SystemStepExecutionContext
+from dagster.core.execution.plan.objects import ExecutionStep, StepOutputHandle
+from dagster.core.storage.intermediates_manager import IntermediatesManager
+
+
+def intermediate_sources_for_step(step):
+    '''The step output handles a step reads its inputs from, with the runtime type to read each as.
+
+    Args:
+        step (ExecutionStep): The step.
+
+    Returns:
+        List[Tuple[StepOutputHandle, RuntimeType]]
+    '''
+    check.inst_param(step, 'step', ExecutionStep)
+
+    sources = []
+    for step_input in step.step_inputs:
+        if step_input.runtime_type.is_nothing:
+            continue
+
+        if step_input.is_from_multiple_outputs:
+            if hasattr(step_input.runtime_type, 'inner_type'):
+                runtime_type = step_input.runtime_type.inner_type
+            else:  # This is the case where the fan-in is typed Any
+                runtime_type = step_input.runtime_type
+        elif step_input.is_from_single_output:
+            runtime_type = step_input.runtime_type
+        else:  # is from config
+            continue
+
+        for source_handle in step_input.source_handles:
+            sources.append((source_handle, runtime_type))
+
+    return sources
+
+
+class IntermediatesLoader(object):
+    '''Loads intermediates from an intermediates manager, using a bounded pool of threads to load
+    up to the manager's max_concurrent_reads intermediates at once.
+
+    Intermediates can also be prefetched, i.e. loaded in the background ahead of the step that
+    reads them, if the manager enables prefetch_inputs. A prefetched intermediate is held in memory
+    until it is loaded by get_intermediates. Use the loader as a context manager, so that its
+    threads are shut down once it is no longer needed.
+
+    Args:
+        intermediates_manager (IntermediatesManager): The manager to load intermediates from.
+    '''
+
+    def __init__(self, intermediates_manager):
+        self._intermediates_manager = check.inst_param(
+            intermediates_manager, 'intermediates_manager', IntermediatesManager
+        )
+
+        max_workers = intermediates_manager.max_concurrent_reads
+        self._thread_pool = (
+            ThreadPoolExecutor(max_workers=max_workers)
+            if max_workers > 1 or self.prefetch_inputs
+            else None
+        )
+        self._prefetched = {}
+
+    @property
+    def prefetch_inputs(self):
+        return self._intermediates_manager.prefetch_inputs
+
+    def prefetch(self, step_context, step_output_handle, runtime_type):
+        '''Start loading an intermediate in the background, if prefetching is enabled.
+
+        Args:
+            step_context (SystemStepExecutionContext): The context of the step that will read the
+                intermediate.
+            step_output_handle (StepOutputHandle): The intermediate to load.
+            runtime_type (RuntimeType): The type to load the intermediate as.
+        '''
+        check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        if not self.prefetch_inputs or step_output_handle in self._prefetched:
+            return
+
+        self._prefetched[step_output_handle] = self._thread_pool.submit(
+            self._intermediates_manager.get_intermediate,
+            step_context,
+            runtime_type,
+            step_output_handle,
+        )
+
+    def get_intermediates(self, step_context, sources):
+        '''Load intermediates, concurrently if the manager allows it.
+
+        Args:
+            step_context (SystemStepExecutionContext): The context of the step that reads the
+                intermediates.
+            sources (List[Tuple[StepOutputHandle, RuntimeType]]): The intermediates to load, and
+                the type to load each as.
+
+        Returns:
+            Dict[StepOutputHandle, Any]: The result of get_intermediate for every intermediate.
+        '''
+        check.inst_param(step_context, 'step_context', SystemStepExecutionContext)
+        check.list_param(sources, 'sources', of_type=tuple)
+
+        if self._thread_pool is None or (len(sources) <= 1 and not self._prefetched):
+            return {
+                step_output_handle: self._intermediates_manager.get_intermediate(
+                    step_context, runtime_type, step_output_handle
+                )
+                for step_output_handle, runtime_type in sources
+            }
+
+        futures = {}
+        for step_output_handle, runtime_type in sources:
+            future = self._prefetched.pop(step_output_handle, None)
+            if future is None:
+                future = self._thread_pool.submit(
+                    self._intermediates_manager.get_intermediate,
+                    step_context,
+                    runtime_type,
+                    step_output_handle,
+                )
+            futures[step_output_handle] = future
+
+        return {
+            step_output_handle: future.result() for step_output_handle, future in futures.items()
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Intermediates prefetched for steps that were then skipped are discarded
+        self._prefetched = {}
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=True)
@@ -147,9 +147,13 @@ def get_retry_steps_from_execution_plan(instance, execution_plan):
     for handle in previous_run_output_handles:
         previous_run_output_names_by_step[handle.step_key].add(handle.output_name)
 
+    previous_run_step_keys = (
+        set(previous_run.step_keys_to_execute) if previous_run.step_keys_to_execute else None
+    )
+
     to_retry = []
     for step in execution_plan.topological_steps():
-        if previous_run.step_keys_to_execute and step.key not in previous_run.step_keys_to_execute:
+        if previous_run_step_keys and step.key not in previous_run_step_keys:
             continue
 
         if step.key in failed_step_keys:
@@ -20,6 +20,10 @@ from dagster.core.utils import toposort
 from .compute import create_compute_step
 from .objects import ExecutionStep, StepInput, StepInputSourceType, StepOutputHandle
 
+DAGSTER_PRIORITY_TAG = 'dagster/priority'
+'''The step metadata key with which a solid sets the priority of its steps in the multiprocess
+executor. The Celery and Dask engines read their own keys, on their own scales.'''
+
 
 class _PlanBuilder(object):
     '''_PlanBuilder. This is the state that is built up during the execution plan build process.
@@ -94,6 +98,9 @@ class _PlanBuilder(object):
 
         step_dict = {step.key: step for step in self._steps.values()}
 
+        for step in step_dict.values():
+            _check_step_priority(step)
+
         system_storage_def = self.mode_definition.get_system_storage_def(
             self.environment_config.storage.system_storage_name
         )
@@ -258,9 +265,22 @@ def get_step_input(
 class ExecutionPlan(
     namedtuple(
         '_ExecutionPlan',
-        'pipeline_def step_dict deps steps artifacts_persisted previous_run_id step_keys_to_execute',
+        (
+            'pipeline_def step_dict deps steps artifacts_persisted previous_run_id '
+            'step_keys_to_execute step_key_set dependents topological_key_levels '
+            'execution_key_deps execution_key_levels'
+        ),
     )
 ):
+    '''The steps of a pipeline and the dependencies between them, together with the subset of
+    those steps to execute.
+
+    The dependency structure of the plan is computed once, when the plan is constructed, rather
+    than every time it is queried. The structure of the whole plan (deps, dependents and
+    topological_key_levels) is shared with every plan produced by build_subset_plan, and only the
+    structure of the steps to execute is recomputed for a subset.
+    '''
+
     def __new__(
         cls,
         pipeline_def,
@@ -269,6 +289,8 @@ class ExecutionPlan(
         artifacts_persisted,
         previous_run_id,
         step_keys_to_execute,
+        dependents=None,
+        topological_key_levels=None,
     ):
         missing_steps = [step_key for step_key in step_keys_to_execute if step_key not in step_dict]
         if missing_steps:
@@ -278,19 +300,41 @@ class ExecutionPlan(
                 ),
                 step_keys=missing_steps,
             )
+
+        deps = check.dict_param(deps, 'deps', key_type=str, value_type=set)
+        step_keys_to_execute = check.list_param(
+            step_keys_to_execute, 'step_keys_to_execute', of_type=str
+        )
+
+        if dependents is None:
+            dependents = _build_dependents(deps)
+        if topological_key_levels is None:
+            topological_key_levels = toposort(deps)
+
+        step_key_set = frozenset(step_keys_to_execute)
+        execution_key_deps = {
+            step_key: frozenset(deps[step_key].intersection(step_key_set))
+            for step_key in step_key_set
+        }
+
         return super(ExecutionPlan, cls).__new__(
             cls,
             pipeline_def=check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition),
             step_dict=check.dict_param(
                 step_dict, 'step_dict', key_type=str, value_type=ExecutionStep
             ),
-            deps=check.dict_param(deps, 'deps', key_type=str, value_type=set),
+            deps=deps,
             steps=list(step_dict.values()),
             artifacts_persisted=check.bool_param(artifacts_persisted, 'artifacts_persisted'),
             previous_run_id=check.opt_str_param(previous_run_id, 'previous_run_id'),
-            step_keys_to_execute=check.list_param(
-                step_keys_to_execute, 'step_keys_to_execute', of_type=str
+            step_keys_to_execute=step_keys_to_execute,
+            step_key_set=step_key_set,
+            dependents=check.dict_param(dependents, 'dependents', key_type=str, value_type=set),
+            topological_key_levels=check.list_param(
+                topological_key_levels, 'topological_key_levels', of_type=list
             ),
+            execution_key_deps=execution_key_deps,
+            execution_key_levels=toposort(execution_key_deps),
         )
 
     def get_step_output(self, step_output_handle):
@@ -311,28 +355,31 @@ class ExecutionPlan(
 
     def topological_step_levels(self):
         return [
-            [self.step_dict[step_key] for step_key in sorted(step_key_level)]
-            for step_key_level in toposort(self.deps)
+            [self.step_dict[step_key] for step_key in step_key_level]
+            for step_key_level in self.topological_key_levels
         ]
 
     def execution_step_levels(self):
         return [
-            [self.step_dict[step_key] for step_key in sorted(step_key_level)]
-            for step_key_level in toposort(self.execution_deps())
+            [self.step_dict[step_key] for step_key in step_key_level]
+            for step_key_level in self.execution_key_levels
         ]
 
     def missing_steps(self):
         return [step_key for step_key in self.step_keys_to_execute if not self.has_step(step_key)]
 
     def execution_deps(self):
-        step_dict = {k: v for k, v in self.step_dict.items() if k in self.step_keys_to_execute}
-        deps = {step.key: set() for step in step_dict.values()}
-        for step in step_dict.values():
-            for step_input in step.step_inputs:
-                deps[step.key].update(
-                    step_input.dependency_keys.intersection(self.step_keys_to_execute)
-                )
-        return deps
+        '''Dict[str, FrozenSet[str]]: For each step to execute, the keys of the steps to execute
+        that it depends on.
+
+        Returns a new dict each time, so callers may freely add or remove keys.
+        '''
+        return dict(self.execution_key_deps)
+
+    def execution_dependents(self, step_key):
+        '''FrozenSet[str]: The keys of the steps to execute that depend on the given step.'''
+        check.str_param(step_key, 'step_key')
+        return frozenset(self.dependents[step_key].intersection(self.step_key_set))
 
     def build_subset_plan(self, step_keys_to_execute):
         check.list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
@@ -343,6 +390,8 @@ class ExecutionPlan(
             self.artifacts_persisted,
             self.previous_run_id,
             step_keys_to_execute,
+            dependents=self.dependents,
+            topological_key_levels=self.topological_key_levels,
         )
 
     @staticmethod
@@ -363,3 +412,25 @@ class ExecutionPlan(
 
         # Finally, we build and return the execution plan
         return plan_builder.build()
+
+
+def _check_step_priority(step):
+    priority = step.metadata.get(DAGSTER_PRIORITY_TAG)
+    if priority is None:
+        return
+
+    try:
+        int(priority)
+    except (TypeError, ValueError):
+        raise DagsterInvariantViolationError(
+            'Invalid value {priority} for step metadata key {key} on step {step_key}, expected an '
+            'integer.'.format(priority=repr(priority), key=DAGSTER_PRIORITY_TAG, step_key=step.key)
+        )
+
+
+def _build_dependents(deps):
+    dependents = {step_key: set() for step_key in deps}
+    for step_key, upstream_keys in deps.items():
+        for upstream_key in upstream_keys:
+            dependents[upstream_key].add(step_key)
+    return dependents
@@ -259,6 +259,9 @@ class DagsterInstance:
     def get_run_stats(self, run_id):
         return self._event_storage.get_stats_for_run(run_id)
 
+    def get_runs_stats(self, run_ids):
+        return self._event_storage.get_stats_for_runs(run_ids)
+
     def get_run_tags(self):
         return self._run_storage.get_run_tags()
 
@@ -316,15 +319,24 @@ class DagsterInstance:
 
     # event storage
 
-    def logs_after(self, run_id, cursor):
-        return self._event_storage.get_logs_for_run(run_id, cursor=cursor)
+    def logs_after(self, run_id, cursor, limit=None):
+        return self._event_storage.get_logs_for_run(run_id, cursor=cursor, limit=limit)
 
     def all_logs(self, run_id):
         return self._event_storage.get_logs_for_run(run_id)
 
+    def get_event_count(self, run_id):
+        return self._event_storage.get_event_count(run_id)
+
+    def get_events_for_runs(self, run_ids, event_types):
+        return self._event_storage.get_events_for_runs(run_ids, event_types)
+
     def watch_event_logs(self, run_id, cursor, cb):
         return self._event_storage.watch(run_id, cursor, cb)
 
+    def end_watch_event_logs(self, run_id, cb):
+        return self._event_storage.end_watch(run_id, cb)
+
     # event subscriptions
 
     def get_logger(self):
@@ -355,5 +367,32 @@ class DagsterInstance:
     def intermediates_directory(self, run_id):
         return self._local_artifact_storage.intermediates_dir(run_id)
 
+    def blobs_directory(self):
+        return self._local_artifact_storage.blobs_dir
+
+    def remove_unreferenced_blobs(self, min_age_seconds=None):
+        '''Remove the intermediates written by content-addressed filesystem storage to the blobs
+        directory of the instance that no run refers to any longer.
+
+        Intermediates written or reused by a run within the last min_age_seconds are kept, so this
+        is safe to call while runs are executing.
+
+        Args:
+            min_age_seconds (Optional[float]): Defaults to 1 day.
+
+        Returns:
+            List[str]: The paths of the intermediates that were removed.
+        '''
+        from dagster.core.storage.intermediate_store import (
+            BLOB_MIN_AGE_SECONDS,
+            remove_unreferenced_blobs,
+        )
+
+        return remove_unreferenced_blobs(
+            self.blobs_directory(),
+            self._local_artifact_storage.storage_dir,
+            BLOB_MIN_AGE_SECONDS if min_age_seconds is None else min_age_seconds,
+        )
+
     def schedules_directory(self):
         return self._local_artifact_storage.schedules_dir
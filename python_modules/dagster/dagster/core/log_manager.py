@@ -34,13 +34,9 @@ def _dump_value(value):
     return seven.json.dumps(value)
 
 
-def construct_log_string(synth_props, logging_tags, message_props):
-    from dagster.core.execution.plan.objects import StepFailureData
-
-    format_str = '{key:>20} = {value}'
-
-    # reduce noise and key duplication
-    skip_keys = [
+# reduce noise and key duplication
+_LOG_STRING_SKIP_KEYS = frozenset(
+    [
         'dagster_event',  #         separately included
         'event_type_value',  #      separately included
         'execution_epoch_time',  #  noise
@@ -51,6 +47,13 @@ def construct_log_string(synth_props, logging_tags, message_props):
         'solid_handle',  #          we have solid and solid_definition keys
         'step_kind_value',  #       can be inferred from step_key
     ]
+)
+
+_LOG_STRING_FORMAT = '{key:>20} = {value}'
+
+
+def construct_log_string(synth_props, logging_tags, message_props):
+    from dagster.core.execution.plan.objects import StepFailureData
 
     # Handle this explicitly
     dagster_event = (
@@ -71,9 +74,9 @@ def construct_log_string(synth_props, logging_tags, message_props):
         del log_props['event_specific_data']
 
     log_props_list = [
-        format_str.format(key=key, value=_dump_value(value))
+        _LOG_STRING_FORMAT.format(key=key, value=_dump_value(value))
         for key, value in sorted(log_props.items())
-        if key not in skip_keys and value != None
+        if key not in _LOG_STRING_SKIP_KEYS and value != None
     ]
     log_props_str = '\n' + '\n'.join(log_props_list) if log_props_list else ''
 
@@ -50,7 +50,14 @@ def pack_value(val):
     return _pack_value(val, enum_map=_WHITELISTED_ENUM_MAP, tuple_map=_WHITELISTED_TUPLE_MAP)
 
 
+# Values of these exact types are already json-compatible, and are checked for before anything else
+# because they make up the bulk of any serialized object
+_PRIMITIVE_TYPES = frozenset(six.integer_types + six.string_types + (float, bool, type(None)))
+
+
 def _pack_value(val, enum_map, tuple_map):
+    if type(val) in _PRIMITIVE_TYPES:
+        return val
     if isinstance(val, list):
         return [_pack_value(i, enum_map, tuple_map) for i in val]
     if isinstance(val, tuple):
@@ -59,8 +66,9 @@ def _pack_value(val, enum_map, tuple_map):
             klass_name in tuple_map,
             'Can only serialize whitelisted namedtuples, recieved {}'.format(klass_name),
         )
+        # Zipping with _fields avoids building the intermediate OrderedDict that _asdict returns
         base_dict = {
-            key: _pack_value(value, enum_map, tuple_map) for key, value in val._asdict().items()
+            key: _pack_value(value, enum_map, tuple_map) for key, value in zip(val._fields, val)
         }
         base_dict['__class__'] = klass_name
         return base_dict
@@ -91,28 +99,40 @@ def unpack_value(val):
     return _unpack_value(val, enum_map=_WHITELISTED_ENUM_MAP, tuple_map=_WHITELISTED_TUPLE_MAP)
 
 
+@seven.lru_cache(maxsize=None)
+def _get_args_for_class(klass):
+    '''The names of the arguments accepted by the constructor of klass, or None if they can't be
+    determined.
+
+    Introspecting the constructor is expensive, so it is done once per class rather than once per
+    deserialized object.'''
+    args_for_class = seven.get_args(klass)
+    if not args_for_class:
+        return None
+
+    # On Python 2, seven.get_args returns an ArgSpec
+    return frozenset(getattr(args_for_class, 'args', args_for_class))
+
+
 def _unpack_value(val, enum_map, tuple_map):
+    if type(val) in _PRIMITIVE_TYPES:
+        return val
     if isinstance(val, list):
         return [_unpack_value(i, enum_map, tuple_map) for i in val]
     if isinstance(val, dict) and val.get('__class__'):
-        klass_name = val.pop('__class__')
-        klass = tuple_map[klass_name]
-        unpacked_val = {
-            key: _unpack_value(value, enum_map, tuple_map) for key, value in val.items()
-        }
+        klass = tuple_map[val['__class__']]
 
         # Naively implements backwards compatibility by filtering arguments that aren't present in
         # the constructor. If a property is present in the serialized object, but doesn't exist in
         # the version of the class loaded into memory, that property will be completely ignored.
-        # The call to seven.get_args turns out to be pretty expensive -- we should probably turn
-        # to, e.g., manually managing the deprecated keys on the serdes constructor.
-        args_for_class = seven.get_args(klass)
-        filtered_val = (
-            {k: v for k, v in unpacked_val.items() if k in args_for_class}
-            if args_for_class
-            else unpacked_val
+        args_for_class = _get_args_for_class(klass)
+        return klass(
+            **{
+                key: _unpack_value(value, enum_map, tuple_map)
+                for key, value in val.items()
+                if key != '__class__' and (args_for_class is None or key in args_for_class)
+            }
         )
-        return klass(**filtered_val)
     if isinstance(val, dict) and val.get('__enum__'):
         name, member = val['__enum__'].split('.')
         return getattr(enum_map[name], member)
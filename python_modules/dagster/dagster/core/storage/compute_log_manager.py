@@ -53,6 +53,12 @@ class ComputeLogManager(six.with_metaclass(ABCMeta)):
     def enabled(self, _step_context):
         return True
 
+    def capture_in_process(self, _step_context):
+        '''Whether the compute logs of a step are captured by a thread in the step process, rather
+        than by redirecting its output to files that are tailed by subprocesses. In-process capture
+        is not available on Windows.'''
+        return False
+
     def observable(self, run_id, step_key, io_type, cursor=None):
         check.str_param(run_id, 'run_id')
         check.str_param(step_key, 'step_key')
@@ -23,20 +23,70 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
     '''Abstract base class for storing structured event logs from pipeline runs.'''
 
     @abstractmethod
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         '''Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. If None, all logs after
+                the cursor will be returned. (default: None)
         '''
 
+    def get_event_count(self, run_id):
+        '''Get the number of events that have been stored for a run.
+
+        Storages that can count events without fetching them should override this.
+        '''
+        return len(self.get_logs_for_run(run_id))
+
     def get_stats_for_run(self, run_id):
         '''Get a summary of events that have ocurred in a run.'''
 
         return build_stats_from_events(run_id, self.get_logs_for_run(run_id))
 
+    def get_stats_for_runs(self, run_ids):
+        '''Get a summary of events that have ocurred in each of a list of runs.
+
+        Storages that can summarize many runs more cheaply than one at a time should override this.
+
+        Args:
+            run_ids (List[str]): The ids of the runs to summarize.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The summary of each run, keyed by run id.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_events_for_runs(self, run_ids, event_types):
+        '''Get the events of some types from each of a list of runs.
+
+        Storages that can select events by type without fetching every event of the runs should
+        override this.
+
+        Args:
+            run_ids (List[str]): The ids of the runs from which to fetch events.
+            event_types (List[DagsterEventType]): The types of the events to fetch.
+
+        Returns:
+            Dict[str, List[EventRecord]]: The events of each run, in order, keyed by run id.
+        '''
+        from dagster.core.events import DagsterEventType
+
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        event_types = set(check.list_param(event_types, 'event_types', of_type=DagsterEventType))
+
+        return {
+            run_id: [
+                record
+                for record in self.get_logs_for_run(run_id)
+                if record.is_dagster_event and record.dagster_event.event_type in event_types
+            ]
+            for run_id in run_ids
+        }
+
     @abstractmethod
     def store_event(self, event):
         '''Store an event corresponding to a pipeline run.
@@ -46,6 +96,18 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
             event (EventRecord): The event to store.
         '''
 
+    def store_events(self, events):
+        '''Store a batch of events, which may correspond to any number of pipeline runs.
+
+        Storages that can write many events more cheaply than one at a time should override this.
+
+        Args:
+            events (List[EventRecord]): The events to store, in order.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id):
         '''Remove events for a given run id'''
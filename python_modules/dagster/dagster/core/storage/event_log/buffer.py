@@ -0,0 +1,136 @@
+import atexit
+import os
+import threading
+import weakref
+
+from dagster import check
+from dagster.core.events import DagsterEventType
+from dagster.core.events.log import EventRecord
+
+FLUSH_EVENT_TYPES = {
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.PIPELINE_INIT_FAILURE,
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    # Engine events mark the start and end of the processes in which steps execute, so are often
+    # the last event a process writes before it exits
+    DagsterEventType.ENGINE_EVENT,
+}
+'''The event types which cause the buffer to be flushed synchronously, so that the lifecycle of
+runs and steps is never hidden from readers of the event log.'''
+
+
+def _should_flush_on(event):
+    return event.is_dagster_event and event.dagster_event.event_type in FLUSH_EVENT_TYPES
+
+
+def _close_at_exit(buffer_ref):
+    buffer = buffer_ref()
+    if buffer is not None:
+        buffer.close()
+
+
+class EventLogBuffer(object):
+    '''Accumulates events in memory and writes them to an event log storage in batches.
+
+    The buffer is flushed when it holds batch_size events, when an event whose type is in
+    FLUSH_EVENT_TYPES is added, and by a background thread every flush_interval seconds. Events
+    still buffered when the process exits are written by an atexit hook.
+
+    Args:
+        store_events (Callable[[List[EventRecord]], None]): Writes a batch of events.
+        batch_size (int): The number of events at which the buffer is flushed.
+        flush_interval (float): The maximum number of seconds an event stays in the buffer.
+    '''
+
+    def __init__(self, store_events, batch_size, flush_interval):
+        self._store_events = check.callable_param(store_events, 'store_events')
+        self._batch_size = check.int_param(batch_size, 'batch_size')
+        self._flush_interval = check.float_param(flush_interval, 'flush_interval')
+        check.param_invariant(batch_size > 0, 'batch_size')
+        check.param_invariant(flush_interval > 0, 'flush_interval')
+
+        self._events = []
+        self._lock = threading.Lock()
+        # Held for the duration of every write, so that batches are written in order
+        self._flush_lock = threading.Lock()
+
+        self._flush_thread = None
+        self._flush_thread_pid = None
+        self._shutdown_event = threading.Event()
+
+    def add(self, event):
+        check.inst_param(event, 'event', EventRecord)
+
+        with self._lock:
+            self._events.append(event)
+            should_flush = len(self._events) >= self._batch_size or _should_flush_on(event)
+
+        if should_flush:
+            self.flush()
+        else:
+            self._ensure_flush_thread()
+
+    def flush(self):
+        '''Synchronously write every buffered event.'''
+        with self._flush_lock:
+            with self._lock:
+                events, self._events = self._events, []
+
+            if not events:
+                return
+
+            try:
+                self._store_events(events)
+            except Exception:  # pylint: disable=broad-except
+                # Put the events back so that they are retried by the next flush
+                with self._lock:
+                    self._events = events + self._events
+                raise
+
+    def clear(self):
+        '''Discard every buffered event.'''
+        with self._lock:
+            self._events = []
+
+    def close(self):
+        '''Stop the background flush thread and write every buffered event.'''
+        self._shutdown_event.set()
+        if self._flush_thread is not None and self._flush_thread_pid == os.getpid():
+            self._flush_thread.join()
+        self._flush_thread = None
+        self.flush()
+
+    def _ensure_flush_thread(self):
+        # Threads do not survive a fork, so a buffer inherited by a child process starts its own
+        if self._flush_thread is not None and self._flush_thread_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._flush_thread is not None and self._flush_thread_pid == os.getpid():
+                return
+
+            self._shutdown_event = threading.Event()
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically,
+                args=(self._shutdown_event,),
+                name='dagster-event-log-flush',
+            )
+            self._flush_thread.daemon = True
+            self._flush_thread_pid = os.getpid()
+            self._flush_thread.start()
+
+            # The flush thread is a daemon, so would otherwise drop the events it hasn't flushed
+            atexit.register(_close_at_exit, weakref.ref(self))
+
+    def _flush_periodically(self, shutdown_event):
+        while not shutdown_event.wait(self._flush_interval):
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                # The events remain buffered, and any persistent error surfaces in the thread
+                # that next flushes synchronously
+                pass
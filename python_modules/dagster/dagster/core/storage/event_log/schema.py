@@ -11,3 +11,10 @@ SqlEventLogStorageTable = db.Table(
     db.Column('dagster_event_type', db.Text),
     db.Column('timestamp', db.types.TIMESTAMP),
 )
+
+# Serves the per-run aggregations behind run stats, and the per-run scans behind run logs
+db.Index(
+    'idx_run_id_dagster_event_type',
+    SqlEventLogStorageTable.c.run_id,
+    SqlEventLogStorageTable.c.dagster_event_type,
+)
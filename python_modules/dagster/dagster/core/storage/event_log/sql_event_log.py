@@ -1,5 +1,6 @@
 import datetime
 from abc import abstractmethod
+from collections import OrderedDict, defaultdict
 
 import six
 import sqlalchemy as db
@@ -14,6 +15,10 @@ from ..pipeline_run import PipelineRunStatsSnapshot
 from .base import DagsterEventLogInvalidForRun, EventLogStorage
 from .schema import SqlEventLogStorageTable
 
+STATS_QUERY_BATCH_SIZE = 500
+'''The maximum number of runs summarized by a single query, which keeps the number of bound
+parameters well within the limits of every supported database.'''
+
 
 class SqlEventLogStorage(EventLogStorage):
     @abstractmethod
@@ -39,30 +44,45 @@ class SqlEventLogStorage(EventLogStorage):
         '''
         check.inst_param(event, 'event', EventRecord)
 
-        dagster_event_type = None
-        if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
-
-        run_id = event.run_id
-
         # https://stackoverflow.com/a/54386260/324449
         event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=run_id,
-            event=serialize_dagster_namedtuple(event),
-            dagster_event_type=dagster_event_type,
-            timestamp=datetime.datetime.fromtimestamp(event.timestamp),
+            **_event_insert_values(event)
         )
 
-        with self.connect(run_id) as conn:
+        with self.connect(event.run_id) as conn:
             conn.execute(event_insert)
 
-    def get_logs_for_run(self, run_id, cursor=-1):
+    def store_events(self, events):
+        '''Store a batch of events, which may correspond to any number of pipeline runs.
+
+        The events for each run are written with a single multi-row insert over a single
+        connection, in the order in which they appear in the batch.
+
+        Args:
+            events (List[EventRecord]): The events to store.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
+
+        events_by_run_id = OrderedDict()
+        for event in events:
+            events_by_run_id.setdefault(event.run_id, []).append(_event_insert_values(event))
+
+        for run_id, insert_values in events_by_run_id.items():
+            with self.connect(run_id) as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),
+                    insert_values,  # pylint: disable=no-value-for-parameter
+                )
+
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
         '''Get all of the logs corresponding to a run.
 
         Args:
             run_id (str): The id of the run for which to fetch logs.
             cursor (Optional[int]): Zero-indexed logs will be returned starting from cursor + 1,
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
+            limit (Optional[int]): The maximum number of logs to return. If None, all logs after
+                the cursor will be returned. (default: None)
         '''
         check.str_param(run_id, 'run_id')
         check.int_param(cursor, 'cursor')
@@ -70,70 +90,94 @@ class SqlEventLogStorage(EventLogStorage):
             cursor >= -1,
             'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
         )
+        check.opt_int_param(limit, 'limit')
 
+        # The cursor indexes into the events for the run, rather than into the ids of the table,
+        # which may be shared between runs
         query = (
             db.select([SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.id >= cursor)
             .order_by(SqlEventLogStorageTable.c.id.asc())
+            .offset(cursor + 1)
         )
+        if limit is not None:
+            query = query.limit(limit)
 
         with self.connect(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        events = []
+        return _deserialize_events(run_id, [json_str for (json_str,) in results])
 
-        try:
-            for (json_str,) in results:
-                events.append(
-                    check.inst_param(
-                        deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
-                    )
-                )
-        except (seven.JSONDecodeError, check.CheckError) as err:
-            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+    def get_event_count(self, run_id):
+        check.str_param(run_id, 'run_id')
 
-        return events
+        query = db.select([db.func.count()]).where(SqlEventLogStorageTable.c.run_id == run_id)
+        with self.connect(run_id) as conn:
+            return conn.execute(query).scalar()
 
     def get_stats_for_run(self, run_id):
         check.str_param(run_id, 'run_id')
 
-        query = db.select(
-            [
-                SqlEventLogStorageTable.c.dagster_event_type,
-                db.func.count().label('n_events_of_type'),
-                db.func.max(SqlEventLogStorageTable.c.timestamp).label('last_event_timestamp'),
-            ]
-        ).group_by('dagster_event_type')
+        query = _stats_query().where(SqlEventLogStorageTable.c.run_id == run_id)
         with self.connect(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        try:
-            counts = {}
-            times = {}
-            for result in results:
-                if result[0]:
-                    counts[result[0]] = result[1]
-                    times[result[0]] = result[2]
-
-            return PipelineRunStatsSnapshot(
-                run_id=run_id,
-                steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
-                steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
-                materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
-                expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
-                start_time=datetime_as_float(
-                    times.get(DagsterEventType.PIPELINE_START.value, None)
-                ),
-                end_time=datetime_as_float(
-                    times.get(
-                        DagsterEventType.PIPELINE_SUCCESS.value,
-                        times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
-                    )
-                ),
+        return _build_stats(run_id, results)
+
+    def get_stats_for_runs(self, run_ids):
+        '''Get a summary of events that have ocurred in each of a list of runs.
+
+        The runs are summarized by a single grouped query per batch of STATS_QUERY_BATCH_SIZE
+        runs, served by the index on (run_id, dagster_event_type).
+
+        Args:
+            run_ids (List[str]): The ids of the runs to summarize.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The summary of each run, keyed by run id.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        results_by_run_id = defaultdict(list)
+        for i in range(0, len(run_ids), STATS_QUERY_BATCH_SIZE):
+            query = _stats_query().where(
+                SqlEventLogStorageTable.c.run_id.in_(run_ids[i : i + STATS_QUERY_BATCH_SIZE])
             )
-        except (seven.JSONDecodeError, check.CheckError) as err:
-            six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+            with self.connect() as conn:
+                for result in conn.execute(query).fetchall():
+                    results_by_run_id[result.run_id].append(result)
+
+        return {run_id: _build_stats(run_id, results_by_run_id[run_id]) for run_id in run_ids}
+
+    def get_events_for_runs(self, run_ids, event_types):
+        '''Get the events of some types from each of a list of runs.
+
+        The events are selected by a single query per batch of STATS_QUERY_BATCH_SIZE runs, served
+        by the index on (run_id, dagster_event_type), so the other events of the runs are never
+        fetched.
+
+        Args:
+            run_ids (List[str]): The ids of the runs from which to fetch events.
+            event_types (List[DagsterEventType]): The types of the events to fetch.
+
+        Returns:
+            Dict[str, List[EventRecord]]: The events of each run, in order, keyed by run id.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        check.list_param(event_types, 'event_types', of_type=DagsterEventType)
+
+        json_strs_by_run_id = defaultdict(list)
+        for i in range(0, len(run_ids), STATS_QUERY_BATCH_SIZE):
+            query = _events_of_types_query(event_types).where(
+                SqlEventLogStorageTable.c.run_id.in_(run_ids[i : i + STATS_QUERY_BATCH_SIZE])
+            )
+            with self.connect() as conn:
+                for result in conn.execute(query).fetchall():
+                    json_strs_by_run_id[result.run_id].append(result.event)
+
+        return {
+            run_id: _deserialize_events(run_id, json_strs_by_run_id[run_id]) for run_id in run_ids
+        }
 
     def wipe(self):
         '''Clears the event log storage.'''
@@ -156,3 +200,84 @@ class SqlEventLogStorage(EventLogStorage):
     @property
     def is_persistent(self):
         return True
+
+
+def _deserialize_events(run_id, json_strs):
+    events = []
+
+    try:
+        for json_str in json_strs:
+            events.append(
+                check.inst_param(
+                    deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
+                )
+            )
+    except (seven.JSONDecodeError, check.CheckError) as err:
+        six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+    return events
+
+
+def _events_of_types_query(event_types):
+    return (
+        db.select([SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.event])
+        .where(
+            SqlEventLogStorageTable.c.dagster_event_type.in_(
+                [event_type.value for event_type in event_types]
+            )
+        )
+        .order_by(SqlEventLogStorageTable.c.id.asc())
+    )
+
+
+def _stats_query():
+    return db.select(
+        [
+            SqlEventLogStorageTable.c.run_id,
+            SqlEventLogStorageTable.c.dagster_event_type,
+            db.func.count().label('n_events_of_type'),
+            db.func.max(SqlEventLogStorageTable.c.timestamp).label('last_event_timestamp'),
+        ]
+    ).group_by(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.dagster_event_type)
+
+
+def _build_stats(run_id, results):
+    try:
+        counts = {}
+        times = {}
+        for result in results:
+            if result.dagster_event_type:
+                counts[result.dagster_event_type] = result.n_events_of_type
+                times[result.dagster_event_type] = result.last_event_timestamp
+
+        start_time = times.get(DagsterEventType.PIPELINE_START.value, None)
+        end_time = times.get(
+            DagsterEventType.PIPELINE_SUCCESS.value,
+            times.get(DagsterEventType.PIPELINE_FAILURE.value, None),
+        )
+
+        return PipelineRunStatsSnapshot(
+            run_id=run_id,
+            steps_succeeded=counts.get(DagsterEventType.STEP_SUCCESS.value, 0),
+            steps_failed=counts.get(DagsterEventType.STEP_FAILURE.value, 0),
+            materializations=counts.get(DagsterEventType.STEP_MATERIALIZATION.value, 0),
+            expectations=counts.get(DagsterEventType.STEP_EXPECTATION_RESULT.value, 0),
+            # Runs that have not yet started or finished have no start or end time
+            start_time=datetime_as_float(start_time) if start_time else None,
+            end_time=datetime_as_float(end_time) if end_time else None,
+        )
+    except (seven.JSONDecodeError, check.CheckError) as err:
+        six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), err)
+
+
+def _event_insert_values(event):
+    dagster_event_type = None
+    if event.is_dagster_event:
+        dagster_event_type = event.dagster_event.event_type_value
+
+    return dict(
+        run_id=event.run_id,
+        event=serialize_dagster_namedtuple(event),
+        dagster_event_type=dagster_event_type,
+        timestamp=datetime.datetime.fromtimestamp(event.timestamp),
+    )
@@ -1,7 +1,8 @@
 import glob
 import os
 import sqlite3
-from collections import defaultdict
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import six
@@ -12,8 +13,9 @@ from watchdog.observers import Observer
 
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
+from dagster.core.events import DagsterEventType
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.core.types import String
+from dagster.core.types import Int, String
 from dagster.core.types.config import Field
 from dagster.utils import mkdir_p
 
@@ -26,18 +28,53 @@ from ...sql import (
     stamp_alembic_rev,
 )
 from ..base import DagsterEventLogInvalidForRun
-from ..schema import SqlEventLogStorageMetadata
-from ..sql_event_log import SqlEventLogStorage
+from ..buffer import EventLogBuffer
+from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..sql_event_log import SqlEventLogStorage, _deserialize_events, _events_of_types_query
+
+
+DEFAULT_FLUSH_INTERVAL_MS = 100
+
+MAX_CACHED_ENGINES = 16
+'''The number of per-run database engines that are kept. The least recently used engine is disposed
+of when another is needed.'''
 
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(
+        self, base_dir, inst_data=None, batch_size=1, flush_interval_ms=DEFAULT_FLUSH_INTERVAL_MS
+    ):
         '''Note that idempotent initialization of the SQLite database is done on a per-run_id
-        basis in the body of connect, since each run is stored in a separate database.'''
+        basis in the body of connect, since each run is stored in a separate database.
+
+        When batch_size is greater than 1, events are buffered in memory and written in batches of
+        up to batch_size events, at least every flush_interval_ms milliseconds. Events that mark
+        the start or end of a run or step are always written immediately, along with any events
+        buffered before them.'''
         self._base_dir = os.path.abspath(check.str_param(base_dir, 'base_dir'))
         mkdir_p(self._base_dir)
 
-        self._watchers = defaultdict(dict)
+        check.int_param(batch_size, 'batch_size')
+        check.int_param(flush_interval_ms, 'flush_interval_ms')
+        self._event_buffer = (
+            EventLogBuffer(
+                super(SqliteEventLogStorage, self).store_events,
+                batch_size,
+                flush_interval_ms / 1000.0,
+            )
+            if batch_size > 1
+            else None
+        )
+
+        self._alembic_config = get_alembic_config(__file__)
+
+        self._engines = OrderedDict()
+        self._engines_pid = os.getpid()
+        self._engines_lock = threading.Lock()
+
+        # Every watcher of a run shares a single tail of its event log
+        self._tails = {}
+        self._tails_lock = threading.Lock()
         self._obs = Observer()
         self._obs.start()
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
@@ -60,7 +97,14 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return SystemNamedDict('SqliteEventLogStorageConfig', {'base_dir': Field(String)})
+        return SystemNamedDict(
+            'SqliteEventLogStorageConfig',
+            {
+                'base_dir': Field(String),
+                'batch_size': Field(Int, is_optional=True),
+                'flush_interval_ms': Field(Int, is_optional=True),
+            },
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value, **kwargs):
@@ -84,35 +128,123 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         except (db.exc.DatabaseError, sqlite3.DatabaseError) as exc:
             six.raise_from(DagsterEventLogInvalidForRun(run_id=run_id), exc)
 
-        alembic_config = get_alembic_config(__file__)
         conn = engine.connect()
         try:
-            stamp_alembic_rev(alembic_config, conn)
+            stamp_alembic_rev(self._alembic_config, conn)
         finally:
             conn.close()
 
+    def _get_engine(self, run_id):
+        with self._engines_lock:
+            # Engines must not be shared with a forked process
+            if self._engines_pid != os.getpid():
+                self._engines = OrderedDict()
+                self._engines_pid = os.getpid()
+
+            engine = self._engines.pop(run_id, None)
+            if engine is None:
+                # Connections are deliberately not pooled: sqlite only checkpoints the write-ahead
+                # log into the database file, which watchers observe, once the last connection to
+                # it is closed
+                engine = create_engine(self.conn_string_for_run_id(run_id), poolclass=NullPool)
+                if not os.path.exists(self.path_for_run_id(run_id)):
+                    self._initdb(engine, run_id)
+
+                while len(self._engines) >= MAX_CACHED_ENGINES:
+                    _, evicted_engine = self._engines.popitem(last=False)
+                    evicted_engine.dispose()
+
+            self._engines[run_id] = engine
+            return engine
+
+    def _dispose_engines(self):
+        with self._engines_lock:
+            if self._engines_pid == os.getpid():
+                for engine in self._engines.values():
+                    engine.dispose()
+            self._engines = OrderedDict()
+            self._engines_pid = os.getpid()
+
     @contextmanager
     def connect(self, run_id=None):
         check.str_param(run_id, 'run_id')
 
-        conn_string = self.conn_string_for_run_id(run_id)
-        engine = create_engine(conn_string, poolclass=NullPool)
-
-        if not os.path.exists(self.path_for_run_id(run_id)):
-            self._initdb(engine, run_id)
-
-        conn = engine.connect()
+        conn = self._get_engine(run_id).connect()
         try:
             with handle_schema_errors(
                 conn,
-                get_alembic_config(__file__),
+                self._alembic_config,
                 msg='SqliteEventLogStorage for run {run_id}'.format(run_id=run_id),
             ):
                 yield conn
         finally:
             conn.close()
 
+    def store_event(self, event):
+        if self._event_buffer is None:
+            return super(SqliteEventLogStorage, self).store_event(event)
+
+        self._event_buffer.add(event)
+
+    def flush(self):
+        '''Write any buffered events.'''
+        if self._event_buffer is not None:
+            self._event_buffer.flush()
+
+    def get_logs_for_run(self, run_id, cursor=-1, limit=None):
+        self.flush()
+        return super(SqliteEventLogStorage, self).get_logs_for_run(run_id, cursor, limit)
+
+    def get_event_count(self, run_id):
+        self.flush()
+        return super(SqliteEventLogStorage, self).get_event_count(run_id)
+
+    def get_stats_for_run(self, run_id):
+        self.flush()
+        return super(SqliteEventLogStorage, self).get_stats_for_run(run_id)
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        # Each run is stored in its own database, so there is no single query to make
+        self.flush()
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_events_for_runs(self, run_ids, event_types):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        check.list_param(event_types, 'event_types', of_type=DagsterEventType)
+        # Each run is stored in its own database, so each is queried separately
+        self.flush()
+
+        events_by_run_id = {}
+        for run_id in run_ids:
+            query = _events_of_types_query(event_types).where(
+                SqlEventLogStorageTable.c.run_id == run_id
+            )
+            with self.connect(run_id) as conn:
+                results = conn.execute(query).fetchall()
+            events_by_run_id[run_id] = _deserialize_events(
+                run_id, [result.event for result in results]
+            )
+
+        return events_by_run_id
+
+    def delete_events(self, run_id):
+        self.flush()
+        return super(SqliteEventLogStorage, self).delete_events(run_id)
+
+    def dispose(self):
+        if self._event_buffer is not None:
+            self._event_buffer.close()
+
+        self._dispose_engines()
+
     def wipe(self):
+        if self._event_buffer is not None:
+            self._event_buffer.clear()
+
+        # The databases are recreated and initialized when next connected to
+        self._dispose_engines()
+
         for filename in (
             glob.glob(os.path.join(self._base_dir, '*.db'))
             + glob.glob(os.path.join(self._base_dir, '*.db-wal'))
@@ -121,43 +253,120 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
             os.unlink(filename)
 
     def watch(self, run_id, start_cursor, callback):
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, start_cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, True),
-        )
+        while True:
+            with self._tails_lock:
+                tail = self._tails.get(run_id)
+                is_new_tail = tail is None or tail.is_closed
+                if is_new_tail:
+                    tail = SqliteEventLogStorageWatchdog(self, run_id, start_cursor)
+                    # Each tail is dispatched only the changes to its own run's database
+                    tail.watch = self._obs.schedule(tail, self._base_dir, False)
+                    self._tails[run_id] = tail
+
+            # The last watcher of the tail may have ended its watch in the meantime
+            if tail.add_callback(callback, start_cursor):
+                break
+
+        if is_new_tail:
+            # Read any events stored before the tail was scheduled
+            tail.process_log()
 
     def end_watch(self, run_id, handler):
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)
-            del self._watchers[run_id][handler]
+        with self._tails_lock:
+            tail = self._tails.get(run_id)
+
+        # The tail's lock is never acquired while holding the lock on the tails, since watchers
+        # may end their watch from their callbacks
+        if tail is None or not tail.remove_callback(handler):
+            return
+
+        with self._tails_lock:
+            if self._tails.get(run_id) is tail:
+                del self._tails[run_id]
+        self._obs.remove_handler_for_watch(tail, tail.watch)
 
 
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(self, event_log_storage, run_id, callback, start_cursor, **kwargs):
+    '''Tails the event log of a run for any number of watchers.
+
+    Each new event is read from the database once, however many watchers there are, and passed to
+    every watcher that has not yet seen it. Watchers that start watching from an earlier cursor
+    than the tail has read to are first caught up on the events they missed.'''
+
+    def __init__(self, event_log_storage, run_id, start_cursor, **kwargs):
         self._event_log_storage = check.inst_param(
             event_log_storage, 'event_log_storage', SqliteEventLogStorage
         )
         self._run_id = check.str_param(run_id, 'run_id')
-        self._cb = check.callable_param(callback, 'callback')
         self._log_path = event_log_storage.path_for_run_id(run_id)
         self._cursor = start_cursor if start_cursor is not None else -1
+        self._callback_cursors = OrderedDict()
+        self._is_closed = False
+        # Reentrant, since callbacks may end their own watch
+        self._lock = threading.RLock()
+        self.watch = None
         super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
 
-    def _process_log(self):
-        events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
-        self._cursor += len(events)
-        for event in events:
-            status = self._cb(event)
+    def add_callback(self, callback, start_cursor):
+        '''Returns False if the tail has been closed, in which case a new tail is needed.'''
+        check.callable_param(callback, 'callback')
+        start_cursor = start_cursor if start_cursor is not None else -1
+
+        with self._lock:
+            if self._is_closed:
+                return False
+
+            self._callback_cursors[callback] = start_cursor
+            if start_cursor < self._cursor:
+                events = self._event_log_storage.get_logs_for_run(
+                    self._run_id, start_cursor, limit=self._cursor - start_cursor
+                )
+                self._send_events(callback, start_cursor + 1, events)
+
+            return True
+
+    @property
+    def is_closed(self):
+        return self._is_closed
+
+    def remove_callback(self, callback):
+        '''Returns True if no callbacks remain, in which case the tail is closed.'''
+        with self._lock:
+            if self._is_closed or callback not in self._callback_cursors:
+                return False
+
+            del self._callback_cursors[callback]
+            self._is_closed = not self._callback_cursors
+            return self._is_closed
+
+    def _send_events(self, callback, first_index, events):
+        for index, event in enumerate(events, first_index):
+            if callback not in self._callback_cursors:
+                return
+            if index <= self._callback_cursors[callback]:
+                continue
+
+            self._callback_cursors[callback] = index
+            status = callback(event)
 
             if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
-                self._event_log_storage.end_watch(self._run_id, self._cb)
+                self._event_log_storage.end_watch(self._run_id, callback)
+
+    def process_log(self):
+        with self._lock:
+            if self._is_closed:
+                return
+
+            events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
+            first_index = self._cursor + 1
+            self._cursor += len(events)
+            for callback in list(self._callback_cursors.keys()):
+                self._send_events(callback, first_index, events)
 
     def on_created(self, event):
         check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        self.process_log()
 
     def on_modified(self, event):
         check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        self.process_log()
@@ -1,3 +1,5 @@
+import os
+import time
 from abc import ABCMeta
 
 import six
@@ -6,18 +8,47 @@ from dagster import check
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.types.runtime.runtime_type import RuntimeType, resolve_to_runtime_type
 
-from .object_store import FilesystemObjectStore, ObjectStore
+from .object_store import (
+    DEFAULT_SERIALIZATION_STRATEGY,
+    FilesystemObjectStore,
+    ObjectStore,
+)
 from .type_storage import TypeStoragePluginRegistry
 
+REFERENCE_SUFFIX = '.ref'
+
+BLOB_MIN_AGE_SECONDS = 24 * 60 * 60
+'''The number of seconds for which a blob is kept after it was last written, even if no run refers
+to it -- default 1 day. This keeps the blobs that runs are writing, or have just found already
+written, but have not yet recorded references to.'''
+
 
 class IntermediateStore(six.with_metaclass(ABCMeta)):
-    def __init__(self, object_store, root_for_run_id, run_id, type_storage_plugin_registry):
+    def __init__(
+        self, object_store, root_for_run_id, run_id, type_storage_plugin_registry, blob_root=None
+    ):
+        '''Create an IntermediateStore.
+
+        Args:
+            blob_root (Optional[str]) -- If set, objects are stored in content-addressed mode: each
+                object is written once under blob_root, at a key derived from a hash of its
+                serialized content, and each run records only a small reference to it, holding the
+                key of the object relative to blob_root. Copying an object from a previous run then
+                copies the reference rather than the object. Removing an object removes only the
+                reference: objects under blob_root that no run refers to any longer are removed by
+                remove_unreferenced_blobs.
+        '''
         self.root_for_run_id = check.callable_param(root_for_run_id, 'root_for_run_id')
         self.run_id = check.str_param(run_id, 'run_id')
         self.object_store = check.inst_param(object_store, 'object_store', ObjectStore)
         self.type_storage_plugin_registry = check.inst_param(
             type_storage_plugin_registry, 'type_storage_plugin_registry', TypeStoragePluginRegistry
         )
+        self.blob_root = check.opt_str_param(blob_root, 'blob_root')
+
+    @property
+    def is_content_addressed(self):
+        return self.blob_root is not None
 
     @property
     def root(self):
@@ -38,9 +69,34 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
-        return self.object_store.set_object(
-            key, obj, serialization_strategy=runtime_type.serialization_strategy
+        if not self.is_content_addressed:
+            return self.object_store.set_object(
+                key, obj, serialization_strategy=runtime_type.serialization_strategy
+            )
+
+        operation = self.object_store.set_object_by_content(
+            self.blob_root, obj, serialization_strategy=runtime_type.serialization_strategy
+        )
+        if self.object_store.has_object(key):
+            self.object_store.rm_object(key)
+        self.object_store.set_object(
+            _reference_key(key), self._blob_name(operation.key), DEFAULT_SERIALIZATION_STRATEGY
+        )
+        return operation
+
+    def _blob_name(self, blob_key):
+        prefix = self.object_store.key_for_paths([self.blob_root, ''])
+        check.invariant(
+            blob_key.startswith(prefix),
+            'Expected key {blob_key} to be under blob root {blob_root}'.format(
+                blob_key=blob_key, blob_root=self.blob_root
+            ),
         )
+        return blob_key[len(prefix) :]
+
+    def _blob_key(self, reference_key):
+        blob_name = self.object_store.get_object(reference_key, DEFAULT_SERIALIZATION_STRATEGY).obj
+        return self.object_store.key_for_paths([self.blob_root, blob_name])
 
     def get_object(self, context, runtime_type, paths):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
@@ -48,6 +104,8 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.param_invariant(len(paths) > 0, 'paths')
         check.inst_param(runtime_type, 'runtime_type', RuntimeType)
         key = self.object_store.key_for_paths([self.root] + paths)
+        if self.is_content_addressed and self.object_store.has_object(_reference_key(key)):
+            key = self._blob_key(_reference_key(key))
         return self.object_store.get_object(
             key, serialization_strategy=runtime_type.serialization_strategy
         )
@@ -57,6 +115,8 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
+        if self.is_content_addressed and self.object_store.has_object(_reference_key(key)):
+            return True
         return self.object_store.has_object(key)
 
     def rm_object(self, context, paths):
@@ -64,7 +124,11 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         check.list_param(paths, 'paths', of_type=str)
         check.param_invariant(len(paths) > 0, 'paths')
         key = self.object_store.key_for_paths([self.root] + paths)
-        self.object_store.rm_object(key)
+        # Objects under the blob root may be referenced by other runs, so only the reference to
+        # them is removed, see remove_unreferenced_blobs
+        if self.is_content_addressed:
+            self.object_store.rm_object(_reference_key(key))
+        return self.object_store.rm_object(key)
 
     def copy_object_from_prev_run(self, _context, previous_run_id, paths):
         check.str_param(previous_run_id, 'previous_run_id')
@@ -74,6 +138,9 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         src = self.object_store.key_for_paths([self.root_for_run_id(previous_run_id)] + paths)
         dst = self.object_store.key_for_paths([self.root] + paths)
 
+        if self.is_content_addressed and self.object_store.has_object(_reference_key(src)):
+            return self.object_store.cp_object(_reference_key(src), _reference_key(dst))
+
         return self.object_store.cp_object(src, dst)
 
     def set_value(self, obj, context, runtime_type, paths):
@@ -121,7 +188,72 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         )
 
 
-def build_fs_intermediate_store(root_for_run_id, run_id, type_storage_plugin_registry=None):
+def _reference_key(key):
+    return key + REFERENCE_SUFFIX
+
+
+def remove_unreferenced_blobs(blob_root, reference_root, min_age_seconds=BLOB_MIN_AGE_SECONDS):
+    '''Remove the blobs written by content-addressed filesystem intermediate stores that no run
+    refers to any longer, e.g. because the runs that wrote them were deleted or because their
+    intermediates were removed by the gc_intermediates executor option.
+
+    Blobs written or reused within the last min_age_seconds are kept, so that it is safe to remove
+    blobs while runs are executing, as are the blobs that are referred to by any reference under
+    reference_root.
+
+    Args:
+        blob_root (str): The directory in which the blobs are stored.
+        reference_root (str): A directory under which every run that may refer to blobs under
+            blob_root stores its intermediates, e.g. the storage directory of an instance.
+        min_age_seconds (Optional[float]): The number of seconds for which blobs are kept after
+            they were last written -- default 1 day.
+
+    Returns:
+        List[str]: The paths of the blobs that were removed.
+    '''
+    check.str_param(blob_root, 'blob_root')
+    check.str_param(reference_root, 'reference_root')
+    check.numeric_param(min_age_seconds, 'min_age_seconds')
+
+    if not os.path.isdir(blob_root):
+        return []
+
+    # Blobs that are written after this are kept, whether or not their references have been found
+    cutoff = time.time() - min_age_seconds
+
+    blob_root = os.path.abspath(blob_root)
+    referenced = set()
+    for dirpath, dirnames, filenames in os.walk(reference_root):
+        # The blob root may be under the reference root, e.g. when the filesystem system storage is
+        # configured with a base_dir
+        dirnames[:] = [
+            dirname
+            for dirname in dirnames
+            if os.path.abspath(os.path.join(dirpath, dirname)) != blob_root
+        ]
+        for filename in filenames:
+            if filename.endswith(REFERENCE_SUFFIX):
+                blob_name = DEFAULT_SERIALIZATION_STRATEGY.deserialize_from_file(
+                    os.path.join(dirpath, filename)
+                )
+                referenced.add(os.path.abspath(os.path.join(blob_root, blob_name)))
+
+    removed = []
+    for filename in os.listdir(blob_root):
+        path = os.path.join(blob_root, filename)
+        if path in referenced or not os.path.isfile(path) or os.path.getmtime(path) >= cutoff:
+            continue
+        # Temporary files are left behind by processes that died while writing a blob, and are
+        # never referenced
+        os.unlink(path)
+        removed.append(path)
+
+    return removed
+
+
+def build_fs_intermediate_store(
+    root_for_run_id, run_id, type_storage_plugin_registry=None, blob_root=None
+):
     return IntermediateStore(
         FilesystemObjectStore(),
         root_for_run_id,
@@ -129,4 +261,5 @@ def build_fs_intermediate_store(root_for_run_id, run_id, type_storage_plugin_reg
         type_storage_plugin_registry
         if type_storage_plugin_registry
         else TypeStoragePluginRegistry(types_to_register={}),
+        blob_root=blob_root,
     )
@@ -23,6 +23,11 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def has_intermediate(self, context, step_output_handle):
         pass
 
+    def rm_intermediate(self, context, step_output_handle):
+        '''Remove an intermediate once every step that consumes it has succeeded, when the
+        executor is configured with ``gc_intermediates``. Intermediates managers that don't
+        implement this keep every intermediate.'''
+
     @abstractmethod
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         pass
@@ -31,6 +36,17 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def is_persistent(self):
         pass
 
+    @property
+    def max_concurrent_reads(self):
+        '''The maximum number of intermediates to read at once when loading the inputs of a step.'''
+        return 1
+
+    @property
+    def prefetch_inputs(self):
+        '''Whether engines should read the inputs of a step in the background while the steps
+        before it are still executing.'''
+        return False
+
     def all_inputs_covered(self, context, step):
         return len(self.uncovered_inputs(context, step)) == 0
 
@@ -75,6 +91,11 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         return step_output_handle in self.values
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        self.values.pop(step_output_handle, None)
+
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
@@ -84,10 +105,13 @@ class InMemoryIntermediatesManager(IntermediatesManager):
 
 
 class IntermediateStoreIntermediatesManager(IntermediatesManager):
-    def __init__(self, intermediate_store):
+    def __init__(self, intermediate_store, max_concurrent_reads=1, prefetch_inputs=False):
         self._intermediate_store = check.inst_param(
             intermediate_store, 'intermediate_store', IntermediateStore
         )
+        self._max_concurrent_reads = check.int_param(max_concurrent_reads, 'max_concurrent_reads')
+        check.param_invariant(max_concurrent_reads > 0, 'max_concurrent_reads')
+        self._prefetch_inputs = check.bool_param(prefetch_inputs, 'prefetch_inputs')
 
     def _get_paths(self, step_output_handle):
         return ['intermediates', step_output_handle.step_key, step_output_handle.output_name]
@@ -126,6 +150,14 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
 
         return self._intermediate_store.has_object(context, self._get_paths(step_output_handle))
 
+    def rm_intermediate(self, context, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        # With content-addressed storage, this removes only the run's reference to the object,
+        # which other runs may still refer to
+        return self._intermediate_store.rm_object(context, self._get_paths(step_output_handle))
+
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         return self._intermediate_store.copy_object_from_prev_run(
             context, previous_run_id, self._get_paths(step_output_handle)
@@ -134,3 +166,11 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
     @property
     def is_persistent(self):
         return True
+
+    @property
+    def max_concurrent_reads(self):
+        return self._max_concurrent_reads
+
+    @property
+    def prefetch_inputs(self):
+        return self._prefetch_inputs
@@ -8,7 +8,7 @@ from watchdog.observers.polling import PollingObserver
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.core.types import String
+from dagster.core.types import Bool, String
 from dagster.core.types.config import Field
 from dagster.utils import ensure_dir, touch_file
 
@@ -28,8 +28,9 @@ MAX_FILENAME_LENGTH = 255
 
 
 class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(self, base_dir, inst_data=None, capture_in_process=False):
         self._base_dir = base_dir
+        self._capture_in_process = check.bool_param(capture_in_process, 'capture_in_process')
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
@@ -39,12 +40,21 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return SystemNamedDict('SqliteEventLogStorageConfig', {'base_dir': Field(String)})
+        return SystemNamedDict(
+            'SqliteEventLogStorageConfig',
+            {
+                'base_dir': Field(String),
+                'capture_in_process': Field(Bool, is_optional=True, default_value=False),
+            },
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value, **kwargs):
         return LocalComputeLogManager(inst_data=inst_data, **dict(config_value, **kwargs))
 
+    def capture_in_process(self, _step_context):
+        return self._capture_in_process
+
     def _run_directory(self, run_id):
         return os.path.join(self._base_dir, run_id, 'compute_logs')
 
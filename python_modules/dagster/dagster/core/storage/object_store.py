@@ -1,6 +1,8 @@
+import hashlib
 import logging
 import os
 import shutil
+import tempfile
 from abc import ABCMeta, abstractmethod
 
 import six
@@ -67,6 +69,17 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         '''Joins path fragments into a key using the object-store specific path separator.'''
         return self.sep.join(path_fragments)
 
+    def set_object_by_content(self, blob_root, obj, serialization_strategy=None):
+        '''Implement this method to set an object in the object store at a key under blob_root
+        derived from a hash of its serialized content.
+
+        If an object with the same content already exists, it should not be written again. Should
+        return an ObjectStoreOperation with op==ObjectStoreOperationType.SET_OBJECT on success,
+        whose key is the key at which the object can be retrieved.'''
+        check.not_implemented(
+            'Object store {name} does not support content-addressed objects'.format(name=self.name)
+        )
+
 
 DEFAULT_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
 
@@ -161,6 +174,50 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
             object_store_name=self.name,
         )
 
+    def set_object_by_content(
+        self, blob_root, obj, serialization_strategy=DEFAULT_SERIALIZATION_STRATEGY
+    ):
+        check.str_param(blob_root, 'blob_root')
+        # obj is an arbitrary Python object
+        check.inst_param(serialization_strategy, 'serialization_strategy', SerializationStrategy)
+
+        mkdir_p(blob_root)
+
+        # Serialize next to the blobs so that the finished file can be renamed into place
+        fd, temp_key = tempfile.mkstemp(prefix=TEMP_BLOB_PREFIX, dir=blob_root)
+        os.close(fd)
+        try:
+            key = os.path.join(
+                blob_root, _serialize_and_hash(serialization_strategy, obj, temp_key)
+            )
+            if os.path.exists(key):
+                os.unlink(temp_key)
+                # Blobs are only swept once they have been unused for a while, see
+                # remove_unreferenced_blobs
+                os.utime(key, None)
+            else:
+                try:
+                    os.rename(temp_key, key)
+                except OSError:
+                    # Another process wrote the same content first, and os.rename does not replace
+                    # existing files on Windows
+                    if not os.path.exists(key):
+                        raise
+                    os.unlink(temp_key)
+        except Exception:  # pylint: disable=broad-except
+            if os.path.exists(temp_key):
+                os.unlink(temp_key)
+            raise
+
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT,
+            key=key,
+            dest_key=None,
+            obj=obj,
+            serialization_strategy_name=serialization_strategy.name,
+            object_store_name=self.name,
+        )
+
     def uri_for_key(self, key, protocol=None):
         check.str_param(key, 'key')
         protocol = check.opt_str_param(protocol, 'protocol', default='file://')
@@ -169,3 +226,69 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
     def key_for_paths(self, path_fragments):
         '''Joins path fragments into a key using the object-store specific path separator.'''
         return os.path.join(*path_fragments)
+
+
+TEMP_BLOB_PREFIX = '.tmp-'
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class _HashingWriter(object):
+    '''Wraps a binary file opened for writing, hashing everything written to it.
+
+    Serialization strategies that do anything but write to the file sequentially, e.g. seek in it or
+    write to its file descriptor, may write bytes that are not hashed. The hash is then incomplete.
+    '''
+
+    def __init__(self, write_file_obj):
+        self._file = write_file_obj
+        self._sha256 = hashlib.sha256()
+        self.is_complete = True
+
+    def write(self, data):
+        self._sha256.update(data)
+        return self._file.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        return self._file.flush()
+
+    def tell(self):
+        return self._file.tell()
+
+    def __getattr__(self, name):
+        self.is_complete = False
+        return getattr(self._file, name)
+
+    def hexdigest(self):
+        return self._sha256.hexdigest()
+
+
+def _serialize_and_hash(serialization_strategy, obj, path):
+    '''Serialize obj to path, returning the sha256 of the file.
+
+    The content is hashed as it is written, rather than read back once written, unless the
+    serialization strategy writes text or does not write to the file sequentially.'''
+    overrides_serialize_to_file = six.get_unbound_function(
+        type(serialization_strategy).serialize_to_file
+    ) is not six.get_unbound_function(SerializationStrategy.serialize_to_file)
+    if overrides_serialize_to_file or 'b' not in serialization_strategy.write_mode:
+        serialization_strategy.serialize_to_file(obj, path)
+        return _hash_file(path)
+
+    with open(path, serialization_strategy.write_mode) as write_file_obj:
+        writer = _HashingWriter(write_file_obj)
+        serialization_strategy.serialize(obj, writer)
+
+    return writer.hexdigest() if writer.is_complete else _hash_file(path)
+
+
+def _hash_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
@@ -20,12 +20,20 @@ class LocalArtifactStorage(ConfigurableClass):
     def base_dir(self):
         return self._base_dir
 
+    @property
+    def storage_dir(self):
+        return os.path.join(self.base_dir, 'storage')
+
     def file_manager_dir(self, run_id):
         check.str_param(run_id, 'run_id')
-        return os.path.join(self.base_dir, 'storage', run_id, 'files')
+        return os.path.join(self.storage_dir, run_id, 'files')
 
     def intermediates_dir(self, run_id):
-        return os.path.join(self.base_dir, 'storage', run_id, '')
+        return os.path.join(self.storage_dir, run_id, '')
+
+    @property
+    def blobs_dir(self):
+        return os.path.join(self.base_dir, 'blobs')
 
     @property
     def schedules_dir(self):
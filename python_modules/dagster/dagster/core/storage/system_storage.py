@@ -1,5 +1,7 @@
+import os
+
 from dagster.core.definitions.system_storage import SystemStorageData, system_storage
-from dagster.core.types import String
+from dagster.core.types import Bool, Int, String
 from dagster.core.types.config import Field
 
 from .file_manager import LocalFileManager
@@ -36,7 +38,14 @@ def mem_system_storage(init_context):
 
 
 @system_storage(
-    name='filesystem', is_persistent=True, config={'base_dir': Field(String, is_optional=True)}
+    name='filesystem',
+    is_persistent=True,
+    config={
+        'base_dir': Field(String, is_optional=True),
+        'content_addressed': Field(Bool, is_optional=True, default_value=False),
+        'max_concurrent_reads': Field(Int, is_optional=True, default_value=1),
+        'prefetch_inputs': Field(Bool, is_optional=True, default_value=False),
+    },
 )
 def fs_system_storage(init_context):
     '''The default filesystem system storage.
@@ -53,14 +62,28 @@ def fs_system_storage(init_context):
 
     You may omit the ``base_dir`` config value, in which case the filesystem storage will use
     the :py:class:`DagsterInstance`-provided default.
+
+    If ``content_addressed`` is set, intermediates are written once to a blob directory shared by
+    all runs, named by a hash of their contents, and each run records only references to them.
+    Re-executing a run then links the intermediates it reuses rather than copying them. Removing
+    an intermediate, e.g. with the ``gc_intermediates`` executor option, removes only the reference
+    to it: use :py:meth:`DagsterInstance.remove_unreferenced_blobs`, or
+    ``dagster.core.storage.intermediate_store.remove_unreferenced_blobs`` when ``base_dir`` is set,
+    to remove the intermediates that no run refers to any longer.
+
+    ``max_concurrent_reads`` sets the number of intermediates that are read at once when loading
+    the inputs of a step. If ``prefetch_inputs`` is set, engines that execute steps one after
+    another in a process read the inputs of the next step while the current one is executing.
     '''
     override_dir = init_context.system_storage_config.get('base_dir')
+    content_addressed = init_context.system_storage_config.get('content_addressed')
     if override_dir:
         file_manager = LocalFileManager(override_dir)
         intermediate_store = build_fs_intermediate_store(
             root_for_run_id=lambda _: override_dir,
             run_id=init_context.pipeline_run.run_id,
             type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+            blob_root=os.path.join(override_dir, 'blobs') if content_addressed else None,
         )
     else:
         file_manager = LocalFileManager.for_instance(
@@ -70,11 +93,16 @@ def fs_system_storage(init_context):
             init_context.instance.intermediates_directory,
             run_id=init_context.pipeline_run.run_id,
             type_storage_plugin_registry=init_context.type_storage_plugin_registry,
+            blob_root=init_context.instance.blobs_directory() if content_addressed else None,
         )
 
     return SystemStorageData(
         file_manager=file_manager,
-        intermediates_manager=IntermediateStoreIntermediatesManager(intermediate_store),
+        intermediates_manager=IntermediateStoreIntermediatesManager(
+            intermediate_store,
+            max_concurrent_reads=init_context.system_storage_config['max_concurrent_reads'],
+            prefetch_inputs=init_context.system_storage_config['prefetch_inputs'],
+        ),
     )
 
 
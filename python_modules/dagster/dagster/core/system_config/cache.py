@@ -0,0 +1,231 @@
+'''Memoization of environment config processing.
+
+Validating and processing the environment config of a large pipeline is expensive, and the same
+config is processed many times over the course of a run, e.g. when the execution plan is built,
+when the pipeline context is created, and whenever dagit checks whether the config is valid.
+
+Every caller is handed its own copy of a cached value, since user code, e.g. a solid that updates
+its solid_config in place, is free to mutate the config it is given. The caches hold only weak
+references to the pipelines for which they hold entries.
+'''
+import threading
+import weakref
+from collections import OrderedDict, namedtuple
+
+import six
+
+from dagster import check
+
+DEFAULT_MAXSIZE = 64
+'''The number of entries kept by each cache. The least recently used entry is evicted when another
+is added.'''
+
+
+class CacheInfo(namedtuple('_CacheInfo', 'hits misses maxsize currsize')):
+    '''The statistics of a BoundedCache, after functools.lru_cache.'''
+
+
+class BoundedCache(object):
+    '''A thread-safe cache that keeps the maxsize most recently used entries.
+
+    Args:
+        maxsize (int): The maximum number of entries to keep.
+    '''
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._maxsize = check.int_param(maxsize, 'maxsize')
+        check.param_invariant(maxsize > 0, 'maxsize')
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_compute(self, key, compute_fn):
+        '''Return the value cached for key, computing and caching it if it is not cached.
+
+        Args:
+            key (Optional[Hashable]): The key for the value. If None, the value cannot be cached and
+                is computed on every call.
+            compute_fn (Callable[[], Any]): Computes the value.
+        '''
+        check.callable_param(compute_fn, 'compute_fn')
+
+        if key is not None:
+            with self._lock:
+                if key in self._entries:
+                    value = self._entries.pop(key)
+                    self._entries[key] = value
+                    self._hits += 1
+                    return value
+
+        # Computed outside of the lock, so that an expensive computation does not block others
+        value = compute_fn()
+
+        with self._lock:
+            self._misses += 1
+            if key is not None:
+                self._entries.pop(key, None)
+                while len(self._entries) >= self._maxsize:
+                    self._entries.popitem(last=False)
+                self._entries[key] = value
+
+        return value
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def clear(self):
+        '''Discard every entry and reset the statistics.'''
+        with self._lock:
+            self._entries = OrderedDict()
+            self._hits = 0
+            self._misses = 0
+
+
+class OwnedCache(object):
+    '''A thread-safe cache that keeps a separate BoundedCache for each of the objects that own its
+    entries, holding only a weak reference to each owner.
+
+    The entries for an owner are discarded along with the owner once nothing else refers to it, so
+    values must not refer to their owners.
+
+    Args:
+        maxsize (int): The maximum number of entries to keep for each owner.
+    '''
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._maxsize = check.int_param(maxsize, 'maxsize')
+        check.param_invariant(maxsize > 0, 'maxsize')
+
+        self._caches = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, owner, key, compute_fn):
+        '''Return the value cached for key among the entries of owner, computing and caching it if
+        it is not cached. See BoundedCache.get_or_compute.'''
+        with self._lock:
+            cache = self._caches.get(owner)
+            if cache is None:
+                cache = BoundedCache(self._maxsize)
+                self._caches[owner] = cache
+
+        return cache.get_or_compute(key, compute_fn)
+
+    def cache_info(self):
+        '''The statistics of the caches of every owner that is still alive, summed.'''
+        with self._lock:
+            caches = list(self._caches.values())
+
+        infos = [cache.cache_info() for cache in caches]
+        return CacheInfo(
+            hits=sum(info.hits for info in infos),
+            misses=sum(info.misses for info in infos),
+            maxsize=self._maxsize,
+            currsize=sum(info.currsize for info in infos),
+        )
+
+    def clear(self):
+        '''Discard every entry and reset the statistics.'''
+        with self._lock:
+            self._caches = weakref.WeakKeyDictionary()
+
+
+class _Unfreezable(Exception):
+    pass
+
+
+_SCALAR_TYPES = six.string_types + six.integer_types + (bool, float, type(None))
+
+
+def _freeze(value):
+    # The type of every scalar is part of its frozen form, so that e.g. True and 1, which are equal
+    # and hash equally but are not the same config, are not confused
+    if isinstance(value, dict):
+        return (dict, frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    if isinstance(value, _SCALAR_TYPES):
+        return (type(value), value)
+
+    raise _Unfreezable()
+
+
+def freeze_environment_dict(environment_dict):
+    '''Build a hashable canonical form of an environment dict, which compares equal to the frozen
+    form of any equal environment dict, regardless of the order of its keys.
+
+    Returns:
+        Optional[Hashable]: The frozen environment dict, or None if it contains values other than
+            dicts, lists and scalars, and so cannot be frozen.
+    '''
+    try:
+        return _freeze(environment_dict)
+    except _Unfreezable:
+        return None
+
+
+def copy_config_value(value):
+    '''Copy the dicts, lists and tuples, including namedtuples, that make up a config value, sharing
+    any other values it holds.'''
+    if isinstance(value, dict):
+        return type(value)((k, copy_config_value(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [copy_config_value(item) for item in value]
+    if isinstance(value, tuple):
+        items = [copy_config_value(item) for item in value]
+        # Rebuilding a namedtuple with _make skips the checks in its __new__
+        return value._make(items) if hasattr(value, '_make') else tuple(items)
+    return value
+
+
+PROCESSED_CONFIG_CACHE = BoundedCache()
+'''Caches the EvaluateValueResult of processing an environment dict against an environment type,
+keyed by the environment type and the frozen environment dict.'''
+
+ENVIRONMENT_CONFIG_CACHE = OwnedCache()
+'''Caches the EnvironmentConfig built from an environment dict for a pipeline and mode, owned by the
+pipeline and keyed by the mode and the frozen environment dict.'''
+
+
+def process_environment_config(environment_type, environment_dict):
+    '''Process an environment dict against an environment type, as process_config does.
+
+    The result is cached, keyed by the environment type together with the frozen environment dict.
+    Config types are compared by identity, so results are shared only between callers that process
+    config against the same environment type object. Since anonymous Dict types are interned by
+    their fields for the life of the process, this includes pipelines and modes whose environment
+    types have the same fields.
+
+    Args:
+        environment_type (ConfigType): The environment type of a pipeline and mode.
+        environment_dict (Any): The environment dict to process. As with process_config, values
+            that are not dicts are reported as errors in the result.
+
+    Returns:
+        EvaluateValueResult: The result of processing the environment dict. The value of a
+            successful result is a copy, which the caller is free to mutate.
+    '''
+    from dagster.core.types.config.config_type import ConfigType
+    from dagster.core.types.config.evaluator.evaluate_value_result import EvaluateValueResult
+    from dagster.core.types.config.evaluator.validate import process_config
+
+    check.inst_param(environment_type, 'environment_type', ConfigType)
+
+    frozen_environment_dict = freeze_environment_dict(environment_dict)
+    key = (
+        (environment_type, frozen_environment_dict) if frozen_environment_dict is not None else None
+    )
+    evr = PROCESSED_CONFIG_CACHE.get_or_compute(
+        key, lambda: process_config(environment_type, environment_dict)
+    )
+    if not evr.success:
+        return evr
+
+    return EvaluateValueResult.for_value(copy_config_value(evr.value))
+
+
+def clear_environment_config_caches():
+    PROCESSED_CONFIG_CACHE.clear()
+    ENVIRONMENT_CONFIG_CACHE.clear()
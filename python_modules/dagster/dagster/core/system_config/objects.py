@@ -4,10 +4,18 @@ from collections import namedtuple
 from dagster import check
 from dagster.core.definitions.environment_schema import create_environment_type
 from dagster.core.definitions.pipeline import PipelineDefinition
+from dagster.core.definitions.solid import CompositeSolidDefinition
 from dagster.core.errors import DagsterInvalidConfigError
 from dagster.core.execution.config import IRunConfig, RunConfig
 from dagster.utils import ensure_single_item
 
+from .cache import (
+    ENVIRONMENT_CONFIG_CACHE,
+    copy_config_value,
+    freeze_environment_dict,
+    process_environment_config,
+)
+
 
 class SolidConfig(namedtuple('_SolidConfig', 'config inputs outputs')):
     def __new__(cls, config=None, inputs=None, outputs=None):
@@ -63,9 +71,15 @@ class EnvironmentConfig(
 
     @staticmethod
     def build(pipeline, environment_dict=None, run_config=None):
-        from dagster.core.types.config.evaluator.composite_descent import composite_descent
-        from dagster.core.types.config.evaluator.validate import process_config
-
+        '''Build the EnvironmentConfig for a pipeline from an environment dict.
+
+        Both the processing of the environment dict and, unless the config of some composite solid
+        in the pipeline is mapped by a function that may depend on the run config, the resulting
+        EnvironmentConfig are cached for the pipeline. Building the EnvironmentConfig for an equal
+        environment dict again returns a copy of the cached EnvironmentConfig, so that the config it
+        holds may be mutated, e.g. by a solid that updates its solid_config, without affecting
+        later runs.
+        '''
         check.inst_param(pipeline, 'pipeline', PipelineDefinition)
         environment_dict = check.opt_dict_param(environment_dict, 'environment_dict')
         run_config = check.opt_inst_param(run_config, 'run_config', IRunConfig, default=RunConfig())
@@ -73,27 +87,53 @@ class EnvironmentConfig(
         mode = run_config.mode or pipeline.get_default_mode_name()
         environment_type = create_environment_type(pipeline, mode)
 
-        config_evr = process_config(environment_type, environment_dict)
-        if not config_evr.success:
-            raise DagsterInvalidConfigError(
-                'Error in config for pipeline {}'.format(pipeline.name),
-                config_evr.errors,
-                environment_dict,
+        frozen_environment_dict = freeze_environment_dict(environment_dict)
+        if frozen_environment_dict is None or _has_config_mappings(pipeline):
+            return _build_environment_config(
+                pipeline, environment_type, environment_dict, run_config
             )
 
-        config_value = config_evr.value
+        environment_config = ENVIRONMENT_CONFIG_CACHE.get_or_compute(
+            pipeline,
+            (mode, frozen_environment_dict),
+            lambda: _build_environment_config(
+                pipeline, environment_type, environment_dict, run_config
+            ),
+        )
+        return copy_config_value(environment_config)._replace(original_config_dict=environment_dict)
+
+
+def _has_config_mappings(pipeline):
+    return any(
+        isinstance(solid_def, CompositeSolidDefinition) and solid_def.config_mapping is not None
+        for solid_def in pipeline.all_solid_defs
+    )
+
 
-        solid_config_dict = composite_descent(pipeline, config_value.get('solids', {}), run_config)
+def _build_environment_config(pipeline, environment_type, environment_dict, run_config):
+    from dagster.core.types.config.evaluator.composite_descent import composite_descent
 
-        return EnvironmentConfig(
-            solids=solid_config_dict,
-            execution=ExecutionConfig.from_dict(config_value.get('execution')),
-            storage=StorageConfig.from_dict(config_value.get('storage')),
-            loggers=config_value.get('loggers'),
-            original_config_dict=environment_dict,
-            resources=config_value.get('resources'),
+    config_evr = process_environment_config(environment_type, environment_dict)
+    if not config_evr.success:
+        raise DagsterInvalidConfigError(
+            'Error in config for pipeline {}'.format(pipeline.name),
+            config_evr.errors,
+            environment_dict,
         )
 
+    config_value = config_evr.value
+
+    solid_config_dict = composite_descent(pipeline, config_value.get('solids', {}), run_config)
+
+    return EnvironmentConfig(
+        solids=solid_config_dict,
+        execution=ExecutionConfig.from_dict(config_value.get('execution')),
+        storage=StorageConfig.from_dict(config_value.get('storage')),
+        loggers=config_value.get('loggers'),
+        original_config_dict=environment_dict,
+        resources=config_value.get('resources'),
+    )
+
 
 class ExecutionConfig(
     namedtuple('_ExecutionConfig', 'execution_engine_name execution_engine_config')
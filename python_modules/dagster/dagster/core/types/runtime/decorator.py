@@ -12,6 +12,8 @@ def _decorate_as_dagster_type(
     serialization_strategy=None,
     auto_plugins=None,
     type_check=None,
+    type_check_mode=None,
+    type_check_sample_fn=None,
 ):
     runtime_type = define_python_dagster_type(
         name=name,
@@ -22,6 +24,8 @@ def _decorate_as_dagster_type(
         serialization_strategy=serialization_strategy,
         auto_plugins=auto_plugins,
         type_check=type_check,
+        type_check_mode=type_check_mode,
+        type_check_sample_fn=type_check_sample_fn,
     )
 
     register_python_type(bare_cls, runtime_type)
@@ -37,6 +41,8 @@ def dagster_type(
     serialization_strategy=None,
     auto_plugins=None,
     type_check=None,
+    type_check_mode=None,
+    type_check_sample_fn=None,
 ):
     '''Decorate a Python class to turn it into a Dagster type.
     
@@ -75,6 +81,12 @@ def dagster_type(
             return ``True`` if the type check succeds, ``False`` if it fails, or, if additional
             metadata should be emitted along with the type check success or failure, an instance of
             :py:class:`TypeCheck` with the ``success`` field set appropriately.
+        type_check_mode (Optional[TypeCheckMode]): How values of this type are type checked as they
+            are yielded and received by solids. Defaults to ``TypeCheckMode.FULL``. Solids can
+            override it by setting the ``dagster/type_check_mode`` key of their step metadata.
+        type_check_sample_fn (Optional[Callable[[Any], Any]]): If specified, this function is
+            called to draw a sample of a value, e.g. of the rows of a dataframe, which is type
+            checked in place of the value when the type check mode is ``TypeCheckMode.SAMPLE``.
 
     Examples:
 
@@ -116,6 +128,8 @@ def dagster_type(
             serialization_strategy=serialization_strategy,
             auto_plugins=auto_plugins,
             type_check=type_check,
+            type_check_mode=type_check_mode,
+            type_check_sample_fn=type_check_sample_fn,
         )
 
     # check for no args, no parens case
@@ -135,6 +149,8 @@ def as_dagster_type(
     serialization_strategy=None,
     auto_plugins=None,
     type_check=None,
+    type_check_mode=None,
+    type_check_sample_fn=None,
 ):
     '''Create a Dagster type corresponding to an existing Python type.
 
@@ -173,6 +189,12 @@ def as_dagster_type(
             return ``True`` if the type check succeds, ``False`` if it fails, or, if additional
             metadata should be emitted along with the type check success or failure, an instance of
             :py:class:`TypeCheck` with the ``success`` field set appropriately.
+        type_check_mode (Optional[TypeCheckMode]): How values of this type are type checked as they
+            are yielded and received by solids. Defaults to ``TypeCheckMode.FULL``. Solids can
+            override it by setting the ``dagster/type_check_mode`` key of their step metadata.
+        type_check_sample_fn (Optional[Callable[[Any], Any]]): If specified, this function is
+            called to draw a sample of a value, e.g. of the rows of a dataframe, which is type
+            checked in place of the value when the type check mode is ``TypeCheckMode.SAMPLE``.
     
     Examples:
 
@@ -204,4 +226,6 @@ def as_dagster_type(
         serialization_strategy=serialization_strategy,
         auto_plugins=auto_plugins,
         type_check=type_check,
+        type_check_mode=type_check_mode,
+        type_check_sample_fn=type_check_sample_fn,
     )
@@ -4,6 +4,7 @@ from abc import ABCMeta, abstractmethod
 import six
 
 from dagster import check
+from dagster.seven import pickle5
 from dagster.utils import PICKLE_PROTOCOL
 
 
@@ -52,11 +53,37 @@ class SerializationStrategy(six.with_metaclass(ABCMeta)):  # pylint: disable=no-
 
 
 class PickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
-    def __init__(self, name='pickle'):
+    '''Serializes values with pickle.
+
+    Args:
+        name (Optional[str]): The name of the strategy. Default: 'pickle'.
+        protocol (Optional[int]): The pickle protocol to serialize values with. Default:
+            PICKLE_PROTOCOL, which every supported version of Python can read. Protocol 5 writes
+            large buffers that support it, e.g. the data of NumPy arrays, straight from memory to
+            the file, and reads them straight into the deserialized value. It is used where
+            available, i.e. on Python 3.8 or when the pickle5 package is installed, and otherwise
+            falls back to the highest protocol that is available.
+    '''
+
+    def __init__(self, name='pickle', protocol=PICKLE_PROTOCOL):
         super(PickleSerializationStrategy, self).__init__(name)
+        check.int_param(protocol, 'protocol')
+
+        self._pickle = pickle
+        if protocol > pickle.HIGHEST_PROTOCOL:
+            if pickle5 is not None and protocol <= pickle5.HIGHEST_PROTOCOL:
+                self._pickle = pickle5
+            else:
+                protocol = pickle.HIGHEST_PROTOCOL
+        self._protocol = protocol
+
+    @property
+    def protocol(self):
+        return self._protocol
 
     def serialize(self, value, write_file_obj):
-        pickle.dump(value, write_file_obj, PICKLE_PROTOCOL)
+        self._pickle.dump(value, write_file_obj, self._protocol)
 
     def deserialize(self, read_file_obj):
-        return pickle.load(read_file_obj)
+        # Values may have been serialized by a strategy with a different protocol
+        return (pickle5 or pickle).load(read_file_obj)
@@ -3,7 +3,7 @@ from functools import partial
 import six
 
 from dagster import check
-from dagster.core.definitions.events import TypeCheck
+from dagster.core.definitions.events import TypeCheck, TypeCheckMode
 from dagster.core.errors import DagsterInvalidDefinitionError
 from dagster.core.storage.type_storage import TypeStoragePlugin
 from dagster.core.types.config.config_type import List as ConfigList
@@ -39,6 +39,8 @@ class RuntimeType(object):
         output_materialization_config=None,
         serialization_strategy=None,
         auto_plugins=None,
+        type_check_mode=None,
+        type_check_sample_fn=None,
     ):
         self.key = check.str_param(key, 'key')
         self.name = check.opt_str_param(name, 'name')
@@ -59,6 +61,12 @@ class RuntimeType(object):
         )
 
         self.type_check = check.callable_param(type_check_fn, 'type_check_fn')
+        self.type_check_mode = check.opt_inst_param(
+            type_check_mode, 'type_check_mode', TypeCheckMode, TypeCheckMode.FULL
+        )
+        self.type_check_sample_fn = check.opt_callable_param(
+            type_check_sample_fn, 'type_check_sample_fn'
+        )
 
         auto_plugins = check.opt_list_param(auto_plugins, 'auto_plugins', of_type=type)
 
@@ -340,6 +348,8 @@ def define_python_dagster_type(
     serialization_strategy=None,
     auto_plugins=None,
     type_check=None,
+    type_check_mode=None,
+    type_check_sample_fn=None,
 ):
     '''Core machinery for defining a Dagster type corresponding to an existing python type.
 
@@ -373,6 +383,12 @@ def define_python_dagster_type(
             return ``True`` if the type check succeds, ``False`` if it fails, or, if additional
             metadata should be emitted along with the type check success or failure, an instance of
             :py:class:`TypeCheck` with the ``success`` field set appropriately.
+        type_check_mode (Optional[TypeCheckMode]): How values of this type are type checked as they
+            are yielded and received by solids. Defaults to ``TypeCheckMode.FULL``. Solids can
+            override it by setting the ``dagster/type_check_mode`` key of their step metadata.
+        type_check_sample_fn (Optional[Callable[[Any], Any]]): If specified, this function is
+            called to draw a sample of a value, e.g. of the rows of a dataframe, which is type
+            checked in place of the value when the type check mode is ``TypeCheckMode.SAMPLE``.
     '''
 
     check.type_param(python_type, 'python_type')
@@ -396,6 +412,8 @@ def define_python_dagster_type(
     )
 
     check.opt_callable_param(type_check, 'type_check')
+    check.opt_inst_param(type_check_mode, 'type_check_mode', TypeCheckMode)
+    check.opt_callable_param(type_check_sample_fn, 'type_check_sample_fn')
 
     return PythonObjectType(
         python_type=python_type,
@@ -406,6 +424,8 @@ def define_python_dagster_type(
         serialization_strategy=serialization_strategy,
         auto_plugins=auto_plugins,
         type_check=type_check,
+        type_check_mode=type_check_mode,
+        type_check_sample_fn=type_check_sample_fn,
     )
 
 
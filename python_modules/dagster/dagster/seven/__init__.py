@@ -40,6 +40,11 @@ try:
 except ImportError:
     import thread
 
+try:
+    import selectors
+except ImportError:
+    import selectors34 as selectors
+
 try:
     from urllib.parse import urljoin, urlparse, urlunparse
 except ImportError:
@@ -47,6 +52,16 @@ except ImportError:
 
 IS_WINDOWS = os.name == 'nt'
 
+# Pickle protocol 5, which can pass large buffers out-of-band, is built in from Python 3.8 and is
+# backported to earlier versions of Python 3 by the optional pickle5 package
+if sys.version_info >= (3, 8):
+    import pickle as pickle5
+else:
+    try:
+        import pickle5
+    except ImportError:
+        pickle5 = None
+
 # TODO implement a generic import by name -- see https://stackoverflow.com/questions/301134/how-to-import-a-module-given-its-name
 
 # https://stackoverflow.com/a/67692/324449
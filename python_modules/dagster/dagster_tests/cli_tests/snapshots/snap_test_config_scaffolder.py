@@ -9,10 +9,15 @@ snapshots = Snapshot()
 snapshots['test_basic_solids_config 1'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'gc_intermediates': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'gc_intermediates': True,
+                'max_concurrent': 0,
+                'reuse_workers': True
             }
         }
     },
@@ -36,7 +41,10 @@ snapshots['test_basic_solids_config 1'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'content_addressed': True,
+                'max_concurrent_reads': 0,
+                'prefetch_inputs': True
             }
         },
         'in_memory': {
@@ -57,10 +65,15 @@ snapshots['test_two_modes 1'] = {
 snapshots['test_two_modes 2'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'gc_intermediates': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'gc_intermediates': True,
+                'max_concurrent': 0,
+                'reuse_workers': True
             }
         }
     },
@@ -84,7 +97,10 @@ snapshots['test_two_modes 2'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'content_addressed': True,
+                'max_concurrent_reads': 0,
+                'prefetch_inputs': True
             }
         },
         'in_memory': {
@@ -105,10 +121,15 @@ snapshots['test_two_modes 3'] = {
 snapshots['test_two_modes 4'] = {
     'execution': {
         'in_process': {
+            'config': {
+                'gc_intermediates': True
+            }
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'gc_intermediates': True,
+                'max_concurrent': 0,
+                'reuse_workers': True
             }
         }
     },
@@ -132,7 +153,10 @@ snapshots['test_two_modes 4'] = {
     'storage': {
         'filesystem': {
             'config': {
-                'base_dir': ''
+                'base_dir': '',
+                'content_addressed': True,
+                'max_concurrent_reads': 0,
+                'prefetch_inputs': True
             }
         },
         'in_memory': {
@@ -22,7 +22,7 @@ def test_0_6_4():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 'c7a6c4d7-6c88-46d0-8baa-d4937c3cefe5). Database is at revision None, head is '
-                '567bc23fd1ac. Please run `dagster instance migrate`.'
+                '3b1e175a2be3. Please run `dagster instance migrate`.'
             ),
         ):
             for run in runs:
@@ -49,7 +49,7 @@ def test_0_6_6_sqlite_exc():
             match=re.escape(
                 'Instance is out of date and must be migrated (SqliteEventLogStorage for run '
                 '89296095-892d-4a15-aa0d-9018d1580945). Database is at revision None, head is '
-                '567bc23fd1ac. Please run `dagster instance migrate`.'
+                '3b1e175a2be3. Please run `dagster instance migrate`.'
             ),
         ):
             instance._event_storage.get_logs_for_run('89296095-892d-4a15-aa0d-9018d1580945')
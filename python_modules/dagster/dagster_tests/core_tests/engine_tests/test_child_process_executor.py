@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import time
 
@@ -8,10 +9,16 @@ from dagster.core.engine.child_process_executor import (
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    PickledWithBuffers,
+    _recv,
+    _send,
     execute_child_process_command,
 )
+from dagster.seven import pickle5
 
 
 class DoubleAStringChildProcessCommand(ChildProcessCommand):
@@ -22,6 +29,26 @@ class DoubleAStringChildProcessCommand(ChildProcessCommand):
         yield self.a_str + self.a_str
 
 
+class LargeBuffer(object):
+    '''Pickles its data out-of-band where possible, as NumPy arrays do.'''
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return LargeBuffer, (pickle5.PickleBuffer(self.data),)
+        return LargeBuffer, (self.data,)
+
+
+class LargeBufferCommand(ChildProcessCommand):
+    def __init__(self, size):
+        self.size = size
+
+    def execute(self):
+        yield LargeBuffer(bytearray(b'a' * self.size))
+
+
 class AnError(Exception):
     pass
 
@@ -84,6 +111,139 @@ def test_child_process_crashy_process():
         list(execute_child_process_command(CrashyCommand()))
 
 
+class SleepyCommand(ChildProcessCommand):
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def execute(self):
+        time.sleep(self.seconds)
+        yield self.seconds
+
+
+def test_child_process_selector():
+    selector = ChildProcessEventSelector()
+    iters = {
+        seconds: execute_child_process_command(SleepyCommand(seconds), selector)
+        for seconds in [0.1, 0.5]
+    }
+
+    results = []
+    while iters:
+        received_event = False
+        for seconds, it in list(iters.items()):
+            try:
+                event = next(it)
+            except StopIteration:
+                del iters[seconds]
+                continue
+
+            if event is not None:
+                received_event = True
+                if not isinstance(event, ChildProcessEvent):
+                    results.append(event)
+
+        if not received_event:
+            selector.wait()
+
+    assert results == [0.1, 0.5]
+
+
+def test_child_process_selector_timeout():
+    selector = ChildProcessEventSelector()
+    it = execute_child_process_command(SleepyCommand(1.0), selector)
+
+    # consume events until the child process has nothing more to send for now
+    while next(it) is not None:
+        pass
+
+    start = time.time()
+    selector.wait(timeout=0.1)
+    assert time.time() - start < 0.9
+
+    assert [event for event in it if event and not isinstance(event, ChildProcessEvent)] == [1.0]
+
+
+def test_child_process_worker_reuses_process():
+    worker = ChildProcessWorker()
+    try:
+        first = list(filter(lambda x: x, worker.execute(DoubleAStringChildProcessCommand('aa'))))
+        second = list(filter(lambda x: x, worker.execute(DoubleAStringChildProcessCommand('bb'))))
+    finally:
+        worker.shutdown()
+
+    assert first[1] == 'aaaa'
+    assert second[1] == 'bbbb'
+    assert isinstance(first[0], ChildProcessStartEvent)
+    assert first[0].pid != os.getpid()
+    assert first[0].pid == second[0].pid
+    assert not worker.is_alive()
+
+
+def test_child_process_worker_survives_command_error():
+    worker = ChildProcessWorker()
+    try:
+        errors = list(
+            filter(
+                lambda x: x and isinstance(x, ChildProcessSystemErrorEvent),
+                worker.execute(ThrowAnErrorCommand()),
+            )
+        )
+        events = list(
+            filter(
+                lambda x: x and not isinstance(x, ChildProcessEvent),
+                worker.execute(DoubleAStringChildProcessCommand('aa')),
+            )
+        )
+    finally:
+        worker.shutdown()
+
+    assert len(errors) == 1
+    assert 'AnError' in str(errors[0].error_info.message)
+    assert events == ['aaaa']
+
+
+def test_child_process_worker_crash():
+    worker = ChildProcessWorker()
+    try:
+        with pytest.raises(ChildProcessCrashException):
+            list(worker.execute(CrashyCommand()))
+    finally:
+        worker.shutdown()
+
+
+@pytest.mark.skipif(pickle5 is None, reason='Pickle protocol 5 is not available')
+def test_send_buffers_out_of_band():
+    recv_conn, send_conn = multiprocessing.Pipe(duplex=False)
+    try:
+        _send(send_conn, LargeBuffer(bytearray(b'a' * 10000)))
+        message = recv_conn.recv()
+        assert isinstance(message, PickledWithBuffers)
+        assert message.buffer_sizes == [10000]
+        assert len(message.data) < 10000
+        assert recv_conn.recv_bytes() == b'a' * 10000
+
+        _send(send_conn, LargeBuffer(bytearray(b'b' * 10000)))
+        value = _recv(recv_conn)
+        assert isinstance(value.data, bytearray)
+        assert value.data == bytearray(b'b' * 10000)
+    finally:
+        recv_conn.close()
+        send_conn.close()
+
+
+def test_child_process_large_buffer():
+    events = list(
+        filter(
+            lambda x: x and not isinstance(x, ChildProcessEvent),
+            execute_child_process_command(LargeBufferCommand(10 * 1024 * 1024)),
+        )
+    )
+    assert len(events) == 1
+    # Buffers received out-of-band are writable
+    events[0].data[0:1] = b'b'
+    assert events[0].data == bytearray(b'b' + b'a' * (10 * 1024 * 1024 - 1))
+
+
 @pytest.mark.skip('too long')
 def test_long_running_command():
     list(execute_child_process_command(LongRunningCommand()))
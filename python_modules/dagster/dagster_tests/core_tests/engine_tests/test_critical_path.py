@@ -0,0 +1,130 @@
+from dagster import (
+    DependencyDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.engine.critical_path import (
+    critical_path_lengths,
+    critical_path_priorities,
+    expected_step_durations,
+    historical_step_durations,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.instance import DagsterInstance
+
+
+def define_pipeline():
+    @lambda_solid
+    def start():
+        return 1
+
+    @lambda_solid
+    def add_one(num):
+        return num + 1
+
+    @lambda_solid
+    def side():
+        return 0
+
+    return PipelineDefinition(
+        name='critical_path_pipeline',
+        solid_defs=[start, add_one, side],
+        dependencies={'add_one': {'num': DependencyDefinition('start')}, 'side': {},},
+    )
+
+
+def test_critical_path_lengths_without_durations():
+    lengths = critical_path_lengths(create_execution_plan(define_pipeline()))
+    assert lengths == {'start.compute': 2.0, 'add_one.compute': 1.0, 'side.compute': 1.0}
+
+
+def test_critical_path_lengths_with_durations():
+    lengths = critical_path_lengths(
+        create_execution_plan(define_pipeline()),
+        {'start.compute': 1.0, 'add_one.compute': 2.0, 'side.compute': 6.0},
+    )
+    assert lengths == {'start.compute': 3.0, 'add_one.compute': 2.0, 'side.compute': 6.0}
+
+
+def test_critical_path_lengths_default_to_mean_duration():
+    lengths = critical_path_lengths(
+        create_execution_plan(define_pipeline()), {'start.compute': 1.0, 'side.compute': 5.0}
+    )
+    # add_one has no duration, so is assumed to take the mean of the others
+    assert lengths == {'start.compute': 4.0, 'add_one.compute': 3.0, 'side.compute': 5.0}
+
+
+def test_critical_path_lengths_of_subset_plan():
+    execution_plan = create_execution_plan(define_pipeline()).build_subset_plan(
+        ['start.compute', 'side.compute']
+    )
+    assert critical_path_lengths(execution_plan) == {'start.compute': 1.0, 'side.compute': 1.0}
+
+
+def test_critical_path_priorities():
+    priorities = critical_path_priorities({'a': 4.0, 'b': 2.0, 'c': 0.0}, 0, 10)
+    assert priorities == {'a': 10.0, 'b': 5.0, 'c': 0.0}
+
+    assert critical_path_priorities({'a': 0.0}, 0, 10) == {'a': 10}
+    assert critical_path_priorities({}, 0, 10) == {}
+
+
+def test_historical_step_durations():
+    instance = DagsterInstance.ephemeral()
+    pipeline = define_pipeline()
+    assert historical_step_durations(instance, pipeline.name) == {}
+
+    execute_pipeline(pipeline, instance=instance)
+    execute_pipeline(pipeline, instance=instance)
+
+    durations = historical_step_durations(instance, pipeline.name)
+    assert set(durations.keys()) == {'start.compute', 'add_one.compute', 'side.compute'}
+    assert all(duration >= 0 for duration in durations.values())
+
+    assert historical_step_durations(instance, 'other_pipeline') == {}
+
+
+def test_historical_step_durations_run_limit():
+    instance = DagsterInstance.ephemeral()
+    pipeline = define_pipeline()
+    execute_pipeline(pipeline, instance=instance)
+    execute_pipeline(pipeline.build_sub_pipeline(['side']), instance=instance)
+
+    # Only the most recent run, which executed only side, is read
+    assert list(historical_step_durations(instance, pipeline.name, run_limit=1).keys()) == [
+        'side.compute'
+    ]
+
+
+def test_expected_step_durations_skip_history_if_priorities_set():
+    @solid(metadata={'test/priority': 1})
+    def prioritized(_):
+        return 1
+
+    @solid
+    def unprioritized(_):
+        return 1
+
+    instance = DagsterInstance.ephemeral()
+    pipeline = PipelineDefinition(
+        name='prioritized_pipeline', solid_defs=[prioritized, unprioritized]
+    )
+    execute_pipeline(pipeline, instance=instance)
+
+    def _get_events_for_runs(_run_ids, _event_types):
+        raise Exception('The event log should not be read')
+
+    get_events_for_runs = instance.get_events_for_runs
+    instance.get_events_for_runs = _get_events_for_runs
+
+    # Every step to execute sets its priority, so no history is read
+    execution_plan = create_execution_plan(pipeline).build_subset_plan(['prioritized.compute'])
+    assert expected_step_durations(instance, pipeline.name, execution_plan, 'test/priority') == {}
+
+    instance.get_events_for_runs = get_events_for_runs
+    durations = expected_step_durations(
+        instance, pipeline.name, create_execution_plan(pipeline), 'test/priority'
+    )
+    assert set(durations.keys()) == {'prioritized.compute', 'unprioritized.compute'}
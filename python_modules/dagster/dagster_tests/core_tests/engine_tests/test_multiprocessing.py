@@ -1,11 +1,20 @@
+import os
+import time
+
+import pytest
+
 from dagster import (
+    DagsterInvariantViolationError,
     DependencyDefinition,
     ExecutionTargetHandle,
     InputDefinition,
     PipelineDefinition,
     execute_pipeline,
     lambda_solid,
+    solid,
 )
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.instance import DagsterInstance
 
 
@@ -117,3 +126,146 @@ def test_invalid_instance():
     assert not result.success
     assert len(result.event_list) == 1
     assert result.event_list[0].is_failure
+
+
+def define_uneven_pipeline():
+    @lambda_solid
+    def slow():
+        time.sleep(2)
+        return 1
+
+    @lambda_solid
+    def fast():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def after_fast(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='uneven_execution',
+        solid_defs=[slow, fast, after_fast],
+        dependencies={'after_fast': {'num': DependencyDefinition('fast')}},
+    )
+
+
+def test_steps_start_when_dependencies_complete():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_uneven_pipeline).build_pipeline_definition(),
+        environment_dict={'storage': {'filesystem': {}}, 'execution': {'multiprocess': {}}},
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('after_fast').output_value() == 3
+
+    step_events = [event for event in result.event_list if event.step_key]
+    after_fast_start = [
+        i
+        for i, event in enumerate(step_events)
+        if event.step_key == 'after_fast.compute'
+        and event.event_type == DagsterEventType.STEP_START
+    ][0]
+    slow_success = [
+        i
+        for i, event in enumerate(step_events)
+        if event.step_key == 'slow.compute' and event.is_step_success
+    ][0]
+
+    # after_fast should not have to wait for slow, which is in the same topological level as fast
+    assert after_fast_start < slow_success
+
+
+def define_priority_pipeline():
+    @solid(metadata={'dagster/priority': '-1'})
+    def low(_):
+        return 1
+
+    @solid
+    def medium(_):
+        return 2
+
+    @solid(metadata={'dagster/priority': '5'})
+    def high(_):
+        return 3
+
+    return PipelineDefinition(name='priority_execution', solid_defs=[low, medium, high])
+
+
+def test_priority_ordering():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_priority_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'max_concurrent': 1}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+
+    started = [
+        event.step_key
+        for event in result.event_list
+        if event.event_type == DagsterEventType.STEP_START
+    ]
+    assert started == ['high.compute', 'medium.compute', 'low.compute']
+
+
+def test_invalid_priority():
+    @solid(metadata={'dagster/priority': 'high'})
+    def high(_):
+        return 3
+
+    # The plan is rejected before any step is launched
+    with pytest.raises(DagsterInvariantViolationError, match='dagster/priority.*high.compute'):
+        create_execution_plan(PipelineDefinition(name='invalid_priority', solid_defs=[high]))
+
+
+def define_wide_pipeline():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    fan_out = []
+    dependencies = {}
+    for i in range(6):
+        name = 'get_pid_{i}'.format(i=i)
+
+        @lambda_solid(name=name, input_defs=[InputDefinition('num')])
+        def get_pid(num):  # pylint: disable=unused-argument
+            return os.getpid()
+
+        fan_out.append(get_pid)
+        dependencies[name] = {'num': DependencyDefinition('return_one')}
+
+    return PipelineDefinition(
+        name='wide_execution', solid_defs=[return_one] + fan_out, dependencies=dependencies
+    )
+
+
+def test_reuse_workers():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_wide_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'max_concurrent': 2, 'reuse_workers': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+
+    pids = set(result.result_for_solid('get_pid_{i}'.format(i=i)).output_value() for i in range(6))
+    # six steps were executed by at most two worker processes
+    assert os.getpid() not in pids
+    assert len(pids) <= 2
+
+
+def test_reuse_workers_error_pipeline():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_error_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'reuse_workers': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert not result.success
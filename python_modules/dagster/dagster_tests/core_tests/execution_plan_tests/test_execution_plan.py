@@ -23,3 +23,45 @@ def test_create_execution_plan_with_bad_inputs():
         create_execution_plan(
             define_diamond_pipeline(), {'solids': {'add_three': {'inputs': {'num': 3}}}}
         )
+
+
+def test_execution_deps_and_dependents():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    assert plan.execution_deps() == {
+        'return_two.compute': set(),
+        'add_three.compute': {'return_two.compute'},
+        'mult_three.compute': {'return_two.compute'},
+        'adder.compute': {'add_three.compute', 'mult_three.compute'},
+    }
+    assert plan.execution_dependents('return_two.compute') == {
+        'add_three.compute',
+        'mult_three.compute',
+    }
+    assert plan.execution_dependents('adder.compute') == set()
+
+    # callers may mutate the returned deps without affecting the plan
+    deps = plan.execution_deps()
+    del deps['adder.compute']
+    assert 'adder.compute' in plan.execution_deps()
+
+
+def test_subset_plan_shares_structure():
+    plan = create_execution_plan(define_diamond_pipeline())
+    subset_plan = plan.build_subset_plan(['add_three.compute', 'adder.compute'])
+
+    assert subset_plan.deps is plan.deps
+    assert subset_plan.dependents is plan.dependents
+    assert subset_plan.topological_key_levels is plan.topological_key_levels
+
+    assert subset_plan.step_key_set == frozenset(['add_three.compute', 'adder.compute'])
+    assert subset_plan.execution_deps() == {
+        'add_three.compute': set(),
+        'adder.compute': {'add_three.compute'},
+    }
+    assert subset_plan.execution_dependents('return_two.compute') == {'add_three.compute'}
+    assert [[step.key for step in level] for level in subset_plan.execution_step_levels()] == [
+        ['add_three.compute'],
+        ['adder.compute'],
+    ]
+    assert len(subset_plan.topological_step_levels()) == 3
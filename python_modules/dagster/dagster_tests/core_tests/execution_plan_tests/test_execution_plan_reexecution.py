@@ -1,3 +1,4 @@
+import os
 import uuid
 
 import pytest
@@ -11,6 +12,7 @@ from dagster import (
     RunConfig,
     execute_pipeline,
     lambda_solid,
+    seven,
 )
 from dagster.core.errors import (
     DagsterExecutionStepNotFoundError,
@@ -102,6 +104,57 @@ def test_execution_plan_reexecution():
     assert get_step_output_event(step_events, 'add_two.compute')
 
 
+def test_execution_plan_reexecution_content_addressed():
+    pipeline_def = define_addy_pipeline()
+    with seven.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance.ephemeral(tempdir)
+        environment_dict = merge_dicts(
+            {'solids': {'add_one': {'inputs': {'num': {'value': 3}}}}},
+            {'storage': {'filesystem': {'config': {'content_addressed': True}}}},
+        )
+        result = execute_pipeline(
+            pipeline_def, environment_dict=environment_dict, instance=instance
+        )
+
+        assert result.success
+        assert len(os.listdir(instance.blobs_directory())) == 3
+
+        ## re-execute add_two
+
+        new_run_id = str(uuid.uuid4())
+
+        pipeline_run = PipelineRun(
+            pipeline_name=pipeline_def.name,
+            run_id=new_run_id,
+            environment_dict=environment_dict,
+            mode='default',
+            previous_run_id=result.run_id,
+        )
+
+        execution_plan = create_execution_plan(
+            pipeline_def, environment_dict=environment_dict, run_config=pipeline_run
+        )
+
+        step_events = execute_plan(
+            execution_plan.build_subset_plan(['add_two.compute']),
+            environment_dict=environment_dict,
+            pipeline_run=pipeline_run,
+            instance=instance,
+        )
+
+        store = build_fs_intermediate_store(
+            instance.intermediates_directory, new_run_id, blob_root=instance.blobs_directory()
+        )
+        assert store.get_intermediate(None, 'add_one.compute', Int).obj == 4
+        assert store.get_intermediate(None, 'add_two.compute', Int).obj == 6
+
+        assert not get_step_output_event(step_events, 'add_one.compute')
+        assert get_step_output_event(step_events, 'add_two.compute')
+
+        # The reused and the recomputed outputs are both shared with the previous run
+        assert len(os.listdir(instance.blobs_directory())) == 3
+
+
 def test_execution_plan_wrong_run_id():
     pipeline_def = define_addy_pipeline()
 
@@ -0,0 +1,287 @@
+import os
+
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    InputDefinition,
+    ModeDefinition,
+    PipelineDefinition,
+    SystemStorageData,
+    execute_pipeline,
+    lambda_solid,
+    seven,
+    system_storage,
+)
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.intermediates_gc import IntermediatesRefCounter
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.execution.config import InProcessExecutorConfig
+from dagster.core.execution.context_creation_pipeline import (
+    create_context_creation_data,
+    create_executor_config,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.file_manager import LocalFileManager
+from dagster.core.storage.intermediates_manager import IntermediatesManager
+from dagster.core.storage.pipeline_run import PipelineRun
+
+
+def define_diamond_pipeline(mode_defs=None):
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_three(num):
+        return num + 3
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(input_defs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='gc_diamond_pipeline',
+        solid_defs=[return_two, add_three, mult_three, adder],
+        dependencies={
+            'add_three': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('add_three'),
+                'right': DependencyDefinition('mult_three'),
+            },
+        },
+        mode_defs=mode_defs,
+    )
+
+
+def test_ref_counter_releases_after_last_consumer():
+    plan = create_execution_plan(define_diamond_pipeline())
+    ref_counter = IntermediatesRefCounter(plan)
+
+    assert ref_counter.step_succeeded('return_two.compute') == []
+    assert ref_counter.step_succeeded('add_three.compute') == []
+    assert ref_counter.step_succeeded('mult_three.compute') == [
+        StepOutputHandle('return_two.compute', 'result')
+    ]
+    assert set(ref_counter.step_succeeded('adder.compute')) == {
+        StepOutputHandle('add_three.compute', 'result'),
+        StepOutputHandle('mult_three.compute', 'result'),
+    }
+
+
+def test_ref_counter_retains_outputs_consumed_outside_subset():
+    plan = create_execution_plan(define_diamond_pipeline()).build_subset_plan(
+        ['return_two.compute', 'add_three.compute']
+    )
+    ref_counter = IntermediatesRefCounter(plan)
+
+    assert ref_counter.step_succeeded('return_two.compute') == []
+    # return_two is also consumed by mult_three, which is not being executed
+    assert ref_counter.step_succeeded('add_three.compute') == []
+
+
+def test_default_executor_config():
+    pipeline = define_diamond_pipeline()
+    executor_config = create_executor_config(
+        create_context_creation_data(
+            pipeline,
+            {},
+            PipelineRun.create_empty_run(pipeline.name, 'run_id'),
+            DagsterInstance.ephemeral(),
+        )
+    )
+    assert isinstance(executor_config, InProcessExecutorConfig)
+    assert executor_config.gc_intermediates is False
+
+
+class DictIntermediatesManager(IntermediatesManager):
+    '''An intermediates manager that predates rm_intermediate.'''
+
+    def __init__(self):
+        self.values = {}
+
+    def get_intermediate(self, context, runtime_type, step_output_handle):
+        return self.values[step_output_handle]
+
+    def set_intermediate(self, context, runtime_type, step_output_handle, value):
+        self.values[step_output_handle] = value
+
+    def has_intermediate(self, context, step_output_handle):
+        return step_output_handle in self.values
+
+    def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
+        raise NotImplementedError()
+
+    @property
+    def is_persistent(self):
+        return False
+
+
+def test_gc_with_intermediates_manager_without_rm_intermediate():
+    intermediates_manager = DictIntermediatesManager()
+
+    @system_storage(name='dict', is_persistent=False)
+    def dict_system_storage(init_context):
+        return SystemStorageData(
+            intermediates_manager=intermediates_manager,
+            file_manager=LocalFileManager.for_instance(
+                init_context.instance, init_context.pipeline_run.run_id
+            ),
+        )
+
+    result = execute_pipeline(
+        define_diamond_pipeline(
+            mode_defs=[ModeDefinition(system_storage_defs=[dict_system_storage])]
+        ),
+        environment_dict={
+            'storage': {'dict': {}},
+            'execution': {'in_process': {'config': {'gc_intermediates': True}}},
+        },
+    )
+
+    assert result.success
+    assert not _removed_keys(result)
+    # The manager keeps every intermediate
+    assert len(intermediates_manager.values) == 4
+
+
+def define_failing_pipeline():
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def fail(num):
+        raise Exception('failed with {num}'.format(num=num))
+
+    return PipelineDefinition(
+        name='failing_gc_pipeline',
+        solid_defs=[return_one, fail],
+        dependencies={'fail': {'num': DependencyDefinition('return_one')}},
+    )
+
+
+def _removed_keys(result):
+    return [
+        event.event_specific_data.value_name
+        for event in result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.event_specific_data.op == 'RM_OBJECT'
+    ]
+
+
+def _intermediate_path(instance, result, step_key):
+    return os.path.join(
+        instance.intermediates_directory(result.run_id), 'intermediates', step_key, 'result'
+    )
+
+
+def test_in_memory_gc():
+    pipeline = define_diamond_pipeline()
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={'execution': {'in_process': {'config': {'gc_intermediates': True}}}},
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    for solid_name in ['return_two', 'add_three', 'mult_three']:
+        with pytest.raises(KeyError):
+            result.result_for_solid(solid_name).output_value()
+
+
+def test_filesystem_gc():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'in_process': {'config': {'gc_intermediates': True}}},
+        },
+        instance=instance,
+    )
+    assert result.success
+    assert len(_removed_keys(result)) == 3
+
+    for step_key in ['return_two.compute', 'add_three.compute', 'mult_three.compute']:
+        assert not os.path.exists(_intermediate_path(instance, result, step_key))
+
+    # outputs with no consumers are retained
+    assert os.path.exists(_intermediate_path(instance, result, 'adder.compute'))
+    assert result.result_for_solid('adder').output_value() == 11
+
+
+def test_filesystem_content_addressed_gc():
+    with seven.TemporaryDirectory() as tempdir:
+        instance = DagsterInstance.ephemeral(tempdir)
+        result = execute_pipeline(
+            define_diamond_pipeline(),
+            environment_dict={
+                'storage': {'filesystem': {'config': {'content_addressed': True}}},
+                'execution': {'in_process': {'config': {'gc_intermediates': True}}},
+            },
+            instance=instance,
+        )
+        assert result.success
+        assert len(_removed_keys(result)) == 3
+
+        for step_key in ['return_two.compute', 'add_three.compute', 'mult_three.compute']:
+            assert not os.path.exists(_intermediate_path(instance, result, step_key) + '.ref')
+
+        # Only the references are removed, and the blobs are left for remove_unreferenced_blobs
+        assert len(os.listdir(instance.blobs_directory())) == 4
+        assert len(instance.remove_unreferenced_blobs(min_age_seconds=0)) == 3
+        assert result.result_for_solid('adder').output_value() == 11
+
+
+def test_filesystem_no_gc_by_default():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        define_diamond_pipeline(),
+        environment_dict={'storage': {'filesystem': {}}},
+        instance=instance,
+    )
+    assert result.success
+    assert not _removed_keys(result)
+    assert os.path.exists(_intermediate_path(instance, result, 'return_two.compute'))
+
+
+def test_failed_step_inputs_retained():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        define_failing_pipeline(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'in_process': {'config': {'gc_intermediates': True}}},
+        },
+        instance=instance,
+        raise_on_error=False,
+    )
+    assert not result.success
+    assert not _removed_keys(result)
+    assert os.path.exists(_intermediate_path(instance, result, 'return_one.compute'))
+
+
+def test_multiprocess_gc():
+    instance = DagsterInstance.local_temp()
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'gc_intermediates': True}}},
+        },
+        instance=instance,
+    )
+    assert result.success
+    assert len(_removed_keys(result)) == 3
+
+    for step_key in ['return_two.compute', 'add_three.compute', 'mult_three.compute']:
+        assert not os.path.exists(_intermediate_path(instance, result, step_key))
+    assert result.result_for_solid('adder').output_value() == 11
@@ -0,0 +1,222 @@
+import threading
+import time
+from collections import defaultdict
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    Int,
+    List,
+    ModeDefinition,
+    MultiDependencyDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    SystemStorageData,
+    execute_pipeline,
+    lambda_solid,
+    system_storage,
+)
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.events import DagsterEventType
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.storage.file_manager import LocalFileManager
+from dagster.core.storage.intermediates_manager import InMemoryIntermediatesManager
+from dagster.core.storage.system_storage import default_system_storage_defs
+
+FAN_IN_WIDTH = 8
+
+
+class SlowIntermediatesManager(InMemoryIntermediatesManager):
+    '''Keeps intermediates in memory but, like a manager backed by an object store, reports
+    operations on them and takes a while to read them.'''
+
+    def __init__(self, max_concurrent_reads, prefetch_inputs):
+        super(SlowIntermediatesManager, self).__init__()
+        self._max_concurrent_reads = max_concurrent_reads
+        self._prefetch_inputs = prefetch_inputs
+        self._lock = threading.Lock()
+        self.concurrent_reads = 0
+        self.max_observed_concurrent_reads = 0
+        self.reads = []
+        self.read_started = defaultdict(threading.Event)
+
+    @property
+    def max_concurrent_reads(self):
+        return self._max_concurrent_reads
+
+    @property
+    def prefetch_inputs(self):
+        return self._prefetch_inputs
+
+    def set_intermediate(self, context, runtime_type, step_output_handle, value):
+        super(SlowIntermediatesManager, self).set_intermediate(
+            context, runtime_type, step_output_handle, value
+        )
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.SET_OBJECT, key=step_output_handle.step_key, obj=value
+        )
+
+    def get_intermediate(self, context, runtime_type, step_output_handle):
+        self.read_started[step_output_handle].set()
+        with self._lock:
+            self.concurrent_reads += 1
+            self.max_observed_concurrent_reads = max(
+                self.max_observed_concurrent_reads, self.concurrent_reads
+            )
+            self.reads.append(step_output_handle)
+        time.sleep(0.05)
+        with self._lock:
+            self.concurrent_reads -= 1
+        return ObjectStoreOperation(
+            op=ObjectStoreOperationType.GET_OBJECT,
+            key=step_output_handle.step_key,
+            obj=super(SlowIntermediatesManager, self).get_intermediate(
+                context, runtime_type, step_output_handle
+            ),
+        )
+
+
+def slow_mode_defs(intermediates_manager):
+    @system_storage(name='slow', is_persistent=False)
+    def slow_system_storage(init_context):
+        return SystemStorageData(
+            intermediates_manager=intermediates_manager,
+            file_manager=LocalFileManager.for_instance(
+                init_context.instance, init_context.pipeline_run.run_id
+            ),
+        )
+
+    return [ModeDefinition(system_storage_defs=default_system_storage_defs + [slow_system_storage])]
+
+
+def define_fan_in_pipeline(intermediates_manager):
+    @lambda_solid
+    def return_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('nums', List[Int])])
+    def total(nums):
+        return sum(nums)
+
+    @lambda_solid(input_defs=[InputDefinition('num', Int)])
+    def add_one(num):
+        return num + 1
+
+    dependencies = {
+        SolidInvocation('return_one', 'return_one_{i}'.format(i=i)): {} for i in range(FAN_IN_WIDTH)
+    }
+    dependencies['total'] = {
+        'nums': MultiDependencyDefinition(
+            [DependencyDefinition('return_one_{i}'.format(i=i)) for i in range(FAN_IN_WIDTH)]
+        )
+    }
+    dependencies['add_one'] = {'num': DependencyDefinition('total')}
+
+    return PipelineDefinition(
+        name='fan_in_pipeline',
+        solid_defs=[return_one, total, add_one],
+        dependencies=dependencies,
+        mode_defs=slow_mode_defs(intermediates_manager),
+    )
+
+
+def test_fan_in_inputs_read_concurrently():
+    intermediates_manager = SlowIntermediatesManager(max_concurrent_reads=4, prefetch_inputs=False)
+    result = execute_pipeline(
+        define_fan_in_pipeline(intermediates_manager), environment_dict={'storage': {'slow': {}}}
+    )
+
+    assert result.success
+    assert intermediates_manager.max_observed_concurrent_reads == 4
+    assert len(intermediates_manager.reads) == FAN_IN_WIDTH + 1
+    assert result.result_for_solid('add_one').output_value() == FAN_IN_WIDTH + 1
+
+
+def test_inputs_read_sequentially_by_default():
+    intermediates_manager = SlowIntermediatesManager(max_concurrent_reads=1, prefetch_inputs=False)
+    result = execute_pipeline(
+        define_fan_in_pipeline(intermediates_manager), environment_dict={'storage': {'slow': {}}}
+    )
+
+    assert result.success
+    assert intermediates_manager.max_observed_concurrent_reads == 1
+
+
+def define_prefetch_pipeline(intermediates_manager):
+    @lambda_solid
+    def a_return_one():
+        return 1
+
+    @lambda_solid
+    def b_wait_for_prefetch():
+        # The input of c_add from a_return_one is prefetched while this step executes
+        return intermediates_manager.read_started[
+            StepOutputHandle('a_return_one.compute', 'result')
+        ].wait(5)
+
+    @lambda_solid(input_defs=[InputDefinition('num'), InputDefinition('prefetched')])
+    def c_add_one(num, prefetched):
+        return num + 1 if prefetched else None
+
+    return PipelineDefinition(
+        name='prefetch_pipeline',
+        solid_defs=[a_return_one, b_wait_for_prefetch, c_add_one],
+        dependencies={
+            'c_add_one': {
+                'num': DependencyDefinition('a_return_one'),
+                'prefetched': DependencyDefinition('b_wait_for_prefetch'),
+            }
+        },
+        mode_defs=slow_mode_defs(intermediates_manager),
+    )
+
+
+def test_prefetch_inputs():
+    intermediates_manager = SlowIntermediatesManager(max_concurrent_reads=1, prefetch_inputs=True)
+    result = execute_pipeline(
+        define_prefetch_pipeline(intermediates_manager), environment_dict={'storage': {'slow': {}}}
+    )
+
+    assert result.success
+    # Every intermediate is read exactly once, whether or not it was prefetched
+    assert sorted(intermediates_manager.reads) == [
+        StepOutputHandle('a_return_one.compute', 'result'),
+        StepOutputHandle('b_wait_for_prefetch.compute', 'result'),
+    ]
+    assert result.result_for_solid('c_add_one').output_value() == 2
+
+
+def test_prefetched_fan_in_inputs():
+    intermediates_manager = SlowIntermediatesManager(max_concurrent_reads=2, prefetch_inputs=True)
+    result = execute_pipeline(
+        define_fan_in_pipeline(intermediates_manager), environment_dict={'storage': {'slow': {}}}
+    )
+
+    assert result.success
+    assert len(intermediates_manager.reads) == FAN_IN_WIDTH + 1
+    assert len(set(intermediates_manager.reads)) == FAN_IN_WIDTH + 1
+    assert result.result_for_solid('add_one').output_value() == FAN_IN_WIDTH + 1
+
+
+def test_filesystem_storage_concurrent_reads_and_prefetch():
+    result = execute_pipeline(
+        define_fan_in_pipeline(InMemoryIntermediatesManager()),
+        environment_dict={
+            'storage': {
+                'filesystem': {'config': {'max_concurrent_reads': 4, 'prefetch_inputs': True}}
+            }
+        },
+    )
+
+    assert result.success
+    assert result.result_for_solid('add_one').output_value() == FAN_IN_WIDTH + 1
+
+    # The object store events for inputs are logged by the steps that read them
+    get_object_events = [
+        event
+        for event in result.event_list
+        if event.event_type == DagsterEventType.OBJECT_STORE_OPERATION
+        and event.step_key == 'total.compute'
+        and event.event_specific_data.value_name == 'nums'
+    ]
+    assert len(get_object_events) == FAN_IN_WIDTH
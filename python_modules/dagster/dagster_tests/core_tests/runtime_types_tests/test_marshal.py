@@ -1,5 +1,8 @@
+import pickle
+
 from dagster.core.types.runtime.marshal import PickleSerializationStrategy
-from dagster.utils import safe_tempfile_path
+from dagster.seven import pickle5
+from dagster.utils import PICKLE_PROTOCOL, safe_tempfile_path
 
 
 def test_serialization_strategy():
@@ -7,3 +10,20 @@ def test_serialization_strategy():
     with safe_tempfile_path() as tempfile_path:
         serialization_strategy.serialize_to_file('foo', tempfile_path)
         assert serialization_strategy.deserialize_from_file(tempfile_path) == 'foo'
+
+
+def test_serialization_strategy_protocol():
+    assert PickleSerializationStrategy().protocol == PICKLE_PROTOCOL
+
+    serialization_strategy = PickleSerializationStrategy(protocol=5)
+    if pickle5 is not None:
+        assert serialization_strategy.protocol == 5
+    else:
+        assert serialization_strategy.protocol == pickle.HIGHEST_PROTOCOL
+
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(bytearray(b'foo'), tempfile_path)
+        # Values serialized with any protocol can be deserialized by any strategy
+        assert PickleSerializationStrategy().deserialize_from_file(tempfile_path) == bytearray(
+            b'foo'
+        )
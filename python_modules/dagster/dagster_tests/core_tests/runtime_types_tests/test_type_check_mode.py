@@ -0,0 +1,206 @@
+import pytest
+
+from dagster import (
+    DagsterInvariantViolationError,
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    TypeCheck,
+    TypeCheckMode,
+    execute_pipeline,
+    lambda_solid,
+    solid,
+)
+from dagster.core.types.runtime.runtime_type import define_python_dagster_type
+
+
+class Rows(list):
+    pass
+
+
+def define_rows_type(checked, type_check_mode=None, type_check_sample_fn=None):
+    def type_check(value):
+        checked.append(list(value))
+        return TypeCheck(success=all(row >= 0 for row in value))
+
+    return define_python_dagster_type(
+        python_type=Rows,
+        name='Rows',
+        type_check=type_check,
+        type_check_mode=type_check_mode,
+        type_check_sample_fn=type_check_sample_fn,
+    )
+
+
+def define_rows_pipeline(rows_type, rows, consume_step_metadata=None, emit_step_metadata=None):
+    @solid(
+        output_defs=[OutputDefinition(rows_type)],
+        step_metadata_fn=lambda _: emit_step_metadata or {},
+    )
+    def emit(_):
+        return Rows(rows)
+
+    @solid(
+        input_defs=[InputDefinition('rows', rows_type)],
+        step_metadata_fn=lambda _: consume_step_metadata or {},
+    )
+    def consume(_, rows):
+        return len(rows)
+
+    return PipelineDefinition(
+        name='rows_pipeline',
+        solid_defs=[emit, consume],
+        dependencies={'consume': {'rows': DependencyDefinition('emit')}},
+    )
+
+
+def type_check_modes(result):
+    modes = []
+    for event in result.event_list:
+        if event.is_successful_output or event.event_type_value == 'STEP_INPUT':
+            entries = event.event_specific_data.type_check_data.metadata_entries
+            modes.extend(
+                entry.entry_data.text for entry in entries if entry.label == 'type_check_mode'
+            )
+    return modes
+
+
+def test_full_type_check_mode():
+    checked = []
+    result = execute_pipeline(define_rows_pipeline(define_rows_type(checked), [1, 2, 3]))
+
+    assert result.success
+    # The value is type checked both as an output and as an input
+    assert checked == [[1, 2, 3], [1, 2, 3]]
+    assert type_check_modes(result) == []
+
+
+def test_sample_type_check_mode():
+    checked = []
+    rows_type = define_rows_type(
+        checked,
+        type_check_mode=TypeCheckMode.SAMPLE,
+        type_check_sample_fn=lambda value: Rows(value[::2]),
+    )
+    result = execute_pipeline(define_rows_pipeline(rows_type, [1, 2, 3]))
+
+    assert result.success
+    assert checked == [[1, 3], [1, 3]]
+    assert type_check_modes(result) == ['SAMPLE', 'SAMPLE']
+
+    # Values are only checked on their samples
+    result = execute_pipeline(define_rows_pipeline(rows_type, [1, -2, 3]))
+    assert result.success
+
+
+def test_sample_type_check_mode_without_sample_fn():
+    checked = []
+    rows_type = define_rows_type(checked, type_check_mode=TypeCheckMode.SAMPLE)
+    result = execute_pipeline(define_rows_pipeline(rows_type, [1, 2, 3]))
+
+    assert result.success
+    assert checked == [[1, 2, 3], [1, 2, 3]]
+    assert type_check_modes(result) == []
+
+
+def test_once_type_check_mode():
+    checked = []
+    rows_type = define_rows_type(checked, type_check_mode=TypeCheckMode.ONCE)
+    result = execute_pipeline(define_rows_pipeline(rows_type, [1, 2, 3]))
+
+    assert result.success
+    assert checked == [[1, 2, 3]]
+    assert type_check_modes(result) == ['ONCE', 'ONCE']
+
+    input_event = [event for event in result.event_list if event.event_type_value == 'STEP_INPUT'][
+        0
+    ]
+    assert input_event.event_specific_data.type_check_data.success
+    assert 'emit.compute' in input_event.event_specific_data.type_check_data.description
+
+    # Failing values are still caught as outputs
+    result = execute_pipeline(define_rows_pipeline(rows_type, [1, -2, 3]), raise_on_error=False)
+    assert not result.success
+    assert not result.result_for_solid('emit').success
+
+
+def test_once_type_check_mode_from_other_type():
+    checked = []
+    rows_type = define_rows_type(checked, type_check_mode=TypeCheckMode.ONCE)
+
+    @lambda_solid
+    def emit():
+        return Rows([1, 2, 3])
+
+    @lambda_solid(input_defs=[InputDefinition('rows', rows_type)])
+    def consume(rows):
+        return len(rows)
+
+    result = execute_pipeline(
+        PipelineDefinition(
+            name='untyped_rows_pipeline',
+            solid_defs=[emit, consume],
+            dependencies={'consume': {'rows': DependencyDefinition('emit')}},
+        )
+    )
+
+    # The output was not checked as Rows, so the input is
+    assert result.success
+    assert checked == [[1, 2, 3]]
+    assert type_check_modes(result) == ['ONCE']
+
+
+def test_once_type_check_mode_from_sampled_output():
+    checked = []
+    rows_type = define_rows_type(
+        checked,
+        type_check_mode=TypeCheckMode.ONCE,
+        type_check_sample_fn=lambda value: Rows(value[::2]),
+    )
+    result = execute_pipeline(
+        define_rows_pipeline(
+            rows_type, [1, 2, 3], emit_step_metadata={'dagster/type_check_mode': 'SAMPLE'}
+        )
+    )
+
+    # The output was only checked on a sample, so the input is checked in full
+    assert result.success
+    assert checked == [[1, 3], [1, 2, 3]]
+    assert type_check_modes(result) == ['SAMPLE', 'ONCE']
+
+    result = execute_pipeline(
+        define_rows_pipeline(
+            rows_type, [1, -2, 3], emit_step_metadata={'dagster/type_check_mode': 'SAMPLE'}
+        ),
+        raise_on_error=False,
+    )
+    assert not result.success
+    assert result.result_for_solid('emit').success
+    assert not result.result_for_solid('consume').success
+
+
+def test_solid_type_check_mode_override():
+    checked = []
+    rows_type = define_rows_type(checked)
+    result = execute_pipeline(
+        define_rows_pipeline(
+            rows_type, [1, 2, 3], consume_step_metadata={'dagster/type_check_mode': 'ONCE'}
+        )
+    )
+
+    assert result.success
+    assert checked == [[1, 2, 3]]
+    # The mode applies to both the input and the output of the solid
+    assert type_check_modes(result) == ['ONCE', 'ONCE']
+
+
+def test_invalid_solid_type_check_mode():
+    with pytest.raises(DagsterInvariantViolationError, match='dagster/type_check_mode'):
+        execute_pipeline(
+            define_rows_pipeline(
+                define_rows_type([]),
+                [1, 2, 3],
+                consume_step_metadata={'dagster/type_check_mode': 'NEVER'},
+            )
+        )
@@ -1,19 +1,25 @@
 import os
+import subprocess
+import sys
 import time
+from contextlib import contextmanager
 
 import pytest
 import sqlalchemy
 
 from dagster import seven
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster.core.events.log import DagsterEventRecord
+from dagster.core.events.log import DagsterEventRecord, LogMessageRecord
+from dagster.core.execution.plan.objects import StepSuccessData
 from dagster.core.storage.event_log import (
     DagsterEventLogInvalidForRun,
     InMemoryEventLogStorage,
+    SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster.core.storage.event_log.sqlite.sqlite_event_log import MAX_CACHED_ENGINES
 from dagster.core.storage.sql import create_engine
 
 
@@ -170,7 +176,7 @@ def test_filesystem_event_log_storage_watch():
         assert len(storage.get_logs_for_run('foo')) == 1
         assert len(watched) == 0
 
-        storage.watch('foo', 2, callback)
+        storage.watch('foo', 0, callback)
         storage.store_event(evt('Message2'))
         assert len(storage.get_logs_for_run('foo')) == 2
 
@@ -194,6 +200,345 @@ def test_filesystem_event_log_storage_watch():
         assert len(watched) == 3
 
 
+def wait_for(predicate, timeout=5):
+    start = time.time()
+    while not predicate() and time.time() - start < timeout:
+        time.sleep(0.05)
+    return predicate()
+
+
+def test_filesystem_event_log_storage_watchers_share_tail():
+    def evt(name):
+        return DagsterEventRecord(
+            None,
+            name,
+            'debug',
+            '',
+            'foo',
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                'nonce',
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+    first_watched = []
+    second_watched = []
+
+    def first_callback(evt):
+        first_watched.append(evt.message)
+
+    def second_callback(evt):
+        second_watched.append(evt.message)
+
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(evt('Message1'))
+        storage.watch('foo', -1, first_callback)
+        storage.store_event(evt('Message2'))
+        assert wait_for(lambda: len(first_watched) == 2)
+
+        # A watcher that starts from an earlier cursor is caught up on the events it missed
+        storage.watch('foo', -1, second_callback)
+        assert second_watched == ['Message1', 'Message2']
+        assert len(storage._tails) == 1  # pylint: disable=protected-access
+
+        storage.store_event(evt('Message3'))
+        assert wait_for(lambda: len(first_watched) == 3 and len(second_watched) == 3)
+        assert first_watched == second_watched == ['Message1', 'Message2', 'Message3']
+
+        storage.end_watch('foo', first_callback)
+        assert len(storage._tails) == 1  # pylint: disable=protected-access
+        storage.store_event(evt('Message4'))
+        assert wait_for(lambda: len(second_watched) == 4)
+        assert len(first_watched) == 3
+
+        storage.end_watch('foo', second_callback)
+        assert not storage._tails  # pylint: disable=protected-access
+
+
+def _log_message(run_id, message):
+    return LogMessageRecord(None, message, 'debug', '', run_id, time.time())
+
+
+def _pipeline_success(run_id):
+    return DagsterEventRecord(
+        None,
+        'Finished',
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(DagsterEventType.PIPELINE_SUCCESS.value, 'nonce'),
+    )
+
+
+def test_filesystem_event_log_storage_store_events_batch():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        storage.store_events(
+            [
+                _log_message('foo', 'Message1'),
+                _log_message('bar', 'Message2'),
+                _log_message('foo', 'Message3'),
+            ]
+        )
+
+        assert [event.message for event in storage.get_logs_for_run('foo')] == [
+            'Message1',
+            'Message3',
+        ]
+        assert [event.message for event in storage.get_logs_for_run('bar')] == ['Message2']
+
+
+def test_filesystem_event_log_storage_buffered():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=3, flush_interval_ms=60000)
+        # A second storage over the same directory only sees the events that have been written
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_log_message('foo', 'Message1'))
+        storage.store_event(_log_message('foo', 'Message2'))
+        assert len(reader.get_logs_for_run('foo')) == 0
+
+        storage.store_event(_log_message('foo', 'Message3'))
+        assert len(reader.get_logs_for_run('foo')) == 3
+
+        storage.store_event(_log_message('foo', 'Message4'))
+        assert len(reader.get_logs_for_run('foo')) == 3
+        # Reads through the buffering storage see its own buffered events
+        assert len(storage.get_logs_for_run('foo')) == 4
+        assert len(reader.get_logs_for_run('foo')) == 4
+
+        storage.store_event(_log_message('foo', 'Message5'))
+        storage.store_event(_pipeline_success('foo'))
+        assert [event.message for event in reader.get_logs_for_run('foo')] == [
+            'Message1',
+            'Message2',
+            'Message3',
+            'Message4',
+            'Message5',
+            'Finished',
+        ]
+
+        storage.store_event(_log_message('foo', 'Message6'))
+        storage.dispose()
+        assert len(reader.get_logs_for_run('foo')) == 7
+
+
+def test_filesystem_event_log_storage_flush_interval():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, batch_size=100, flush_interval_ms=10)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_log_message('foo', 'Message1'))
+
+        start = time.time()
+        while not reader.get_logs_for_run('foo'):
+            assert time.time() - start < 5
+            time.sleep(0.01)
+
+        storage.dispose()
+
+
+BUFFERED_EVENT_SCRIPT = '''
+import sys
+import time
+
+from dagster.core.events.log import LogMessageRecord
+from dagster.core.storage.event_log import SqliteEventLogStorage
+
+storage = SqliteEventLogStorage(sys.argv[1], batch_size=100, flush_interval_ms=60000)
+storage.store_event(LogMessageRecord(None, 'Buffered', 'debug', '', 'foo', time.time()))
+# The process exits without disposing of the storage
+'''
+
+
+def test_filesystem_event_log_storage_flushed_at_exit():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        subprocess.check_call([sys.executable, '-c', BUFFERED_EVENT_SCRIPT, tmpdir_path])
+
+        reader = SqliteEventLogStorage(tmpdir_path)
+        assert [event.message for event in reader.get_logs_for_run('foo')] == ['Buffered']
+
+
+@pytest.mark.parametrize(
+    'storage_fn',
+    [lambda _: InMemoryEventLogStorage(), SqliteEventLogStorage],
+    ids=['in_memory', 'sqlite'],
+)
+def test_event_log_storage_cursor_and_limit(storage_fn):
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = storage_fn(tmpdir_path)
+        storage.store_event(_log_message('bar', 'Other'))
+        for i in range(5):
+            storage.store_event(_log_message('foo', 'Message{i}'.format(i=i)))
+
+        def messages(**kwargs):
+            return [event.message for event in storage.get_logs_for_run('foo', **kwargs)]
+
+        assert storage.get_event_count('foo') == 5
+        assert storage.get_event_count('bar') == 1
+        assert storage.get_event_count('baz') == 0
+
+        assert messages() == ['Message0', 'Message1', 'Message2', 'Message3', 'Message4']
+        assert messages(cursor=0) == ['Message1', 'Message2', 'Message3', 'Message4']
+        assert messages(cursor=3) == ['Message4']
+        assert messages(cursor=4) == []
+        assert messages(limit=2) == ['Message0', 'Message1']
+        assert messages(cursor=1, limit=2) == ['Message2', 'Message3']
+        assert messages(cursor=3, limit=2) == ['Message4']
+
+
+class _SingleDatabaseEventLogStorage(SqlEventLogStorage):
+    '''Stores the events for every run in one table, as Postgres does.'''
+
+    def __init__(self, conn_string):
+        self._engine = create_engine(conn_string)
+        SqlEventLogStorageMetadata.create_all(self._engine)
+
+    @contextmanager
+    def connect(self, run_id=None):
+        conn = self._engine.connect()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def upgrade(self):
+        pass
+
+    def watch(self, run_id, start_cursor, callback):
+        raise NotImplementedError()
+
+    def end_watch(self, run_id, handler):
+        raise NotImplementedError()
+
+
+def _step_success(run_id):
+    return DagsterEventRecord(
+        None,
+        'Step succeeded',
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            'nonce',
+            event_specific_data=StepSuccessData(duration_ms=1.0),
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    'storage_fn',
+    [
+        lambda _: InMemoryEventLogStorage(),
+        SqliteEventLogStorage,
+        lambda tmpdir_path: _SingleDatabaseEventLogStorage(
+            'sqlite:///{}'.format(os.path.join(tmpdir_path, 'events.db'))
+        ),
+    ],
+    ids=['in_memory', 'sqlite', 'single_database'],
+)
+def test_event_log_storage_stats_for_runs(storage_fn):
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = storage_fn(tmpdir_path)
+        storage.store_events(
+            [
+                _step_success('foo'),
+                _step_success('bar'),
+                _step_success('foo'),
+                _pipeline_success('foo'),
+                _log_message('bar', 'Message'),
+            ]
+        )
+
+        assert storage.get_stats_for_run('foo').steps_succeeded == 2
+        assert storage.get_stats_for_run('bar').steps_succeeded == 1
+
+        stats = storage.get_stats_for_runs(['foo', 'bar', 'baz'])
+        assert set(stats.keys()) == {'foo', 'bar', 'baz'}
+        assert stats['foo'].run_id == 'foo'
+        assert stats['foo'].steps_succeeded == 2
+        assert stats['foo'].end_time is not None
+        assert stats['bar'].steps_succeeded == 1
+        assert stats['bar'].end_time is None
+        assert stats['baz'].steps_succeeded == 0
+
+        assert storage.get_stats_for_runs([]) == {}
+
+
+@pytest.mark.parametrize(
+    'storage_fn',
+    [
+        lambda _: InMemoryEventLogStorage(),
+        SqliteEventLogStorage,
+        lambda tmpdir_path: _SingleDatabaseEventLogStorage(
+            'sqlite:///{}'.format(os.path.join(tmpdir_path, 'events.db'))
+        ),
+    ],
+    ids=['in_memory', 'sqlite', 'single_database'],
+)
+def test_event_log_storage_events_for_runs(storage_fn):
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = storage_fn(tmpdir_path)
+        storage.store_events(
+            [
+                _step_success('foo'),
+                _step_success('bar'),
+                _log_message('foo', 'Message'),
+                _pipeline_success('foo'),
+                _step_success('foo'),
+            ]
+        )
+
+        events = storage.get_events_for_runs(['foo', 'bar', 'baz'], [DagsterEventType.STEP_SUCCESS])
+        assert set(events.keys()) == {'foo', 'bar', 'baz'}
+        assert [record.dagster_event.event_type for record in events['foo']] == [
+            DagsterEventType.STEP_SUCCESS,
+            DagsterEventType.STEP_SUCCESS,
+        ]
+        assert [record.run_id for record in events['bar']] == ['bar']
+        assert events['baz'] == []
+
+        events = storage.get_events_for_runs(
+            ['foo'], [DagsterEventType.STEP_SUCCESS, DagsterEventType.PIPELINE_SUCCESS]
+        )
+        assert [record.dagster_event.event_type for record in events['foo']] == [
+            DagsterEventType.STEP_SUCCESS,
+            DagsterEventType.PIPELINE_SUCCESS,
+            DagsterEventType.STEP_SUCCESS,
+        ]
+
+        assert storage.get_events_for_runs([], [DagsterEventType.STEP_SUCCESS]) == {}
+
+
+def test_filesystem_event_log_storage_engine_cache():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_log_message('foo', 'Message1'))
+        engine = storage._get_engine('foo')  # pylint: disable=protected-access
+        storage.store_event(_log_message('foo', 'Message2'))
+        assert storage._get_engine('foo') is engine  # pylint: disable=protected-access
+
+        for i in range(MAX_CACHED_ENGINES):
+            storage.store_event(_log_message('run_{i}'.format(i=i), 'Message'))
+        assert storage._get_engine('foo') is not engine  # pylint: disable=protected-access
+        assert len(storage.get_logs_for_run('foo')) == 2
+
+        storage.wipe()
+        assert len(storage.get_logs_for_run('foo')) == 0
+        storage.store_event(_log_message('foo', 'Message3'))
+        assert len(storage.get_logs_for_run('foo')) == 1
+
+        storage.dispose()
+
+
 def test_event_log_delete():
     with seven.TemporaryDirectory() as tmpdir_path:
         storage = SqliteEventLogStorage(tmpdir_path)
@@ -0,0 +1,260 @@
+import gc
+import weakref
+
+import pytest
+
+from dagster import (
+    DagsterInvalidConfigError,
+    Dict,
+    Field,
+    Int,
+    ModeDefinition,
+    RunConfig,
+    String,
+    composite_solid,
+    execute_pipeline,
+    pipeline,
+    solid,
+)
+from dagster.core.definitions import create_environment_type
+from dagster.core.system_config.cache import (
+    DEFAULT_MAXSIZE,
+    ENVIRONMENT_CONFIG_CACHE,
+    PROCESSED_CONFIG_CACHE,
+    BoundedCache,
+    CacheInfo,
+    OwnedCache,
+    clear_environment_config_caches,
+    copy_config_value,
+    freeze_environment_dict,
+    process_environment_config,
+)
+from dagster.core.system_config.objects import EnvironmentConfig
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    clear_environment_config_caches()
+    yield
+    clear_environment_config_caches()
+
+
+@solid(config={'num': Field(Int), 'name': Field(String, is_optional=True)})
+def configured(_context):
+    pass
+
+
+@pipeline(mode_defs=[ModeDefinition('default'), ModeDefinition('other')])
+def configured_pipeline():
+    configured.alias('configured_one')()
+    configured.alias('configured_two')()
+
+
+def _environment_dict(one=1, two=2):
+    return {
+        'solids': {
+            'configured_one': {'config': {'num': one, 'name': 'one'}},
+            'configured_two': {'config': {'num': two}},
+        }
+    }
+
+
+def test_freeze_environment_dict():
+    assert freeze_environment_dict(_environment_dict()) == freeze_environment_dict(
+        {
+            'solids': {
+                'configured_two': {'config': {'num': 2}},
+                'configured_one': {'config': {'name': 'one', 'num': 1}},
+            }
+        }
+    )
+    assert freeze_environment_dict(_environment_dict()) != freeze_environment_dict(
+        _environment_dict(two=3)
+    )
+    assert freeze_environment_dict({'a': 1}) != freeze_environment_dict({'a': True})
+    assert freeze_environment_dict({'a': 1}) != freeze_environment_dict({'a': 1.0})
+    assert freeze_environment_dict({'a': [1, 2]}) != freeze_environment_dict({'a': [2, 1]})
+    assert freeze_environment_dict({'a': (1, 2)}) is None
+    assert freeze_environment_dict({'a': object()}) is None
+
+
+def test_bounded_cache():
+    cache = BoundedCache(maxsize=2)
+    assert cache.get_or_compute('a', lambda: 1) == 1
+    assert cache.get_or_compute('b', lambda: 2) == 2
+    assert cache.get_or_compute('a', lambda: 3) == 1
+    assert cache.cache_info() == CacheInfo(hits=1, misses=2, maxsize=2, currsize=2)
+
+    # b is the least recently used entry
+    assert cache.get_or_compute('c', lambda: 4) == 4
+    assert cache.get_or_compute('a', lambda: 5) == 1
+    assert cache.get_or_compute('b', lambda: 6) == 6
+
+    assert cache.get_or_compute(None, lambda: 7) == 7
+    assert cache.get_or_compute(None, lambda: 8) == 8
+    assert cache.cache_info() == CacheInfo(hits=2, misses=6, maxsize=2, currsize=2)
+
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+class Owner(object):
+    pass
+
+
+def test_owned_cache():
+    cache = OwnedCache(maxsize=2)
+    one = Owner()
+    two = Owner()
+    assert cache.get_or_compute(one, 'a', lambda: 1) == 1
+    assert cache.get_or_compute(two, 'a', lambda: 2) == 2
+    assert cache.get_or_compute(one, 'a', lambda: 3) == 1
+    assert cache.cache_info() == CacheInfo(hits=1, misses=2, maxsize=2, currsize=2)
+
+    one_ref = weakref.ref(one)
+    del one
+    gc.collect()
+    assert one_ref() is None
+    assert cache.cache_info() == CacheInfo(hits=0, misses=1, maxsize=2, currsize=1)
+
+    cache.clear()
+    assert cache.cache_info() == CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
+
+
+def test_copy_config_value():
+    value = {'a': [{'b': 1}], 'c': CacheInfo(hits=[1], misses=(2,), maxsize=None, currsize='d')}
+    copied = copy_config_value(value)
+    assert copied == value
+    assert copied is not value
+    assert copied['a'] is not value['a']
+    assert copied['a'][0] is not value['a'][0]
+    assert isinstance(copied['c'], CacheInfo)
+    assert copied['c'].hits is not value['c'].hits
+
+
+def test_build_environment_config_cached():
+    environment_config = EnvironmentConfig.build(configured_pipeline, _environment_dict())
+    assert environment_config.solids['configured_one'].config == {'num': 1, 'name': 'one'}
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().misses == 1
+    assert PROCESSED_CONFIG_CACHE.cache_info().misses == 1
+
+    environment_dict = _environment_dict()
+    cached_environment_config = EnvironmentConfig.build(configured_pipeline, environment_dict)
+    assert cached_environment_config == environment_config._replace(
+        original_config_dict=environment_dict
+    )
+    assert cached_environment_config.original_config_dict is environment_dict
+    assert cached_environment_config.solids is not environment_config.solids
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().hits == 1
+    assert PROCESSED_CONFIG_CACHE.cache_info().misses == 1
+
+    EnvironmentConfig.build(configured_pipeline, _environment_dict(two=3))
+    EnvironmentConfig.build(configured_pipeline, _environment_dict(), RunConfig(mode='other'))
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().misses == 3
+
+    sub_pipeline = configured_pipeline.build_sub_pipeline(['configured_one'])
+    assert configured_pipeline.build_sub_pipeline(['configured_one']) is sub_pipeline
+    sub_environment_dict = {'solids': {'configured_one': {'config': {'num': 1}}}}
+    EnvironmentConfig.build(sub_pipeline, sub_environment_dict)
+    EnvironmentConfig.build(
+        configured_pipeline.build_sub_pipeline(['configured_one']), sub_environment_dict
+    )
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().hits == 2
+
+
+def test_sub_pipelines_cached_by_solid_set():
+    sub_pipeline = configured_pipeline.build_sub_pipeline(['configured_one', 'configured_two'])
+    assert (
+        configured_pipeline.build_sub_pipeline(['configured_two', 'configured_one']) is sub_pipeline
+    )
+
+    @pipeline
+    def wide_pipeline():
+        for i in range(DEFAULT_MAXSIZE + 1):
+            configured.alias('configured_{i}'.format(i=i))()
+
+    first_sub_pipeline = wide_pipeline.build_sub_pipeline(['configured_0'])
+    for i in range(1, DEFAULT_MAXSIZE + 1):
+        wide_pipeline.build_sub_pipeline(['configured_{i}'.format(i=i)])
+
+    # Only the most recently used sub pipelines are kept
+    assert wide_pipeline.build_sub_pipeline(['configured_0']) is not first_sub_pipeline
+
+
+def test_mutated_solid_config_not_cached():
+    seen = []
+
+    @solid(config={'x': Field(Int), 'nested': Field(Dict({'y': Field(Int)}))})
+    def mutating(context):
+        seen.append((context.solid_config['x'], context.solid_config['nested']['y']))
+        context.solid_config['x'] += 100
+        context.solid_config['nested']['y'] += 1
+
+    @pipeline
+    def mutating_pipeline():
+        mutating()
+
+    environment_dict = {'solids': {'mutating': {'config': {'x': 1, 'nested': {'y': 1}}}}}
+    for _ in range(2):
+        assert execute_pipeline(mutating_pipeline, environment_dict).success
+
+    assert seen == [(1, 1), (1, 1)]
+    assert environment_dict == {'solids': {'mutating': {'config': {'x': 1, 'nested': {'y': 1}}}}}
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().hits >= 1
+
+
+def test_cache_does_not_keep_pipeline_alive():
+    @pipeline
+    def short_lived_pipeline():
+        configured()
+
+    environment_dict = {'solids': {'configured': {'config': {'num': 1}}}}
+    EnvironmentConfig.build(short_lived_pipeline, environment_dict)
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().currsize == 1
+
+    pipeline_ref = weakref.ref(short_lived_pipeline)
+    del short_lived_pipeline
+    gc.collect()
+    assert pipeline_ref() is None
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().currsize == 0
+
+
+def test_build_invalid_environment_config_cached():
+    environment_dict = {'solids': {'configured_one': {'config': {'num': 'not_a_num'}}}}
+
+    for _ in range(2):
+        with pytest.raises(DagsterInvalidConfigError):
+            EnvironmentConfig.build(configured_pipeline, environment_dict)
+
+    assert PROCESSED_CONFIG_CACHE.cache_info().hits == 1
+    assert PROCESSED_CONFIG_CACHE.cache_info().misses == 1
+
+    environment_type = create_environment_type(configured_pipeline, 'default')
+    assert not process_environment_config(environment_type, environment_dict).success
+    assert not process_environment_config(environment_type, None).success
+    assert not process_environment_config(environment_type, 'not_a_dict').success
+
+
+def test_build_environment_config_with_config_mapping_not_cached():
+    @composite_solid(
+        config={'num': Field(Int)},
+        config_fn=lambda context, config: {
+            'configured': {'config': {'num': config['num'], 'name': context.run_config.run_id}}
+        },
+    )
+    def mapped():
+        configured()
+
+    @pipeline
+    def mapped_pipeline():
+        mapped()
+
+    environment_dict = {'solids': {'mapped': {'config': {'num': 1}}}}
+
+    one = EnvironmentConfig.build(mapped_pipeline, environment_dict, RunConfig(run_id='one'))
+    two = EnvironmentConfig.build(mapped_pipeline, environment_dict, RunConfig(run_id='two'))
+    assert one.solids['mapped.configured'].config == {'num': 1, 'name': 'one'}
+    assert two.solids['mapped.configured'].config == {'num': 1, 'name': 'two'}
+
+    assert ENVIRONMENT_CONFIG_CACHE.cache_info().currsize == 0
+    assert PROCESSED_CONFIG_CACHE.cache_info().hits == 1
@@ -1,11 +1,22 @@
+import hashlib
 import os
+import time
 import uuid
 
 import pytest
 
-from dagster import Bool, List, Optional, String, check
+from dagster import Bool, List, Optional, String, check, seven
+from dagster.core.definitions.events import ObjectStoreOperationType
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.intermediate_store import build_fs_intermediate_store
+from dagster.core.storage.intermediate_store import (
+    build_fs_intermediate_store,
+    remove_unreferenced_blobs,
+)
+from dagster.core.storage.object_store import (
+    DEFAULT_SERIALIZATION_STRATEGY,
+    TEMP_BLOB_PREFIX,
+    FilesystemObjectStore,
+)
 from dagster.core.storage.type_storage import TypeStoragePlugin, TypeStoragePluginRegistry
 from dagster.core.types.runtime.marshal import SerializationStrategy
 from dagster.core.types.runtime.runtime_type import Bool as RuntimeBool
@@ -56,9 +67,147 @@ def test_file_system_intermediate_store():
         assert intermediate_store.has_object(context, ['true'])
         assert intermediate_store.get_object(context, RuntimeBool, ['true']).obj is True
         assert intermediate_store.uri_for_paths(['true']).startswith('file:///')
-        assert intermediate_store.rm_object(context, ['true']) is None
-        assert intermediate_store.rm_object(context, ['true']) is None
-        assert intermediate_store.rm_object(context, ['dslkfhjsdflkjfs']) is None
+        assert (
+            intermediate_store.rm_object(context, ['true']).op == ObjectStoreOperationType.RM_OBJECT
+        )
+        assert not intermediate_store.has_object(context, ['true'])
+        assert (
+            intermediate_store.rm_object(context, ['true']).op == ObjectStoreOperationType.RM_OBJECT
+        )
+        assert (
+            intermediate_store.rm_object(context, ['dslkfhjsdflkjfs']).op
+            == ObjectStoreOperationType.RM_OBJECT
+        )
+
+
+def test_file_system_intermediate_store_content_addressed():
+    with seven.TemporaryDirectory() as tempdir:
+        run_id = str(uuid.uuid4())
+        run_id_2 = str(uuid.uuid4())
+        instance = DagsterInstance.ephemeral(tempdir)
+        intermediate_store = build_fs_intermediate_store(
+            instance.intermediates_directory, run_id=run_id, blob_root=instance.blobs_directory()
+        )
+        intermediate_store_2 = build_fs_intermediate_store(
+            instance.intermediates_directory, run_id=run_id_2, blob_root=instance.blobs_directory()
+        )
+        assert intermediate_store.is_content_addressed
+
+        with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+            operation = intermediate_store.set_object('foo', context, RuntimeString, ['foo'])
+            assert operation.key.startswith(instance.blobs_directory())
+            assert intermediate_store.has_object(context, ['foo'])
+            assert intermediate_store.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+            # Objects with the same content are stored once
+            intermediate_store.set_object('foo', context, RuntimeString, ['other_foo'])
+            assert os.listdir(instance.blobs_directory()) == [os.path.basename(operation.key)]
+
+            intermediate_store_2.copy_object_from_prev_run(context, run_id, ['foo'])
+            assert intermediate_store_2.has_object(context, ['foo'])
+            assert intermediate_store_2.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+            # Removing an object from a run leaves it available to other runs
+            intermediate_store.rm_object(context, ['foo'])
+            assert not intermediate_store.has_object(context, ['foo'])
+            assert intermediate_store_2.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+            # References hold the key of the object relative to the blob root
+            assert DEFAULT_SERIALIZATION_STRATEGY.deserialize_from_file(
+                os.path.join(intermediate_store_2.root, 'foo.ref')
+            ) == os.path.basename(operation.key)
+
+
+def test_remove_unreferenced_blobs():
+    with seven.TemporaryDirectory() as tempdir:
+        run_id = str(uuid.uuid4())
+        run_id_2 = str(uuid.uuid4())
+        instance = DagsterInstance.ephemeral(tempdir)
+        intermediate_store = build_fs_intermediate_store(
+            instance.intermediates_directory, run_id=run_id, blob_root=instance.blobs_directory()
+        )
+        intermediate_store_2 = build_fs_intermediate_store(
+            instance.intermediates_directory, run_id=run_id_2, blob_root=instance.blobs_directory()
+        )
+
+        with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+            foo_key = intermediate_store.set_object('foo', context, RuntimeString, ['foo']).key
+            bar_key = intermediate_store.set_object('bar', context, RuntimeString, ['bar']).key
+            intermediate_store_2.copy_object_from_prev_run(context, run_id, ['foo'])
+
+            # A temporary file left behind by a process that died while writing a blob
+            temp_key = os.path.join(instance.blobs_directory(), TEMP_BLOB_PREFIX + 'dead')
+            with open(temp_key, 'wb'):
+                pass
+
+            # Every blob is referenced, or too recent to be removed
+            assert instance.remove_unreferenced_blobs() == []
+
+            intermediate_store.rm_object(context, ['foo'])
+            intermediate_store.rm_object(context, ['bar'])
+            assert instance.remove_unreferenced_blobs() == []
+
+            # The object that run_id_2 still refers to is kept
+            assert sorted(instance.remove_unreferenced_blobs(min_age_seconds=0)) == sorted(
+                [bar_key, temp_key]
+            )
+            assert os.listdir(instance.blobs_directory()) == [os.path.basename(foo_key)]
+            assert intermediate_store_2.get_object(context, RuntimeString, ['foo']).obj == 'foo'
+
+            intermediate_store_2.rm_object(context, ['foo'])
+            assert instance.remove_unreferenced_blobs(min_age_seconds=0) == [foo_key]
+            assert os.listdir(instance.blobs_directory()) == []
+
+
+def test_remove_unreferenced_blobs_under_reference_root():
+    with seven.TemporaryDirectory() as tempdir:
+        run_id = str(uuid.uuid4())
+        instance = DagsterInstance.ephemeral(tempdir)
+        blob_root = os.path.join(tempdir, 'blobs')
+        intermediate_store = build_fs_intermediate_store(
+            lambda _: tempdir, run_id=run_id, blob_root=blob_root
+        )
+
+        with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+            foo_key = intermediate_store.set_object('foo', context, RuntimeString, ['foo']).key
+            assert remove_unreferenced_blobs(blob_root, tempdir, min_age_seconds=0) == []
+
+            # Rewriting a blob makes it recent again
+            old = time.time() - 60
+            os.utime(foo_key, (old, old))
+            intermediate_store.rm_object(context, ['foo'])
+            intermediate_store.set_object('foo', context, RuntimeString, ['other_foo'])
+            intermediate_store.rm_object(context, ['other_foo'])
+            assert remove_unreferenced_blobs(blob_root, tempdir, min_age_seconds=30) == []
+            assert remove_unreferenced_blobs(blob_root, tempdir, min_age_seconds=0) == [foo_key]
+
+
+class SeekingSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(b'-' + value.encode('utf-8'))
+        write_file_obj.seek(0)
+        write_file_obj.write(b'+')
+
+    def deserialize(self, read_file_obj):
+        return read_file_obj.read()[1:].decode('utf-8')
+
+
+@pytest.mark.parametrize(
+    'serialization_strategy',
+    [
+        DEFAULT_SERIALIZATION_STRATEGY,
+        UppercaseSerializationStrategy('uppercase'),
+        SeekingSerializationStrategy('seeking'),
+    ],
+)
+def test_set_object_by_content_hash(serialization_strategy):
+    with seven.TemporaryDirectory() as tempdir:
+        operation = FilesystemObjectStore().set_object_by_content(
+            tempdir, 'foo', serialization_strategy
+        )
+        with open(operation.key, 'rb') as f:
+            assert os.path.basename(operation.key) == hashlib.sha256(f.read()).hexdigest()
+        assert serialization_strategy.deserialize_from_file(operation.key).lower() == 'foo'
 
 
 def test_file_system_intermediate_store_composite_types():
@@ -1,10 +1,13 @@
 import sys
+import time
 from collections import namedtuple
 from enum import Enum
 
 import pytest
 
 from dagster.check import ParameterCheckError
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
 from dagster.core.serdes import (
     _deserialize_json_to_dagster_namedtuple,
     _pack_value,
@@ -12,6 +15,9 @@ from dagster.core.serdes import (
     _unpack_value,
     _whitelist_for_serdes,
     deserialize_json_to_dagster_namedtuple,
+    pack_value,
+    serialize_dagster_namedtuple,
+    unpack_value,
 )
 
 
@@ -127,3 +133,24 @@ def test_backward_compat_serdes():
     assert deserialized.foo == quux.foo
     assert deserialized.bar == quux.bar
     assert not hasattr(deserialized, 'baz')
+
+
+def test_unpack_value_does_not_mutate():
+    record = DagsterEventRecord(
+        None,
+        'Message',
+        'debug',
+        '',
+        'foo',
+        time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            'nonce',
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+    packed = pack_value(record)
+    assert unpack_value(packed) == record
+    assert unpack_value(packed) == record
+    assert deserialize_json_to_dagster_namedtuple(serialize_dagster_namedtuple(record)) == record
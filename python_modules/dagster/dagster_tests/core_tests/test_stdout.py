@@ -1,14 +1,20 @@
 import os
 import random
 import string
+import subprocess
 import sys
 
 import pytest
 
-from dagster import DagsterEventType, execute_pipeline, lambda_solid, pipeline
-from dagster.core.execution.compute_logs import should_disable_io_stream_redirect
-from dagster.core.instance import DagsterInstance
+from dagster import DagsterEventType, execute_pipeline, lambda_solid, pipeline, seven
+from dagster.core.execution.compute_logs import TEE_READ_SIZE, should_disable_io_stream_redirect
+from dagster.core.instance import DagsterInstance, InstanceType
 from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.event_log import InMemoryEventLogStorage
+from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster.core.storage.root import LocalArtifactStorage
+from dagster.core.storage.runs import InMemoryRunStorage
+from dagster.seven import IS_WINDOWS
 
 
 @lambda_solid
@@ -112,3 +118,120 @@ def test_long_solid_names():
 
     stdout = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDOUT)
     assert stdout.data == HELLO_WORLD + SEPARATOR
+
+
+TEE_IO_SCRIPT = '''
+from __future__ import print_function
+
+import subprocess
+import sys
+
+from dagster.core.execution.compute_logs import TEE_READ_SIZE, tee_io
+
+with tee_io(sys.argv[1], sys.argv[2]):
+    print('Hello World')
+    # More output than fits in a pipe, which must not block
+    print('x' * (2 * TEE_READ_SIZE))
+    sys.stdout.flush()
+    print('Error', file=sys.stderr)
+    subprocess.check_call([sys.executable, '-c', 'print("From a subprocess")'])
+
+print('After')
+'''
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="compute logs are tailed by a subprocess on windows")
+def test_tee_io():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        outpath = os.path.join(tmpdir_path, 'out')
+        errpath = os.path.join(tmpdir_path, 'err')
+
+        process = subprocess.Popen(
+            [sys.executable, '-c', TEE_IO_SCRIPT, outpath, errpath],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = process.communicate()
+        assert process.returncode == 0
+
+        expected_out = '\n'.join([HELLO_WORLD, 'x' * (2 * TEE_READ_SIZE), 'From a subprocess', ''])
+        with open(outpath) as out_file:
+            assert out_file.read() == expected_out
+        with open(errpath) as err_file:
+            assert err_file.read() == 'Error\n'
+
+        # The output is copied to the original file descriptors, which are then restored
+        assert stdout.decode('utf-8') == expected_out + 'After\n'
+        assert stderr.decode('utf-8') == 'Error\n'
+
+
+TEE_IO_READ_FAILURE_SCRIPT = '''
+from __future__ import print_function
+
+import errno
+import sys
+
+from dagster.core.execution import compute_logs
+from dagster.core.execution.compute_logs import TEE_READ_SIZE, tee_io
+
+
+class FailingSelector(compute_logs.selectors.DefaultSelector):
+    def select(self, timeout=None):
+        raise OSError(errno.EIO, 'Failed to select')
+
+
+compute_logs.selectors.DefaultSelector = FailingSelector
+
+with tee_io(sys.argv[1], sys.argv[2]):
+    # More output than fits in a pipe, which must not block although it is no longer read
+    print('x' * (4 * TEE_READ_SIZE))
+    sys.stdout.flush()
+
+print('After')
+'''
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="compute logs are tailed by a subprocess on windows")
+def test_tee_io_read_failure():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                '-c',
+                TEE_IO_READ_FAILURE_SCRIPT,
+                os.path.join(tmpdir_path, 'out'),
+                os.path.join(tmpdir_path, 'err'),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        stdout, stderr = process.communicate()
+        assert process.returncode == 0
+        assert stdout.decode('utf-8').endswith('After\n')
+        assert 'Failed to select' in stderr.decode('utf-8')
+
+
+@pytest.mark.skipif(IS_WINDOWS, reason="compute logs are tailed by a subprocess on windows")
+def test_capture_in_process():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        manager = LocalComputeLogManager(tmpdir_path, capture_in_process=True)
+        instance = DagsterInstance(
+            instance_type=InstanceType.EPHEMERAL,
+            local_artifact_storage=LocalArtifactStorage(tmpdir_path),
+            run_storage=InMemoryRunStorage(),
+            event_storage=InMemoryEventLogStorage(),
+            compute_log_manager=manager,
+        )
+
+        result = execute_pipeline(spew_pipeline, instance=instance)
+        assert result.success
+
+        stdout = manager.read_logs_file(result.run_id, 'spew.compute', ComputeIOType.STDOUT)
+        assert stdout.data == HELLO_WORLD + SEPARATOR
+
+
+def test_capture_in_process_config():
+    assert not LocalComputeLogManager('/tmp').capture_in_process(None)
+
+    config_type = LocalComputeLogManager.config_type()
+    assert config_type.fields['capture_in_process'].default_value is False
@@ -56,9 +56,11 @@ def _do_setup(name='dagster'):
             'enum-compat>=0.0.1',
             'future',
             'funcsigs',
+            'futures; python_version<"3"',
             'functools32; python_version<"3"',
             'contextlib2>=0.5.4',
             'pathlib2>=2.3.4; python_version<"3"',
+            'selectors34; python_version<"3"',
             # cli
             'click>=5.0',
             'coloredlogs>=6.1',
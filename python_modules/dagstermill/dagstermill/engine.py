@@ -4,14 +4,39 @@ from papermill.engines import NBConvertEngine
 from papermill.log import logger
 from papermill.preprocess import PapermillExecutePreprocessor
 
+RESET_NAMESPACE_CODE = "get_ipython().run_line_magic('reset', '-f')\n"
+
 
 class DagstermillExecutePreprocessor(PapermillExecutePreprocessor):
+    # A preprocessor handed the manager of a pooled kernel executes the notebook in a namespace
+    # reset of whatever the notebooks previously executed in the kernel left behind, and leaves
+    # the resources held in the kernel to be torn down along with the kernel pool.
+    pooled_kernel = False
+
+    def preprocess(self, nb_man, resources, km=None):
+        self.pooled_kernel = km is not None  # pylint:disable = attribute-defined-outside-init
+        self._pooled_kernel_client = None  # pylint:disable = attribute-defined-outside-init
+        try:
+            return super(DagstermillExecutePreprocessor, self).preprocess(nb_man, resources, km=km)
+        finally:
+            # setup_preprocessor doesn't stop the channels of the clients it opens to kernels it
+            # did not start itself
+            if self._pooled_kernel_client is not None:
+                self._pooled_kernel_client.stop_channels()
+
     # We need to finalize dagster resources here (as opposed to, e.g., in the notebook_complete
     # method on the NotebookExecutionManager), because we need to be inside the scope of the
     # nbconvert.preprocessors.ExecutePreprocessor.setup_preprocessor context manager, which tears
     # the kernel down. Note that atexit doesn't seem to work at all in ipython, and hooking into
     # the ipython post_execute event doesn't work in papermill.
     def papermill_process(self, nb_man, resources):
+        if self.pooled_kernel:
+            self._pooled_kernel_client = self.kc  # pylint:disable = attribute-defined-outside-init
+            self.kc.execute_interactive(
+                RESET_NAMESPACE_CODE, store_history=False, timeout=self.startup_timeout
+            )
+            return super(DagstermillExecutePreprocessor, self).papermill_process(nb_man, resources)
+
         _, resources = super(DagstermillExecutePreprocessor, self).papermill_process(
             nb_man, resources
         )
@@ -47,6 +72,7 @@ class DagstermillNBConvertEngine(NBConvertEngine):
         stderr_file=None,
         start_timeout=60,
         execution_timeout=None,
+        kernel_manager=None,
         **kwargs
     ):
         # Nicely handle preprocessor arguments prioritizing values set by engine
@@ -58,4 +84,4 @@ class DagstermillNBConvertEngine(NBConvertEngine):
         )
 
         preprocessor.log_output = log_output  # pylint:disable = attribute-defined-outside-init
-        preprocessor.preprocess(nb_man, kwargs)
+        preprocessor.preprocess(nb_man, kwargs, km=kernel_manager)
@@ -0,0 +1,201 @@
+'''A pool of warm Jupyter kernels in which to execute the notebooks of dagstermill solids.
+
+Executing a notebook in a fresh kernel means paying, for every dagstermill solid, both the kernel's
+startup and the reconstitution of the pipeline context inside it -- rebuilding the pipeline
+definition from its handle and re-creating every resource. A solid that uses the kernel pool
+instead executes its notebook in one of a small number of kernels that are kept alive for the rest
+of the run. Kernels are started as notebooks are executed, up to the size of the pool, so a pool
+from which no notebook is executed costs nothing. The pipeline context, and the resources it
+holds, are reconstituted in a pooled kernel the first time it executes a notebook and are reused by
+every later notebook it executes, each of which starts from a reset namespace.
+
+The pool is a resource, so it lives as long as the pipeline execution context of the run: engines
+that execute every step in its own process, like the multiprocess engine, get no reuse from it.
+When the pipeline context is reconstituted inside a notebook kernel, the pool is replaced by None.
+'''
+
+import threading
+from contextlib import contextmanager
+
+from jupyter_client.manager import KernelManager
+
+from dagster import Field, Int, ModeDefinition, ResourceDefinition, String, check, resource
+
+KERNEL_POOL_RESOURCE_KEY = 'kernel_pool'
+
+TEARDOWN_CODE = 'import dagstermill as __dm_dagstermill\n__dm_dagstermill._teardown()\n'
+
+
+class KernelPool(object):
+    '''A pool of Jupyter kernels, each reused for the execution of many notebooks.
+
+    Args:
+        size (int): The number of kernels to keep in the pool.
+        kernel_name (str): The name of the kernelspec from which to start kernels.
+        startup_timeout (int): The number of seconds to wait for a kernel to start, and for the
+            resources held in a kernel to be torn down when the pool is shut down.
+    '''
+
+    def __init__(self, size, kernel_name, startup_timeout):
+        self.size = check.int_param(size, 'size')
+        check.param_invariant(size > 0, 'size', 'The kernel pool must hold at least one kernel')
+        self.kernel_name = check.str_param(kernel_name, 'kernel_name')
+        self.startup_timeout = check.int_param(startup_timeout, 'startup_timeout')
+
+        self._available = threading.Condition(threading.Lock())
+        self._kernels = []
+        self._idle = []
+        self._is_shutdown = False
+
+    def _start_kernel(self):
+        kernel_manager = KernelManager(kernel_name=self.kernel_name)
+        kernel_manager.start_kernel()
+        return kernel_manager
+
+    def _acquire(self):
+        with self._available:
+            while not self._idle and len(self._kernels) >= self.size:
+                check.invariant(not self._is_shutdown, 'The kernel pool has been shut down')
+                self._available.wait()
+            check.invariant(not self._is_shutdown, 'The kernel pool has been shut down')
+
+            if self._idle:
+                # The most recently used kernel is the most likely to hold a reconstituted context
+                kernel_manager = self._idle.pop()
+                if kernel_manager.is_alive():
+                    return kernel_manager
+                self._kernels.remove(kernel_manager)
+
+            kernel_manager = self._start_kernel()
+            self._kernels.append(kernel_manager)
+            return kernel_manager
+
+    def _release(self, kernel_manager):
+        with self._available:
+            self._idle.append(kernel_manager)
+            self._available.notify()
+
+    def _replace(self, kernel_manager):
+        try:
+            self._retire(kernel_manager)
+        finally:
+            # The kernel is replaced by a new one the next time one is checked out
+            with self._available:
+                self._kernels.remove(kernel_manager)
+                self._available.notify()
+
+    @contextmanager
+    def kernel(self):
+        '''Check a kernel out of the pool for the execution of a single notebook.
+
+        Starts a kernel if none of the kernels in the pool is idle and the pool is not yet full, and
+        otherwise blocks until one of them is idle. A kernel in which the notebook fails to execute
+        is torn down, rather than returned to the pool, since its resources may have been left in a
+        bad state.
+
+        Yields:
+            jupyter_client.manager.KernelManager: The manager of the kernel.
+        '''
+        kernel_manager = self._acquire()
+        try:
+            yield kernel_manager
+        except:  # pylint: disable=bare-except
+            self._replace(kernel_manager)
+            raise
+        else:
+            self._release(kernel_manager)
+
+    def _retire(self, kernel_manager):
+        try:
+            if kernel_manager.is_alive():
+                kernel_client = kernel_manager.client()
+                kernel_client.start_channels()
+                try:
+                    kernel_client.wait_for_ready(timeout=self.startup_timeout)
+                    kernel_client.execute_interactive(
+                        TEARDOWN_CODE, store_history=False, timeout=self.startup_timeout
+                    )
+                finally:
+                    kernel_client.stop_channels()
+        finally:
+            kernel_manager.shutdown_kernel(now=True)
+
+    def shutdown(self):
+        '''Tear down the resources held in every kernel in the pool, and shut the kernels down.'''
+        with self._available:
+            self._is_shutdown = True
+            kernels, self._kernels, self._idle = self._kernels, [], []
+            self._available.notify_all()
+
+        errors = []
+        for kernel_manager in kernels:
+            try:
+                self._retire(kernel_manager)
+            except Exception as err:  # pylint: disable=broad-except
+                errors.append(err)
+
+        # Every kernel is shut down before the first error in tearing one down is raised
+        if errors:
+            raise errors[0]
+
+
+@resource(
+    config={
+        'size': Field(
+            Int,
+            is_optional=True,
+            default_value=2,
+            description='The number of kernels to keep in the pool.',
+        ),
+        'kernel_name': Field(
+            String,
+            is_optional=True,
+            default_value='python3',
+            description='The name of the kernelspec from which to start kernels. This overrides '
+            'the kernelspec of the notebooks executed in the pool.',
+        ),
+        'startup_timeout': Field(
+            Int,
+            is_optional=True,
+            default_value=60,
+            description='The number of seconds to wait for a kernel to start.',
+        ),
+    },
+    description='A pool of warm Jupyter kernels in which dagstermill solids defined with '
+    'use_kernel_pool=True execute their notebooks.',
+)
+def kernel_pool_resource(init_context):
+    pool = KernelPool(
+        size=init_context.resource_config['size'],
+        kernel_name=init_context.resource_config['kernel_name'],
+        startup_timeout=init_context.resource_config['startup_timeout'],
+    )
+    try:
+        yield pool
+    finally:
+        pool.shutdown()
+
+
+def stub_kernel_pools(mode_def):
+    '''Replace every kernel pool among the resources of a mode by None.
+
+    Notebooks never execute other notebooks, so a pipeline context reconstituted inside a notebook
+    kernel has no use for a kernel pool of its own.
+    '''
+    check.inst_param(mode_def, 'mode_def', ModeDefinition)
+
+    return ModeDefinition(
+        name=mode_def.name,
+        resource_defs={
+            resource_key: (
+                ResourceDefinition.none_resource(resource_def.description)
+                if resource_def is kernel_pool_resource
+                else resource_def
+            )
+            for resource_key, resource_def in mode_def.resource_defs.items()
+        },
+        logger_defs=mode_def.loggers,
+        system_storage_defs=mode_def.system_storage_defs,
+        executor_defs=mode_def.executor_defs,
+        description=mode_def.description,
+    )
@@ -14,6 +14,7 @@ from dagster import (
     SolidDefinition,
     TypeCheck,
     check,
+    seven,
 )
 from dagster.cli import load_handle
 from dagster.core.definitions.dependency import SolidHandle
@@ -26,6 +27,7 @@ from dagster.loggers import colored_console_logger
 
 from .context import DagstermillExecutionContext
 from .errors import DagstermillError
+from .kernel_pool import stub_kernel_pools
 from .serialize import PICKLE_PROTOCOL, read_value, write_value
 
 
@@ -38,6 +40,8 @@ class Manager(object):
         self.marshal_dir = None
         self.context = None
         self.resources_stack = None
+        self._pipeline_context = None
+        self._pipeline_context_key = None
 
     @contextmanager
     def _setup_resources(self, pipeline_def, environment_config, pipeline_run, log_manager):
@@ -45,12 +49,16 @@ class Manager(object):
         dagster.core.execution.context_creation_pipeline.create_resources. It uses the Manager's
         instance of ResourceStack to create resources, but does not tear them down when the
         context manager returns -- teardown must be managed manually using Manager.teardown().
+        Kernel pools are replaced by None, so that a notebook kernel never starts kernels of its own.
         '''
 
         # pylint: disable=protected-access
         self.resources_stack = ResourcesStack(
             pipeline_def, environment_config, pipeline_run, log_manager
         )
+        self.resources_stack.mode_definition = stub_kernel_pools(
+            self.resources_stack.mode_definition
+        )
         yield self.resources_stack.create()
 
     def reconstitute_pipeline_context(
@@ -84,6 +92,32 @@ class Manager(object):
         check.dict_param(solid_handle_kwargs, 'solid_handle_kwargs')
         check.dict_param(instance_ref_dict, 'instance_ref_dict')
 
+        # A kernel in a dagstermill kernel pool executes many notebooks in the same run: the
+        # pipeline context, and the resources it holds, are reconstituted for the first of them
+        # and reused by the rest until they are torn down.
+        pipeline_context_key = seven.json.dumps(
+            [environment_dict, handle_kwargs, pipeline_run_dict, solid_subset, instance_ref_dict],
+            sort_keys=True,
+        )
+        if pipeline_context_key != self._pipeline_context_key:
+            self.teardown_resources()
+            self._reconstitute_pipeline_execution_context(
+                environment_dict, handle_kwargs, pipeline_run_dict, solid_subset, instance_ref_dict
+            )
+            self._pipeline_context_key = pipeline_context_key
+
+        solid_handle = SolidHandle.from_dict(solid_handle_kwargs)
+
+        self.marshal_dir = marshal_dir
+        self.in_pipeline = True
+        self.solid_def = self.pipeline_def.get_solid(solid_handle)
+        self.context = DagstermillExecutionContext(self._pipeline_context)
+
+        return self.context
+
+    def _reconstitute_pipeline_execution_context(
+        self, environment_dict, handle_kwargs, pipeline_run_dict, solid_subset, instance_ref_dict
+    ):
         try:
             handle = load_handle.handle_for_pipeline_cli_args(
                 handle_kwargs, use_default_repository_yaml=False
@@ -116,14 +150,8 @@ class Manager(object):
             PipelineDefinition,
         ).build_sub_pipeline(solid_subset)
 
-        solid_handle = SolidHandle.from_dict(solid_handle_kwargs)
-        solid_def = pipeline_def.get_solid(solid_handle)
-
         pipeline_run = unpack_value(pipeline_run_dict)
 
-        self.marshal_dir = marshal_dir
-        self.in_pipeline = True
-        self.solid_def = solid_def
         self.pipeline_def = pipeline_def
 
         with scoped_pipeline_context(
@@ -133,9 +161,7 @@ class Manager(object):
             instance=instance,
             scoped_resources_builder_cm=self._setup_resources,
         ) as pipeline_context:
-            self.context = DagstermillExecutionContext(pipeline_context)
-
-        return self.context
+            self._pipeline_context = pipeline_context
 
     def get_context(self, solid_config=None, mode_def=None, environment_dict=None):
         '''Get a dagstermill execution context for interactive exploration and development.
@@ -192,6 +218,7 @@ class Manager(object):
         self.in_pipeline = False
         self.solid_def = solid_def
         self.pipeline_def = pipeline_def
+        self._pipeline_context_key = None
 
         with scoped_pipeline_context(
             self.pipeline_def,
@@ -260,6 +287,8 @@ class Manager(object):
     def teardown_resources(self):
         if self.resources_stack is not None:
             self.resources_stack.teardown()
+            self.resources_stack = None
+        self._pipeline_context_key = None
 
     def load_parameter(self, input_name, input_value):
         input_def = self.solid_def.input_def_named(input_name)
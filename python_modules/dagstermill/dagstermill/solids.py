@@ -30,6 +30,7 @@ from dagster.utils import mkdir_p, safe_tempfile_path
 
 from .engine import DagstermillNBConvertEngine
 from .errors import DagstermillError, DagstermillExecutionError
+from .kernel_pool import KERNEL_POOL_RESOURCE_KEY
 from .serialize import read_value, write_value
 from .translator import RESERVED_INPUT_NAMES, DagsterTranslator
 
@@ -142,9 +143,10 @@ def get_papermill_parameters(compute_context, inputs, output_log_path):
     return parameters
 
 
-def _dm_solid_compute(name, notebook_path):
+def _dm_solid_compute(name, notebook_path, use_kernel_pool):
     check.str_param(name, 'name')
     check.str_param(notebook_path, 'notebook_path')
+    check.bool_param(use_kernel_pool, 'use_kernel_pool')
 
     def _t_fn(compute_context, inputs):
         check.inst_param(compute_context, 'compute_context', ComputeExecutionContext)
@@ -188,9 +190,20 @@ def _dm_solid_compute(name, notebook_path):
             ):
                 try:
                     papermill_engines.register('dagstermill', DagstermillNBConvertEngine)
-                    papermill.execute_notebook(
-                        intermediate_path, temp_path, engine_name='dagstermill', log_output=True
-                    )
+                    if use_kernel_pool:
+                        kernel_pool = getattr(compute_context.resources, KERNEL_POOL_RESOURCE_KEY)
+                        with kernel_pool.kernel() as kernel_manager:
+                            papermill.execute_notebook(
+                                intermediate_path,
+                                temp_path,
+                                engine_name='dagstermill',
+                                log_output=True,
+                                kernel_manager=kernel_manager,
+                            )
+                    else:
+                        papermill.execute_notebook(
+                            intermediate_path, temp_path, engine_name='dagstermill', log_output=True
+                        )
                 except Exception as exc:
                     yield Materialization(
                         label='output_notebook',
@@ -238,6 +251,7 @@ def define_dagstermill_solid(
     output_defs=None,
     config=None,
     required_resource_keys=None,
+    use_kernel_pool=False,
 ):
     '''Wrap a Jupyter notebook in a solid.
 
@@ -247,6 +261,12 @@ def define_dagstermill_solid(
         input_defs (Optional[list[:class:`dagster.InputDefinition`]]): The solid's inputs.
         output_defs (Optional[list[:class:`dagster.OutputDefinition`]]): The solid's outputs.
         required_resource_keys (Optional[set[str]]): The string names of any required resources.
+        use_kernel_pool (Optional[bool]): Whether to execute the notebook in a warm kernel from the
+            ``kernel_pool`` resource, which must be provided by
+            :py:data:`dagstermill.kernel_pool_resource`, rather than in a fresh kernel. The notebook
+            is then executed in a reset namespace, but shares the pipeline context and resources
+            reconstituted in the kernel with the other notebooks executed in it during the run.
+            (default: ``False``)
 
     Returns:
         :class:`dagster.SolidDefinition`
@@ -258,11 +278,15 @@ def define_dagstermill_solid(
     required_resource_keys = check.opt_set_param(
         required_resource_keys, 'required_resource_keys', of_type=str
     )
+    check.bool_param(use_kernel_pool, 'use_kernel_pool')
+
+    if use_kernel_pool:
+        required_resource_keys = required_resource_keys | {KERNEL_POOL_RESOURCE_KEY}
 
     return SolidDefinition(
         name=name,
         input_defs=input_defs,
-        compute_fn=_dm_solid_compute(name, notebook_path),
+        compute_fn=_dm_solid_compute(name, notebook_path, use_kernel_pool),
         output_defs=output_defs,
         config=check_user_facing_opt_config_param(
             config, 'config', 'of a dagstermill solid named "{name}"'.format(name=name)
@@ -0,0 +1,124 @@
+import pytest
+
+from dagster import ModeDefinition, ResourceDefinition, execute_pipeline, pipeline, solid
+from dagstermill import kernel_pool as kernel_pool_module
+from dagstermill.kernel_pool import KernelPool, kernel_pool_resource, stub_kernel_pools
+
+
+class FakeKernelClient(object):
+    def __init__(self, kernel_manager):
+        self.kernel_manager = kernel_manager
+
+    def start_channels(self):
+        pass
+
+    def wait_for_ready(self, timeout=None):
+        pass
+
+    def execute_interactive(self, code, store_history=True, timeout=None):
+        self.kernel_manager.executed.append(code)
+
+    def stop_channels(self):
+        pass
+
+
+class FakeKernelManager(object):
+    started = []
+
+    def __init__(self, kernel_name):
+        self.kernel_name = kernel_name
+        self.alive = False
+        self.executed = []
+
+    def start_kernel(self):
+        self.alive = True
+        FakeKernelManager.started.append(self)
+
+    def is_alive(self):
+        return self.alive
+
+    def client(self):
+        return FakeKernelClient(self)
+
+    def shutdown_kernel(self, now=False):
+        self.alive = False
+
+
+@pytest.fixture(autouse=True)
+def fake_kernel_manager(monkeypatch):
+    FakeKernelManager.started = []
+    monkeypatch.setattr(kernel_pool_module, 'KernelManager', FakeKernelManager)
+
+
+def test_kernel_pool_starts_kernels_on_checkout():
+    pool = KernelPool(size=2, kernel_name='python3', startup_timeout=60)
+    assert FakeKernelManager.started == []
+
+    with pool.kernel() as first:
+        assert FakeKernelManager.started == [first]
+        with pool.kernel() as second:
+            assert FakeKernelManager.started == [first, second]
+
+    # Idle kernels are reused rather than started again
+    with pool.kernel() as kernel_manager:
+        assert kernel_manager in (first, second)
+    assert len(FakeKernelManager.started) == 2
+
+    pool.shutdown()
+    assert not first.is_alive()
+    assert not second.is_alive()
+    assert first.executed == [kernel_pool_module.TEARDOWN_CODE]
+
+
+def test_kernel_pool_retires_failed_kernel():
+    pool = KernelPool(size=1, kernel_name='python3', startup_timeout=60)
+
+    with pytest.raises(ValueError):
+        with pool.kernel() as failed:
+            raise ValueError('The notebook failed')
+
+    assert not failed.is_alive()
+    assert failed.executed == [kernel_pool_module.TEARDOWN_CODE]
+    assert FakeKernelManager.started == [failed]
+
+    with pool.kernel() as kernel_manager:
+        assert kernel_manager is not failed
+    assert FakeKernelManager.started == [failed, kernel_manager]
+
+    pool.shutdown()
+
+
+def test_kernel_pool_resource_starts_no_kernels():
+    @solid(required_resource_keys={'kernel_pool'})
+    def uses_no_kernel(context):
+        assert isinstance(context.resources.kernel_pool, KernelPool)
+
+    @pipeline(mode_defs=[ModeDefinition(resource_defs={'kernel_pool': kernel_pool_resource})])
+    def kernel_pool_pipeline():
+        uses_no_kernel()
+
+    assert execute_pipeline(kernel_pool_pipeline).success
+    assert FakeKernelManager.started == []
+
+
+def test_stub_kernel_pools():
+    @solid(required_resource_keys={'kernel_pool', 'other'})
+    def stubbed(context):
+        assert context.resources.kernel_pool is None
+        assert context.resources.other == 'other'
+
+    other_resource = ResourceDefinition.hardcoded_resource('other')
+    mode_def = ModeDefinition(
+        resource_defs={'kernel_pool': kernel_pool_resource, 'other': other_resource}
+    )
+    stubbed_mode_def = stub_kernel_pools(mode_def)
+    assert stubbed_mode_def.name == mode_def.name
+    assert stubbed_mode_def.resource_defs['kernel_pool'] is not kernel_pool_resource
+    assert stubbed_mode_def.resource_defs['other'] is other_resource
+
+    @pipeline(mode_defs=[stubbed_mode_def])
+    def stubbed_pipeline():
+        stubbed()
+
+    assert execute_pipeline(stubbed_pipeline).success
+    assert FakeKernelManager.started == []
@@ -215,3 +215,72 @@ def test_in_pipeline_manager_with_resources():
     finally:
         if os.path.exists(path):
             os.unlink(path)
+
+
+def test_in_pipeline_manager_reuses_pipeline_context():
+    with tempfile.NamedTemporaryFile() as fd:
+        path = fd.name
+
+    def read_messages():
+        with open(path, 'rb') as fd:
+            return [message.split(': ')[1] for message in pickle.load(fd)]
+
+    def pipeline_run_dict(run_id):
+        return pack_value(
+            PipelineRun(
+                pipeline_name='resource_pipeline',
+                run_id=run_id,
+                mode='prod',
+                environment_dict=None,
+                selector=None,
+                reexecution_config=None,
+                step_keys_to_execute=None,
+                status=PipelineRunStatus.NOT_STARTED,
+            )
+        )
+
+    manager = Manager()
+    marshal_dir = tempfile.mkdtemp()
+    context_dict = {
+        'pipeline_run_dict': pipeline_run_dict(str(uuid.uuid4())),
+        'solid_handle_kwargs': SolidHandle(
+            'hello_world_resource', 'hello_world_resource', None
+        )._asdict(),
+        'handle_kwargs': {
+            'pipeline_name': 'resource_pipeline',
+            'fn_name': 'define_resource_pipeline',
+            'module_name': 'dagstermill.examples.repository',
+        },
+        'marshal_dir': marshal_dir,
+        'environment_dict': {'resources': {'list': {'config': path}}},
+        'instance_ref_dict': pack_value(DagsterInstance.local_temp().get_ref()),
+    }
+
+    try:
+        manager.reconstitute_pipeline_context(**context_dict)
+        resources = manager.context.resources
+
+        # A notebook executed in the same kernel during the same run reuses the resources
+        manager.reconstitute_pipeline_context(
+            **dict(
+                context_dict,
+                solid_handle_kwargs=SolidHandle('resource_solid', 'resource_solid', None)._asdict(),
+            )
+        )
+        assert manager.solid_def.name == 'resource_solid'
+        assert manager.context.resources.list is resources.list
+        assert read_messages() == ['Opened']
+
+        # A notebook executed during another run tears them down and creates its own
+        manager.reconstitute_pipeline_context(
+            **dict(context_dict, pipeline_run_dict=pipeline_run_dict(str(uuid.uuid4())))
+        )
+        assert read_messages() == ['Opened', 'Closed', 'Opened']
+
+        manager.teardown_resources()
+        assert read_messages() == ['Opened', 'Closed', 'Opened', 'Closed']
+
+    finally:
+        shutil.rmtree(marshal_dir)
+        if os.path.exists(path):
+            os.unlink(path)
@@ -1,6 +1,8 @@
 from dagster import check
+from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.storage.intermediate_store import IntermediateStore
 from dagster.core.storage.type_storage import TypeStoragePluginRegistry
+from dagster.core.types.runtime.runtime_type import RuntimeType
 
 from .object_store import S3ObjectStore
 
@@ -35,3 +37,29 @@ class S3IntermediateStore(IntermediateStore):
                 TypeStoragePluginRegistry,
             ),
         )
+
+        # Keys under the root of this run that this store has written or copied to. Any other key
+        # under the root can only hold an object left by an earlier attempt at the same step, which
+        # a single upload replaces whole, so there is no need to look for existing objects first.
+        self._written_keys = set()
+
+    def set_object(self, obj, context, runtime_type, paths):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(runtime_type, 'runtime_type', RuntimeType)
+        check.list_param(paths, 'paths', of_type=str)
+        check.param_invariant(len(paths) > 0, 'paths')
+        key = self.key_for_paths(paths)
+        check_existing = key in self._written_keys
+        self._written_keys.add(key)
+        return self.object_store.set_object(
+            key,
+            obj,
+            serialization_strategy=runtime_type.serialization_strategy,
+            check_existing=check_existing,
+        )
+
+    def copy_object_from_prev_run(self, context, previous_run_id, paths):
+        self._written_keys.add(self.key_for_paths(paths))
+        return super(S3IntermediateStore, self).copy_object_from_prev_run(
+            context, previous_run_id, paths
+        )
@@ -1,5 +1,5 @@
+import io
 import logging
-from io import BytesIO
 
 import boto3
 
@@ -9,15 +9,33 @@ from dagster.core.storage.object_store import ObjectStore
 from dagster.core.types.runtime.marshal import SerializationStrategy
 
 
+# S3 requires every part of a multipart upload except the last to be at least 5 MiB
+DEFAULT_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+
+DEFAULT_DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
+
 class S3ObjectStore(ObjectStore):
-    def __init__(self, bucket, s3_session=None):
+    def __init__(self, bucket, s3_session=None, multipart_chunksize=DEFAULT_MULTIPART_CHUNKSIZE):
         self.bucket = check.str_param(bucket, 'bucket')
         self.s3 = s3_session or boto3.client('s3')
         self.s3.head_bucket(Bucket=bucket)
+        self.multipart_chunksize = check.int_param(multipart_chunksize, 'multipart_chunksize')
         super(S3ObjectStore, self).__init__('s3', sep='/')
 
-    def set_object(self, key, obj, serialization_strategy=None):
+    def set_object(self, key, obj, serialization_strategy=None, check_existing=True):
+        '''Serialize an object straight into an upload to S3.
+
+        Objects larger than multipart_chunksize are uploaded in parts, so at most about one part
+        of the serialized object is held in memory at a time.
+
+        Args:
+            check_existing (Optional[bool]): Whether to remove any objects under the key before
+                writing. Callers that know the key to be fresh can skip the extra round trips.
+                (default: True)
+        '''
         check.str_param(key, 'key')
+        check.bool_param(check_existing, 'check_existing')
 
         logging.info('Writing S3 object at: ' + self.uri_for_key(key))
 
@@ -26,14 +44,12 @@ class S3ObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
+        if check_existing and self.has_object(key):
             logging.warning('Removing existing S3 key: {key}'.format(key=key))
             self.rm_object(key)
 
-        with BytesIO() as bytes_io:
-            serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+        with S3MultipartWriter(self.s3, self.bucket, key, self.multipart_chunksize) as writer:
+            serialization_strategy.serialize(obj, writer)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -49,9 +65,11 @@ class S3ObjectStore(ObjectStore):
         check.param_invariant(len(key) > 0, 'key')
 
         # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read())
-        )
+        body = self.s3.get_object(Bucket=self.bucket, Key=key)['Body']
+        with io.BufferedReader(
+            S3StreamingBodyReader(body), buffer_size=DEFAULT_DOWNLOAD_BUFFER_SIZE
+        ) as reader:
+            obj = serialization_strategy.deserialize(reader)
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -119,3 +137,112 @@ class S3ObjectStore(ObjectStore):
         check.str_param(key, 'key')
         protocol = check.opt_str_param(protocol, 'protocol', default='s3://')
         return protocol + self.bucket + '/' + '{key}'.format(key=key)
+
+
+class S3MultipartWriter(io.RawIOBase):
+    '''A writable file-like object that uploads everything written to it to an S3 key.
+
+    Writes are buffered until a part of chunksize bytes is full, which is then uploaded as part of
+    a multipart upload. Objects smaller than a single part are uploaded with a single put_object
+    call instead. The upload is completed when the writer is closed, and aborted if the block
+    using it as a context manager raises.
+    '''
+
+    def __init__(self, s3, bucket, key, chunksize=DEFAULT_MULTIPART_CHUNKSIZE):
+        super(S3MultipartWriter, self).__init__()
+        self.s3 = s3
+        self.bucket = check.str_param(bucket, 'bucket')
+        self.key = check.str_param(key, 'key')
+        self.chunksize = check.int_param(chunksize, 'chunksize')
+
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._parts = []
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._buffer.extend(b)
+        while len(self._buffer) >= self.chunksize:
+            self._upload_part(bytes(self._buffer[: self.chunksize]))
+            del self._buffer[: self.chunksize]
+        return len(b)
+
+    def _upload_part(self, data):
+        if self._upload_id is None:
+            self._upload_id = self.s3.create_multipart_upload(Bucket=self.bucket, Key=self.key)[
+                'UploadId'
+            ]
+
+        part_number = len(self._parts) + 1
+        response = self.s3.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if self._upload_id is None:
+                self.s3.put_object(
+                    Bucket=self.bucket, Key=self.key, Body=io.BytesIO(bytes(self._buffer))
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self.s3.complete_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={'Parts': self._parts},
+                )
+        except Exception:  # pylint: disable=broad-except
+            self.abort()
+            raise
+        finally:
+            self._buffer = bytearray()
+            super(S3MultipartWriter, self).close()
+
+    def abort(self):
+        if self._upload_id is not None:
+            self.s3.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+            self._upload_id = None
+        self._buffer = bytearray()
+        super(S3MultipartWriter, self).close()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class S3StreamingBodyReader(io.RawIOBase):
+    '''Adapts the body of an S3 get_object response to a raw stream, so that it can be wrapped in an
+    io.BufferedReader and deserialized without first reading the whole object into memory.'''
+
+    def __init__(self, body):
+        super(S3StreamingBodyReader, self).__init__()
+        self.body = body
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self.body.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self.body.close()
+        super(S3StreamingBodyReader, self).close()
@@ -15,6 +15,7 @@ class S3FakeSession(object):
     def __init__(self, buckets=None):
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
         self.mock_extras = mock.MagicMock()
+        self.multipart_uploads = {}
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
         self.mock_extras.head_bucket(*args, **kwargs)
@@ -25,16 +26,43 @@ class S3FakeSession(object):
 
     def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
         self.mock_extras.list_objects_v2(*args, **kwargs)
-        key = self.buckets.get(Bucket, {}).get(Prefix)
-        if key:
-            return {'KeyCount': 1, 'Contents': [{'Key': key}], 'IsTruncated': False}
+        if self.has_object(Bucket, Prefix):
+            return {'KeyCount': 1, 'Contents': [{'Key': Prefix}], 'IsTruncated': False}
         else:
             return {'KeyCount': 0, 'Contents': [], 'IsTruncated': False}
 
+    def delete_objects(self, Bucket, Delete, *args, **kwargs):
+        self.mock_extras.delete_objects(*args, **kwargs)
+        for obj in Delete['Objects']:
+            self.buckets[Bucket].pop(obj['Key'], None)
+
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
         self.buckets[Bucket][Key] = Body.read()
 
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = str(len(self.multipart_uploads))
+        self.multipart_uploads[upload_id] = (Bucket, Key, {})
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        self.mock_extras.upload_part(*args, **kwargs)
+        _, _, parts = self.multipart_uploads[UploadId]
+        parts[PartNumber] = Body
+        return {'ETag': str(PartNumber)}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs):
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        _, _, parts = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b''.join(
+            parts[part['PartNumber']] for part in MultipartUpload['Parts']
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, *args, **kwargs):
+        self.mock_extras.abort_multipart_upload(*args, **kwargs)
+        self.multipart_uploads.pop(UploadId)
+
     def get_object(self, Bucket, Key, *args, **kwargs):
         if not self.has_object(Bucket, Key):
             raise ClientError({}, None)
@@ -0,0 +1,68 @@
+import pytest
+from dagster_aws.s3.object_store import S3ObjectStore
+from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+from dagster.core.types.runtime.marshal import PickleSerializationStrategy, SerializationStrategy
+
+CHUNKSIZE = 1024
+
+
+def test_s3_object_store_small_object():
+    session = S3FakeSession()
+    s = S3ObjectStore('some-bucket', s3_session=session, multipart_chunksize=CHUNKSIZE)
+    ss = PickleSerializationStrategy()
+
+    s.set_object('small', 'foo', ss)
+
+    assert session.mock_extras.put_object.call_count == 1
+    assert session.mock_extras.create_multipart_upload.call_count == 0
+    assert s.get_object('small', ss).obj == 'foo'
+
+
+def test_s3_object_store_multipart():
+    session = S3FakeSession()
+    s = S3ObjectStore('some-bucket', s3_session=session, multipart_chunksize=CHUNKSIZE)
+    ss = PickleSerializationStrategy()
+
+    value = [str(i) * 100 for i in range(100)]
+    s.set_object('large', value, ss)
+
+    assert session.mock_extras.put_object.call_count == 0
+    assert session.mock_extras.upload_part.call_count > 1
+    assert session.mock_extras.complete_multipart_upload.call_count == 1
+    assert not session.multipart_uploads
+    assert s.get_object('large', ss).obj == value
+
+
+def test_s3_object_store_skip_check_existing():
+    session = S3FakeSession()
+    s = S3ObjectStore('some-bucket', s3_session=session)
+    ss = PickleSerializationStrategy()
+
+    s.set_object('foo', 1, ss, check_existing=False)
+    assert session.mock_extras.list_objects_v2.call_count == 0
+
+    s.set_object('foo', 2, ss)
+    assert session.mock_extras.list_objects_v2.call_count > 0
+    assert s.get_object('foo', ss).obj == 2
+
+
+class FailingSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    def serialize(self, value, write_file_obj):
+        write_file_obj.write(b'x' * (2 * CHUNKSIZE))
+        raise Exception('whoops')
+
+    def deserialize(self, read_file_obj):
+        raise NotImplementedError()
+
+
+def test_s3_object_store_aborts_failed_upload():
+    session = S3FakeSession()
+    s = S3ObjectStore('some-bucket', s3_session=session, multipart_chunksize=CHUNKSIZE)
+
+    with pytest.raises(Exception, match='whoops'):
+        s.set_object('failed', 1, FailingSerializationStrategy('failing'))
+
+    assert session.mock_extras.abort_multipart_upload.call_count == 1
+    assert not session.multipart_uploads
+    assert not s.has_object('failed')
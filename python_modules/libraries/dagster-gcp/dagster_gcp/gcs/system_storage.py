@@ -1,4 +1,4 @@
-from dagster import Field, String, SystemStorageData, system_storage
+from dagster import Bool, Field, Int, String, SystemStorageData, system_storage
 from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
 from dagster.core.storage.system_storage import fs_system_storage, mem_system_storage
 
@@ -12,6 +12,8 @@ from .intermediate_store import GCSIntermediateStore
     config={
         'gcs_bucket': Field(String),
         'gcs_prefix': Field(String, is_optional=True, default_value='dagster'),
+        'max_concurrent_reads': Field(Int, is_optional=True, default_value=1),
+        'prefetch_inputs': Field(Bool, is_optional=True, default_value=False),
     },
     required_resource_keys={'gcs'},
 )
@@ -34,7 +36,9 @@ def gcs_system_storage(init_context):
                 gcs_prefix=init_context.system_storage_config['gcs_prefix'],
                 run_id=init_context.pipeline_run.run_id,
                 type_storage_plugin_registry=init_context.type_storage_plugin_registry,
-            )
+            ),
+            max_concurrent_reads=init_context.system_storage_config['max_concurrent_reads'],
+            prefetch_inputs=init_context.system_storage_config['prefetch_inputs'],
         ),
     )
 
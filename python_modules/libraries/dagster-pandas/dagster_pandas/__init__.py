@@ -1,3 +1,4 @@
 from .data_frame import DataFrame
+from .numpy_array import NumpyArray
 
-__all__ = ['DataFrame']
+__all__ = ['DataFrame', 'NumpyArray']
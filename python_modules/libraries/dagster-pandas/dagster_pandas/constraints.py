@@ -1,10 +1,14 @@
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
 from pandas import DataFrame
 from six import with_metaclass
 
 from dagster import check
 
+MAX_OFFENDING_ROWS = 10
+'''The number of rows that violate a constraint that are reported in the exception it raises.'''
+
 
 class ConstraintViolationException(Exception):
     def __init__(self, constraint_name, constraint_description, column_name, offending_rows=None):
@@ -82,43 +86,76 @@ class ColumnTypeConstraint(Constraint):
             )
 
 
-class NonNullableColumnConstraint(Constraint):
+class ColumnValuesConstraint(Constraint):
+    '''A constraint on each of the values of a column.
+
+    Subclasses compute a mask of the rows whose values violate the constraint, with vectorized
+    operations on the column. Rows are only selected from the dataframe if some violate the
+    constraint, and then only a sample of them.
+    '''
+
+    is_chunkable = True
+    '''Whether each value is checked independently of the others, so that the column can be
+    checked in chunks of rows.'''
+
+    @abstractmethod
+    def violation_mask(self, column):
+        '''Returns a boolean numpy array that is True for the values of the column, a pandas
+        Series, that violate the constraint.'''
+
+    def validate(self, dataframe, column_name):
+        check.inst_param(dataframe, 'dataframe', DataFrame)
+        check.str_param(column_name, 'column_name')
+
+        positions = np.flatnonzero(self.violation_mask(dataframe[column_name]))
+        if len(positions):
+            self.raise_violation(dataframe, column_name, positions)
+
+    def offending_rows(self, dataframe, column_name, positions):
+        return dataframe.iloc[positions]
+
+    def raise_violation(self, dataframe, column_name, positions):
+        '''Raises a ConstraintViolationException reporting the first MAX_OFFENDING_ROWS of the rows
+        at the given positions.'''
+        raise ConstraintViolationException(
+            constraint_name=self.name,
+            constraint_description=self.error_description,
+            column_name=column_name,
+            offending_rows=self.offending_rows(
+                dataframe, column_name, positions[:MAX_OFFENDING_ROWS]
+            ),
+        )
+
+
+class NonNullableColumnConstraint(ColumnValuesConstraint):
     def __init__(self):
         description = "No Null values allowed."
         super(NonNullableColumnConstraint, self).__init__(
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_null_columns = dataframe[dataframe[column_name].isna()]
-        if not rows_with_null_columns.empty:
-            raise ConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=self.get_offending_row_pairs(rows_with_null_columns, column_name),
-            )
+    def violation_mask(self, column):
+        return column.isna().values
 
+    def offending_rows(self, dataframe, column_name, positions):
+        return list(self.get_offending_row_pairs(dataframe.iloc[positions], column_name))
+
+
+class UniqueColumnConstraint(ColumnValuesConstraint):
+    # Values can be duplicated across chunks
+    is_chunkable = False
 
-class UniqueColumnConstraint(Constraint):
     def __init__(self):
         description = "Column must be unique."
         super(UniqueColumnConstraint, self).__init__(
             error_description=description, markdown_description=description
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_duplicated_values = dataframe[dataframe[column_name].duplicated()]
-        if not rows_with_duplicated_values.empty:
-            raise ConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_duplicated_values,
-            )
+    def violation_mask(self, column):
+        return column.duplicated().values
 
 
-class CategoricalColumnConstraint(Constraint):
+class CategoricalColumnConstraint(ColumnValuesConstraint):
     def __init__(self, categories):
         self.categories = list(check.set_param(categories, 'categories', of_type=str))
 
@@ -127,18 +164,11 @@ class CategoricalColumnConstraint(Constraint):
             markdown_description="Category examples are {}...".format(self.categories[:5]),
         )
 
-    def validate(self, dataframe, column_name):
-        rows_with_unexpected_buckets = dataframe[~dataframe[column_name].isin(self.categories)]
-        if not rows_with_unexpected_buckets.empty:
-            raise ConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_unexpected_buckets,
-            )
+    def violation_mask(self, column):
+        return ~column.isin(self.categories).values
 
 
-class MinValueColumnConstraint(Constraint):
+class MinValueColumnConstraint(ColumnValuesConstraint):
     def __init__(self, min_value):
         self.min_value = min_value
         super(MinValueColumnConstraint, self).__init__(
@@ -146,18 +176,11 @@ class MinValueColumnConstraint(Constraint):
             error_description="Column must have values > {}".format(self.min_value),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[dataframe[column_name] < self.min_value]
-        if not out_of_bounds_rows.empty:
-            raise ConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def violation_mask(self, column):
+        return (column < self.min_value).values
 
 
-class MaxValueColumnConstraint(Constraint):
+class MaxValueColumnConstraint(ColumnValuesConstraint):
     def __init__(self, max_value):
         self.max_value = max_value
         super(MaxValueColumnConstraint, self).__init__(
@@ -165,18 +188,11 @@ class MaxValueColumnConstraint(Constraint):
             error_description="Column must have values < {}".format(self.max_value),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[dataframe[column_name] > self.max_value]
-        if not out_of_bounds_rows.empty:
-            raise ConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def violation_mask(self, column):
+        return (column > self.max_value).values
 
 
-class InRangeColumnConstraint(Constraint):
+class InRangeColumnConstraint(ColumnValuesConstraint):
     def __init__(self, min_value, max_value):
         self.min_value = min_value
         self.max_value = max_value
@@ -187,14 +203,5 @@ class InRangeColumnConstraint(Constraint):
             ),
         )
 
-    def validate(self, dataframe, column_name):
-        out_of_bounds_rows = dataframe[
-            ~dataframe[column_name].between(self.min_value, self.max_value)
-        ]
-        if not out_of_bounds_rows.empty:
-            raise ConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+    def violation_mask(self, column):
+        return ~column.between(self.min_value, self.max_value).values
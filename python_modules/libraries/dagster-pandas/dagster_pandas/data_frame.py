@@ -1,9 +1,12 @@
+from collections import namedtuple
+
 import pandas as pd
 from dagster_pandas.constraints import (
     ColumnExistsConstraint,
     ColumnTypeConstraint,
     ConstraintViolationException,
 )
+from dagster_pandas.storage import DataFrameFilesystemStoragePlugin
 from dagster_pandas.validation import PandasColumn, validate_collection_schema
 
 from dagster import (
@@ -15,6 +18,7 @@ from dagster import (
     RuntimeType,
     String,
     TypeCheck,
+    TypeCheckMode,
     as_dagster_type,
     check,
 )
@@ -23,6 +27,9 @@ from dagster.core.types.runtime.config_schema import input_selector_schema, outp
 
 CONSTRAINT_BLACKLIST = {ColumnExistsConstraint, ColumnTypeConstraint}
 
+TYPE_CHECK_SAMPLE_SIZE = 10000
+'''The minimum number of rows of a dataframe that are type checked with TypeCheckMode.SAMPLE.'''
+
 
 def dict_without_keys(ddict, *keys):
     return {key: value for key, value in ddict.items() if key not in set(keys)}
@@ -150,16 +157,42 @@ def create_dagster_pandas_dataframe_description(description, columns):
     return buildme
 
 
+class _RowSample(namedtuple('_RowSample', 'dataframe rows')):
+    '''A sample of the rows of a dataframe, which the type check validates in place of the
+    dataframe. Summary statistics are still computed on the whole dataframe.'''
+
+
+def _sample_rows(value):
+    # Every nth row is taken, since a strided slice of a dataframe is a view rather than a copy
+    if not isinstance(value, DataFrame) or len(value) <= TYPE_CHECK_SAMPLE_SIZE:
+        return value
+    return _RowSample(value, value.iloc[:: len(value) // TYPE_CHECK_SAMPLE_SIZE])
+
+
 def create_dagster_pandas_dataframe_type(
-    name=None, description=None, columns=None, summary_statistics=None
+    name=None,
+    description=None,
+    columns=None,
+    summary_statistics=None,
+    validation_chunk_size=None,
+    type_check_mode=None,
+    memory_map=False,
 ):
     summary_statistics = check.opt_callable_param(summary_statistics, 'summary_statistics')
+    check.opt_int_param(validation_chunk_size, 'validation_chunk_size')
+    check.opt_inst_param(type_check_mode, 'type_check_mode', TypeCheckMode)
+    check.bool_param(memory_map, 'memory_map')
     description = create_dagster_pandas_dataframe_description(
         check.opt_str_param(description, 'description', default=''),
         check.opt_list_param(columns, 'columns', of_type=PandasColumn),
     )
 
     def _dagster_type_check(value):
+        if isinstance(value, _RowSample):
+            value, rows = value
+        else:
+            rows = value
+
         if not isinstance(value, DataFrame):
             return TypeCheck(
                 success=False,
@@ -170,7 +203,7 @@ def create_dagster_pandas_dataframe_type(
 
         if columns is not None:
             try:
-                validate_collection_schema(columns, value)
+                validate_collection_schema(columns, rows, chunk_size=validation_chunk_size)
             except ConstraintViolationException as e:
                 return TypeCheck(success=False, description=str(e))
 
@@ -184,7 +217,15 @@ def create_dagster_pandas_dataframe_type(
     # add input_hydration_confign and output_materialization_config
     # https://github.com/dagster-io/dagster/issues/2027
     return RuntimeType(
-        name=name, key=name, type_check_fn=_dagster_type_check, description=description
+        name=name,
+        key=name,
+        type_check_fn=_dagster_type_check,
+        description=description,
+        # With filesystem storage, frames of this type are stored as .npy files and read back as
+        # memory maps, see dagster_pandas.storage
+        auto_plugins=[DataFrameFilesystemStoragePlugin] if memory_map else None,
+        type_check_mode=type_check_mode,
+        type_check_sample_fn=_sample_rows,
     )
 
 
@@ -0,0 +1,27 @@
+import numpy as np
+from dagster_pandas.storage import NpySerializationStrategy, NumpyArrayFilesystemStoragePlugin
+
+from dagster import EventMetadataEntry, TypeCheck, as_dagster_type
+
+
+def ndarray_type_check(value):
+    if not isinstance(value, np.ndarray):
+        return TypeCheck(success=False)
+    return TypeCheck(
+        success=True,
+        metadata_entries=[
+            EventMetadataEntry.text(str(value.shape), 'shape', 'Shape of the array'),
+            EventMetadataEntry.text(str(value.dtype), 'dtype', 'Data type of the array'),
+        ],
+    )
+
+
+NumpyArray = as_dagster_type(
+    np.ndarray,
+    name='NumpyArray',
+    description='''An N-dimensional array of items of the same type and size.
+    See https://numpy.org/''',
+    type_check=ndarray_type_check,
+    serialization_strategy=NpySerializationStrategy(),
+    auto_plugins=[NumpyArrayFilesystemStoragePlugin],
+)
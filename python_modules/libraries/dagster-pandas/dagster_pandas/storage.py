@@ -0,0 +1,203 @@
+'''Filesystem storage of NumPy arrays and pandas DataFrames as memory-mapped views.
+
+Arrays are stored in the .npy format. DataFrames are stored as a directory holding one .npy file
+for each group of columns that share a dtype, laid out as pandas lays out such a group in memory,
+plus a small pickle of the index and column labels. Steps that read these intermediates map the
+.npy files into memory rather than reading them onto the heap, so steps executing in parallel
+processes, e.g. the fanned-out steps of a pipeline run by the multiprocess engine, share a single
+copy of the data in the page cache.
+
+The files are mapped copy-on-write: a solid may still modify its inputs in place, in which case
+only the pages it modifies are copied into its own memory, and the stored intermediate is left
+untouched.
+
+DataFrame types are stored this way only if they opt in, see the memory_map argument of
+create_dagster_pandas_dataframe_type. Intermediates that were pickled before a type opted in, e.g.
+by the runs that a re-execution reuses outputs from, are still read.
+'''
+
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from dagster import SerializationStrategy, check
+from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
+from dagster.core.storage.system_storage import fs_system_storage
+from dagster.core.storage.type_storage import TypeStoragePlugin
+from dagster.utils import PICKLE_PROTOCOL, mkdir_p
+
+FRAME_METADATA_FILE = 'frame.pickle'
+
+try:
+    # pandas 2 deprecates building frames from blocks, which are private to pandas
+    if int(pd.__version__.split('.')[0]) < 2:
+        from pandas.core.internals import BlockManager, make_block
+    else:
+        BlockManager = make_block = None
+except ImportError:
+    BlockManager = make_block = None
+
+
+class NpySerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes NumPy arrays in the .npy format.'''
+
+    def __init__(self, name='npy'):
+        super(NpySerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        np.save(write_file_obj, value)
+
+    def deserialize(self, read_file_obj):
+        return np.load(read_file_obj, allow_pickle=True)
+
+
+def _load_array(path):
+    try:
+        return np.load(path, mmap_mode='c')
+    except ValueError:
+        # Arrays that can't be memory-mapped, e.g. arrays of Python objects, which np.save
+        # pickles, are read onto the heap
+        return np.load(path, allow_pickle=True)
+
+
+def _save_array(path, array):
+    # np.save appends .npy to paths that lack it, so the file is opened here
+    with open(path, 'wb') as write_obj:
+        np.save(write_obj, array)
+
+
+def _prepare_target(intermediate_store, paths):
+    target = intermediate_store.key_for_paths(paths)
+    if intermediate_store.object_store.has_object(target):
+        intermediate_store.object_store.rm_object(target)
+    mkdir_p(os.path.dirname(target))
+    return target
+
+
+def _operation(op, key, obj, serialization_strategy_name):
+    return ObjectStoreOperation(
+        op=op,
+        key=key,
+        obj=obj,
+        serialization_strategy_name=serialization_strategy_name,
+        object_store_name='filesystem',
+    )
+
+
+class NumpyArrayFilesystemStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        return system_storage_def is fs_system_storage
+
+    @classmethod
+    def set_object(cls, intermediate_store, obj, _context, _runtime_type, paths):
+        check.inst_param(obj, 'obj', np.ndarray)
+
+        target = _prepare_target(intermediate_store, paths)
+        _save_array(target, obj)
+        return _operation(ObjectStoreOperationType.SET_OBJECT, target, obj, 'npy')
+
+    @classmethod
+    def get_object(cls, intermediate_store, _context, _runtime_type, paths):
+        target = intermediate_store.key_for_paths(paths)
+        return _operation(ObjectStoreOperationType.GET_OBJECT, target, _load_array(target), 'npy')
+
+
+class DataFrameFilesystemStoragePlugin(TypeStoragePlugin):  # pylint: disable=no-init
+    @classmethod
+    def compatible_with_storage_def(cls, system_storage_def):
+        return system_storage_def is fs_system_storage
+
+    @classmethod
+    def set_object(cls, intermediate_store, obj, _context, _runtime_type, paths):
+        check.inst_param(obj, 'obj', pd.DataFrame)
+
+        target = _prepare_target(intermediate_store, paths)
+        mkdir_p(target)
+
+        if not all(isinstance(dtype, np.dtype) for dtype in obj.dtypes):
+            # Columns of pandas extension types, e.g. categoricals, are not backed by a single
+            # NumPy array, so frames that have them are pickled whole
+            metadata = {'frame': obj}
+        else:
+            positions_by_dtype = OrderedDict()
+            for position, dtype in enumerate(obj.dtypes):
+                positions_by_dtype.setdefault(dtype, []).append(position)
+
+            blocks = []
+            for i, positions in enumerate(positions_by_dtype.values()):
+                block_file = 'block_{i}.npy'.format(i=i)
+                # pandas holds each group of same-typed columns as a (columns, rows) array
+                _save_array(
+                    os.path.join(target, block_file),
+                    np.ascontiguousarray(obj.iloc[:, positions].values.T),
+                )
+                blocks.append((block_file, positions))
+
+            metadata = {'index': obj.index, 'columns': obj.columns, 'blocks': blocks}
+
+        with open(os.path.join(target, FRAME_METADATA_FILE), 'wb') as write_obj:
+            pickle.dump(metadata, write_obj, PICKLE_PROTOCOL)
+
+        return _operation(ObjectStoreOperationType.SET_OBJECT, target, obj, 'npy_blocks')
+
+    @classmethod
+    def get_object(cls, intermediate_store, context, runtime_type, paths):
+        target = intermediate_store.key_for_paths(paths)
+
+        metadata_path = os.path.join(target, FRAME_METADATA_FILE)
+        if not os.path.isfile(metadata_path):
+            # The frame was stored before its type opted in to this plugin
+            return intermediate_store.get_object(context, runtime_type, paths)
+
+        with open(metadata_path, 'rb') as read_obj:
+            metadata = pickle.load(read_obj)
+
+        if 'frame' in metadata:
+            frame = metadata['frame']
+        else:
+            frame = _build_frame(
+                [
+                    (_load_array(os.path.join(target, block_file)), positions)
+                    for block_file, positions in metadata['blocks']
+                ],
+                metadata['index'],
+                metadata['columns'],
+            )
+
+        return _operation(ObjectStoreOperationType.GET_OBJECT, target, frame, 'npy_blocks')
+
+
+def _build_frame(blocks, index, columns):
+    if make_block is not None:
+        # Building the frame from its blocks, rather than from its columns, keeps pandas from
+        # consolidating them into new arrays on the heap
+        return pd.DataFrame(
+            BlockManager(
+                [make_block(values, placement=positions) for values, positions in blocks],
+                [columns, index],
+            )
+        )
+
+    if not blocks:
+        return pd.DataFrame(index=index, columns=columns)
+
+    # Each column is a plain ndarray view of a row of its mapped block, as pandas would otherwise
+    # hold np.memmap columns. Columns are keyed by position, since their labels may repeat
+    arrays = [None] * len(columns)
+    for values, positions in blocks:
+        for row, position in enumerate(positions):
+            arrays[position] = values[row].view(np.ndarray)
+    # Giving each column its dtype keeps pandas from inferring other dtypes, e.g. for strings
+    frame = pd.DataFrame(
+        OrderedDict(
+            (position, pd.Series(array, index=index, dtype=array.dtype, copy=False))
+            for position, array in enumerate(arrays)
+        ),
+        copy=False,
+    )
+    frame.columns = columns
+    return frame
@@ -2,11 +2,13 @@ from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
     ColumnExistsConstraint,
     ColumnTypeConstraint,
+    ColumnValuesConstraint,
     Constraint,
     InRangeColumnConstraint,
     NonNullableColumnConstraint,
     UniqueColumnConstraint,
 )
+import numpy as np
 from pandas import DataFrame, Timestamp
 
 from dagster import check
@@ -133,11 +135,62 @@ class PandasColumn:
         )
 
 
-def validate_collection_schema(collection_schema, dataframe):
+def _check_column_values(dataframe, column_name, constraints, start=0, stop=None):
+    column = dataframe[column_name]
+    if start or stop is not None:
+        # Slicing rows by position makes views of the columns rather than copies
+        column = column.iloc[start:stop]
+
+    masks = [constraint.violation_mask(column) for constraint in constraints]
+    if not np.logical_or.reduce(masks).any():
+        return
+
+    for constraint, mask in zip(constraints, masks):
+        positions = np.flatnonzero(mask)
+        if len(positions):
+            constraint.raise_violation(dataframe, column_name, positions + start)
+
+
+def validate_collection_schema(collection_schema, dataframe, chunk_size=None):
+    '''Validate a dataframe against the constraints on its columns.
+
+    The constraints on the columns themselves, e.g. on their dtypes, are checked first. The
+    constraints on the values of each column are then checked together: the masks of the rows that
+    violate each of them are computed with vectorized operations on the column and combined, and
+    rows are only selected from the dataframe, and then only a sample of them, if the combined
+    mask has any violations. If chunk_size is given, the values are checked in a single pass over
+    chunks of chunk_size rows, so that the arrays built to check them are never larger than a
+    chunk.
+
+    Raises:
+        ConstraintViolationException: If any constraint is violated.
+    '''
     collection_schema = check.list_param(
         collection_schema, 'collection_schema', of_type=PandasColumn
     )
     dataframe = check.inst_param(dataframe, 'dataframe', DataFrame)
+    check.opt_int_param(chunk_size, 'chunk_size')
 
+    whole_column_constraints = []
+    chunked_constraints = []
     for column in collection_schema:
-        column.validate(dataframe)
+        whole_column = []
+        chunked = []
+        for constraint in column.constraints:
+            if not isinstance(constraint, ColumnValuesConstraint):
+                constraint.validate(dataframe, column.name)
+            elif chunk_size and constraint.is_chunkable:
+                chunked.append(constraint)
+            else:
+                whole_column.append(constraint)
+        if whole_column:
+            whole_column_constraints.append((column.name, whole_column))
+        if chunked:
+            chunked_constraints.append((column.name, chunked))
+
+    for column_name, constraints in whole_column_constraints:
+        _check_column_values(dataframe, column_name, constraints)
+
+    for start in range(0, len(dataframe), chunk_size) if chunked_constraints else []:
+        for column_name, constraints in chunked_constraints:
+            _check_column_values(dataframe, column_name, constraints, start, start + chunk_size)
@@ -4,6 +4,7 @@ from dagster_pandas.constraints import (
     ColumnExistsConstraint,
     ColumnTypeConstraint,
     ConstraintViolationException,
+    MAX_OFFENDING_ROWS,
     InRangeColumnConstraint,
     MaxValueColumnConstraint,
     MinValueColumnConstraint,
@@ -75,3 +76,21 @@ def test_in_range_value_column_constraint():
     assert InRangeColumnConstraint(1, 4).validate(test_dataframe, 'foo') is None
     with pytest.raises(ConstraintViolationException):
         assert InRangeColumnConstraint(2, 3).validate(test_dataframe, 'foo')
+
+
+def test_offending_rows_sampled():
+    bad_test_dataframe = DataFrame({'foo': list(range(100))})
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        MaxValueColumnConstraint(10).validate(bad_test_dataframe, 'foo')
+
+    offending_rows = exc_info.value.offending_rows
+    assert len(offending_rows) == MAX_OFFENDING_ROWS
+    assert offending_rows['foo'].tolist() == list(range(11, 11 + MAX_OFFENDING_ROWS))
+
+
+def test_non_nullable_offending_row_pairs():
+    bad_test_dataframe = DataFrame({'foo': ['baz', None]}, index=['a', 'b'])
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        NonNullableColumnConstraint().validate(bad_test_dataframe, 'foo')
+
+    assert exc_info.value.offending_rows == [('b', None)]
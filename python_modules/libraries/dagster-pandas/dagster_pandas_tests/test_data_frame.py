@@ -4,7 +4,7 @@ from dagster_pandas.constraints import (
     InRangeColumnConstraint,
     NonNullableColumnConstraint,
 )
-from dagster_pandas.data_frame import create_dagster_pandas_dataframe_type
+from dagster_pandas.data_frame import TYPE_CHECK_SAMPLE_SIZE, create_dagster_pandas_dataframe_type
 from dagster_pandas.validation import PandasColumn
 from pandas import DataFrame
 
@@ -14,6 +14,7 @@ from dagster import (
     Output,
     OutputDefinition,
     RuntimeType,
+    TypeCheckMode,
     check_dagster_type,
     execute_pipeline,
     pipeline,
@@ -113,3 +114,51 @@ def test_dataframe_description_generation_multi_constraints():
         TestDataFrame.description
         == "\n### Columns\n**foo**: `int64`\n+ 0 < values < 100\n+ No Null values allowed.\n\n"
     )
+
+
+def test_sampled_dataframe_type_check():
+    validated_sizes = []
+
+    class RecordingConstraint(ColumnTypeConstraint):
+        def validate(self, dataframe, column_name):
+            validated_sizes.append(len(dataframe))
+            return super(RecordingConstraint, self).validate(dataframe, column_name)
+
+    def compute_summary_stats(dataframe):
+        return [
+            EventMetadataEntry.text(str(len(dataframe)), 'row_count', 'Number of rows'),
+            EventMetadataEntry.text(str(dataframe['pid'].sum()), 'pid_sum', 'Sum of pids'),
+        ]
+
+    SampledDF = create_dagster_pandas_dataframe_type(
+        name='SampledDF',
+        columns=[PandasColumn(name='pid', constraints=[RecordingConstraint('int64')])],
+        summary_statistics=compute_summary_stats,
+        type_check_mode=TypeCheckMode.SAMPLE,
+    )
+
+    num_rows = TYPE_CHECK_SAMPLE_SIZE * 4
+
+    @solid(output_defs=[OutputDefinition(name='sampled_dataframe', dagster_type=SampledDF)])
+    def create_dataframe(_):
+        yield Output(DataFrame({'pid': list(range(num_rows))}), output_name='sampled_dataframe')
+
+    @pipeline
+    def sampled_pipeline():
+        return create_dataframe()
+
+    result = execute_pipeline(sampled_pipeline)
+    assert result.success
+
+    # Only a sample of the rows is validated
+    assert validated_sizes == [TYPE_CHECK_SAMPLE_SIZE]
+
+    # The summary statistics describe the whole dataframe
+    type_check_data = [
+        event.event_specific_data.type_check_data
+        for event in result.result_for_solid('create_dataframe').output_events_during_compute
+    ][0]
+    metadata = {entry.label: entry.entry_data.text for entry in type_check_data.metadata_entries}
+    assert metadata['row_count'] == str(num_rows)
+    assert metadata['pid_sum'] == str(sum(range(num_rows)))
+    assert metadata['type_check_mode'] == 'SAMPLE'
@@ -0,0 +1,198 @@
+import uuid
+
+import numpy as np
+import pandas as pd
+from dagster_pandas import DataFrame, NumpyArray
+from dagster_pandas.data_frame import create_dagster_pandas_dataframe_type
+from dagster_pandas.storage import DataFrameFilesystemStoragePlugin
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    execute_pipeline,
+    lambda_solid,
+    seven,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.intermediate_store import build_fs_intermediate_store
+from dagster.core.storage.type_storage import TypeStoragePluginRegistry
+from dagster.core.types.runtime.runtime_type import resolve_to_runtime_type
+from dagster.utils.test import yield_empty_pipeline_context
+
+MemoryMappedDataFrame = create_dagster_pandas_dataframe_type(
+    name='MemoryMappedDataFrame', memory_map=True
+)
+
+
+def _is_mapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = getattr(array, 'base', None)
+    return False
+
+
+def define_roundtrip_pipeline(dagster_type, value, check_input):
+    @lambda_solid(output_def=OutputDefinition(dagster_type))
+    def emit():
+        return value
+
+    @lambda_solid(input_defs=[InputDefinition('value', dagster_type)])
+    def consume(value):
+        check_input(value)
+        return True
+
+    return PipelineDefinition(
+        name='roundtrip_pipeline',
+        solid_defs=[emit, consume],
+        dependencies={'consume': {'value': DependencyDefinition('emit')}},
+    )
+
+
+def execute_roundtrip(dagster_type, value, check_input):
+    with seven.TemporaryDirectory() as tempdir:
+        result = execute_pipeline(
+            define_roundtrip_pipeline(dagster_type, value, check_input),
+            environment_dict={'storage': {'filesystem': {}}},
+            instance=DagsterInstance.ephemeral(tempdir),
+        )
+        assert result.success
+        return result
+
+
+def test_numpy_array_read_as_memory_map():
+    def check_input(value):
+        assert isinstance(value, np.memmap)
+        assert np.array_equal(value, np.arange(100).reshape(10, 10))
+
+    execute_roundtrip(NumpyArray, np.arange(100).reshape(10, 10), check_input)
+
+
+def test_object_numpy_array_read_onto_heap():
+    def check_input(value):
+        assert not isinstance(value, np.memmap)
+        assert list(value) == ['a', 1, None]
+
+    execute_roundtrip(NumpyArray, np.array(['a', 1, None], dtype=object), check_input)
+
+
+def _mixed_frame():
+    return pd.DataFrame(
+        {
+            'ints': [1, 2, 3],
+            'floats': [1.5, 2.5, 3.5],
+            'strings': ['a', 'b', 'c'],
+            'more_ints': [4, 5, 6],
+            'dates': pd.to_datetime(['2019-01-01', '2019-01-02', '2019-01-03']),
+        },
+        columns=['ints', 'floats', 'strings', 'more_ints', 'dates'],
+        index=['x', 'y', 'z'],
+        # Newer versions of pandas infer an extension dtype for strings
+    ).astype({'strings': object})
+
+
+def test_data_frame_read_as_memory_maps():
+    frame = _mixed_frame()
+
+    def check_input(value):
+        pd.testing.assert_frame_equal(value, frame)
+        assert _is_mapped(value['ints'].values)
+        assert _is_mapped(value['floats'].values)
+
+        # Inputs can still be modified in place, without affecting the stored intermediate
+        value.loc['x', 'ints'] = 10
+
+    execute_roundtrip(MemoryMappedDataFrame, frame, check_input)
+
+
+def test_data_frame_with_repeated_column_labels():
+    frame = pd.DataFrame([[1, 2.5, 3], [4, 5.5, 6]], columns=['a', 'b', 'a'])
+
+    def check_input(value):
+        pd.testing.assert_frame_equal(value, frame)
+
+    execute_roundtrip(MemoryMappedDataFrame, frame, check_input)
+
+
+def test_data_frame_without_columns():
+    frame = pd.DataFrame(index=['x', 'y', 'z'])
+
+    def check_input(value):
+        pd.testing.assert_frame_equal(value, frame)
+
+    execute_roundtrip(MemoryMappedDataFrame, frame, check_input)
+
+
+def test_data_frame_with_extension_types_pickled():
+    frame = pd.DataFrame({'category': pd.Categorical(['a', 'b', 'a']), 'ints': [1, 2, 3]})
+
+    def check_input(value):
+        pd.testing.assert_frame_equal(value, frame)
+
+    execute_roundtrip(MemoryMappedDataFrame, frame, check_input)
+
+
+def test_data_frame_not_memory_mapped_by_default():
+    frame = _mixed_frame()
+
+    def check_input(value):
+        pd.testing.assert_frame_equal(value, frame)
+        assert not _is_mapped(value['ints'].values)
+
+    execute_roundtrip(DataFrame, frame, check_input)
+
+
+def test_pickled_data_frame_read_after_opting_in():
+    frame = _mixed_frame()
+    runtime_type = resolve_to_runtime_type(MemoryMappedDataFrame)
+
+    with seven.TemporaryDirectory() as tempdir:
+        run_id = str(uuid.uuid4())
+        instance = DagsterInstance.ephemeral(tempdir)
+        intermediate_store = build_fs_intermediate_store(
+            instance.intermediates_directory,
+            run_id=run_id,
+            type_storage_plugin_registry=TypeStoragePluginRegistry(
+                {runtime_type: DataFrameFilesystemStoragePlugin}
+            ),
+        )
+
+        with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+            # Written as by a run that executed before the type opted in
+            intermediate_store.set_object(frame, context, runtime_type, ['frame'])
+
+            pd.testing.assert_frame_equal(
+                intermediate_store.get_value(context, runtime_type, ['frame']).obj, frame
+            )
+
+
+def test_fanned_out_steps_map_the_same_file():
+    filenames = []
+
+    @lambda_solid(output_def=OutputDefinition(NumpyArray))
+    def emit():
+        return np.arange(10)
+
+    @lambda_solid(input_defs=[InputDefinition('value', NumpyArray)])
+    def consume(value):
+        filenames.append(value.filename)
+
+    execute_pipeline(
+        PipelineDefinition(
+            name='fan_out_pipeline',
+            solid_defs=[emit, consume],
+            dependencies={
+                SolidInvocation('consume', 'consume_{i}'.format(i=i)): {
+                    'value': DependencyDefinition('emit')
+                }
+                for i in range(2)
+            },
+        ),
+        environment_dict={'storage': {'filesystem': {}}},
+    )
+
+    assert len(filenames) == 2
+    assert filenames[0] == filenames[1]
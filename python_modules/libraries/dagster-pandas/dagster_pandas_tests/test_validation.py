@@ -4,6 +4,7 @@ from dagster_pandas.constraints import (
     ColumnTypeConstraint,
     ConstraintViolationException,
     InRangeColumnConstraint,
+    MaxValueColumnConstraint,
     NonNullableColumnConstraint,
     UniqueColumnConstraint,
 )
@@ -79,3 +80,41 @@ def test_datetime_column_composition(composer, composer_args, expected_constrain
     distinct_included_constraints = expected_constraints + [UniqueColumnConstraint]
     distinct_column = composer('foo', *composer_args, unique=True)
     assert has_constraints(distinct_column, distinct_included_constraints)
+
+
+@pytest.mark.parametrize('chunk_size', [None, 3, 10, 100])
+def test_validate_collection_schema_chunked(chunk_size):
+    collection_schema = [
+        PandasColumn.integer_column('foo', min_value=0, exists=True, unique=True),
+        PandasColumn(name='bar', constraints=[MaxValueColumnConstraint(10)]),
+    ]
+    dataframe = DataFrame({'foo': list(range(10)), 'bar': list(range(10))})
+    assert validate_collection_schema(collection_schema, dataframe, chunk_size=chunk_size) is None
+
+    # The violation is reported by its position in the whole dataframe, not in its chunk
+    bad_dataframe = DataFrame({'foo': list(range(10)), 'bar': list(range(5)) + [11] * 5})
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        validate_collection_schema(collection_schema, bad_dataframe, chunk_size=chunk_size)
+    assert exc_info.value.column_name == 'bar'
+    assert exc_info.value.offending_rows.index.tolist()[0] == 5
+
+    # Uniqueness is checked across chunks
+    duplicated_dataframe = DataFrame({'foo': [0, 1, 2, 3, 0], 'bar': [0] * 5})
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        validate_collection_schema(collection_schema, duplicated_dataframe, chunk_size=chunk_size)
+    assert exc_info.value.constraint_name == 'UniqueColumnConstraint'
+
+
+@pytest.mark.parametrize('chunk_size', [None, 2])
+def test_validate_collection_schema_reports_first_violated_constraint_of_column(chunk_size):
+    collection_schema = [
+        PandasColumn(
+            name='foo', constraints=[MaxValueColumnConstraint(5), NonNullableColumnConstraint()]
+        )
+    ]
+    dataframe = DataFrame({'foo': [1, 7, None, 9]})
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        validate_collection_schema(collection_schema, dataframe, chunk_size=chunk_size)
+    assert exc_info.value.constraint_name == 'MaxValueColumnConstraint'
+    # Chunked, the violation is reported from the first chunk that has one
+    assert exc_info.value.offending_rows.index.tolist() == ([1] if chunk_size else [1, 3])
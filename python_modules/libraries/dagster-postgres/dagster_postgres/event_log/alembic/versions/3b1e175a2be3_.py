@@ -0,0 +1,32 @@
+"""Add an index on run_id and dagster_event_type to event logs
+
+Revision ID: 3b1e175a2be3
+Revises: 567bc23fd1ac
+Create Date: 2019-12-10 14:23:08.624513
+
+"""
+# pylint: disable=no-member
+# alembic dynamically populates the alembic.context module
+
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# revision identifiers, used by Alembic.
+revision = '3b1e175a2be3'
+down_revision = '567bc23fd1ac'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = reflection.Inspector.from_engine(op.get_context().bind)
+
+    has_indexes = [index['name'] for index in inspector.get_indexes('event_logs')]
+    if 'idx_run_id_dagster_event_type' not in has_indexes:
+        op.create_index(
+            'idx_run_id_dagster_event_type', 'event_logs', ['run_id', 'dagster_event_type']
+        )
+
+
+def downgrade():
+    op.drop_index('idx_run_id_dagster_event_type', 'event_logs')
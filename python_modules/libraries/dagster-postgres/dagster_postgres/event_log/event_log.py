@@ -1,5 +1,6 @@
 import datetime
 import threading
+import time
 from collections import namedtuple
 from contextlib import contextmanager
 
@@ -77,31 +78,21 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         '''
         check.inst_param(event, 'event', EventRecord)
 
-        dagster_event_type = None
-        if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
+        with self.connect() as conn:
+            _insert_and_notify(conn, event)
+
+    def store_events(self, events):
+        '''Store a batch of events with a single multi-row insert.
+        Args:
+            events (List[EventRecord]): The events to store.
+        '''
+        check.list_param(events, 'events', of_type=EventRecord)
 
-        run_id = event.run_id
+        if not events:
+            return
 
         with self.connect() as conn:
-            # https://stackoverflow.com/a/54386260/324449
-            event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
-                run_id=run_id,
-                event=serialize_dagster_namedtuple(event),
-                dagster_event_type=dagster_event_type,
-                timestamp=datetime.datetime.fromtimestamp(event.timestamp),
-            )
-            result_proxy = conn.execute(
-                event_insert.returning(
-                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
-                )
-            )
-            res = result_proxy.fetchone()
-            result_proxy.close()
-            conn.execute(
-                '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
-                (res[0] + '_' + str(res[1]),),
-            )
+            _insert_and_notify_many(conn, events)
 
     @contextmanager
     def connect(self, run_id=None):
@@ -126,6 +117,42 @@ class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
         self._event_watcher.close()
 
 
+def _event_values(event):
+    dagster_event_type = None
+    if event.is_dagster_event:
+        dagster_event_type = event.dagster_event.event_type_value
+
+    return dict(
+        run_id=event.run_id,
+        event=serialize_dagster_namedtuple(event),
+        dagster_event_type=dagster_event_type,
+        timestamp=datetime.datetime.fromtimestamp(event.timestamp),
+    )
+
+
+def _insert_and_notify(conn, event):
+    _insert_and_notify_many(conn, [event])
+
+
+def _insert_and_notify_many(conn, events):
+    # https://stackoverflow.com/a/54386260/324449
+    event_insert = SqlEventLogStorageTable.insert().values(  # pylint: disable=no-value-for-parameter
+        [_event_values(event) for event in events]
+    )
+    result_proxy = conn.execute(
+        event_insert.returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+    )
+    rows = result_proxy.fetchall()
+    result_proxy.close()
+
+    # Watchers fetch every event after their cursor, so the notifications are sent in id order
+    for run_id, event_id in sorted(rows, key=lambda row: row[1]):
+        conn.execute(
+            '''NOTIFY {channel}, %s; '''.format(channel=CHANNEL_NAME),
+            (run_id + '_' + str(event_id),),
+        )
+
+
 EventWatcherProcessStartedEvent = namedtuple('EventWatcherProcessStartedEvent', '')
 EventWatcherStart = namedtuple('EventWatcherStart', '')
 EventWatcherEvent = namedtuple('EventWatcherEvent', 'payload')
@@ -142,48 +169,88 @@ EventWatcherThreadEvents = (
 EventWatcherThreadNoopEvents = (EventWatcherProcessStartedEvent, EventWatcherStart)
 EventWatcherThreadEndEvents = (EventWatchFailed, EventWatcherEnd)
 
-POLLING_CADENCE = 0.25
+NOTIFICATION_BATCH_WINDOW = 0.05
+'''The time, in seconds, for which notifications of new events are gathered before the events are
+fetched, so that events stored in quick succession are fetched with one query per run.'''
 
 TERMINATE_EVENT_LOOP = 'TERMINATE_EVENT_LOOP'
 
 
+def _fetch_events_after(engine, run_id, cursor):
+    '''The ids and events of a run stored after the event with id cursor, in the order stored.'''
+    res = engine.execute(
+        db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+        .where(
+            db.and_(
+                SqlEventLogStorageTable.c.run_id == run_id, SqlEventLogStorageTable.c.id > cursor,
+            )
+        )
+        .order_by(SqlEventLogStorageTable.c.id.asc())
+    )
+    try:
+        return [
+            (index, deserialize_json_to_dagster_namedtuple(event))
+            for (index, event) in res.fetchall()
+        ]
+    finally:
+        res.close()
+
+
 def watcher_thread(conn_string, run_id_dict, handlers_dict, dict_lock, watcher_thread_exit):
+    # Events are fetched over a single pooled connection that is kept for the life of the thread
+    engine = create_engine(conn_string, isolation_level='AUTOCOMMIT', pool_size=1, max_overflow=0)
+
+    # The id of the last event fetched for each watched run
+    run_cursors = {}
+    # The id of the first event notified for each run since events were last fetched
+    pending = {}
+    pending_since = None
 
-    for notif in await_pg_notifications(
-        conn_string,
-        channels=[CHANNEL_NAME],
-        timeout=POLLING_CADENCE,
-        yield_on_timeout=True,
-        exit_event=watcher_thread_exit,
-    ):
-        if notif is None:
-            if watcher_thread_exit.is_set():
-                break
-        else:
-            run_id, index_str = notif.payload.split('_')
-            if run_id not in run_id_dict:
-                continue
-
-            index = int(index_str)
+    def _dispatch_pending():
+        for run_id, first_index in pending.items():
             with dict_lock:
+                if run_id not in run_id_dict:
+                    continue
                 handlers = handlers_dict.get(run_id, [])
 
-            engine = create_engine(
-                conn_string, isolation_level='AUTOCOMMIT', poolclass=db.pool.NullPool
-            )
-            try:
-                res = engine.execute(
-                    db.select([SqlEventLogStorageTable.c.event]).where(
-                        SqlEventLogStorageTable.c.id == index
-                    ),
-                )
-                dagster_event = deserialize_json_to_dagster_namedtuple(res.fetchone()[0])
-            finally:
-                engine.dispose()
-
-            for (cursor, callback) in handlers:
-                if index >= cursor:
-                    callback(dagster_event)
+            cursor = run_cursors.get(run_id, first_index - 1)
+            for index, dagster_event in _fetch_events_after(engine, run_id, cursor):
+                run_cursors[run_id] = index
+                for (start_cursor, callback) in handlers:
+                    if index >= start_cursor:
+                        callback(dagster_event)
+
+        pending.clear()
+        with dict_lock:
+            for run_id in [run_id for run_id in run_cursors if run_id not in run_id_dict]:
+                del run_cursors[run_id]
+
+    try:
+        for notif in await_pg_notifications(
+            conn_string,
+            channels=[CHANNEL_NAME],
+            timeout=NOTIFICATION_BATCH_WINDOW,
+            yield_on_timeout=True,
+            exit_event=watcher_thread_exit,
+        ):
+            if notif is None:
+                if watcher_thread_exit.is_set():
+                    break
+            else:
+                run_id, index_str = notif.payload.split('_')
+                if run_id in run_id_dict:
+                    index = int(index_str)
+                    pending[run_id] = min(index, pending.get(run_id, index))
+                    if pending_since is None:
+                        pending_since = time.time()
+
+            if pending and (
+                notif is None or time.time() - pending_since >= NOTIFICATION_BATCH_WINDOW
+            ):
+                _dispatch_pending()
+                pending_since = None
+    finally:
+        engine.dispose()
 
 
 class PostgresEventWatcher(object):
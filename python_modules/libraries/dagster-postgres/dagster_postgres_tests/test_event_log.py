@@ -207,7 +207,7 @@ def test_basic_get_logs_for_run_cursor(conn_string):
     for event in events:
         event_log_storage.store_event(event)
 
-    assert event_types(event_log_storage.get_logs_for_run(result.run_id, cursor=0)) == [
+    assert event_types(event_log_storage.get_logs_for_run(result.run_id, cursor=-1)) == [
         DagsterEventType.PIPELINE_START,
         DagsterEventType.ENGINE_EVENT,
         DagsterEventType.STEP_START,
@@ -217,8 +217,7 @@ def test_basic_get_logs_for_run_cursor(conn_string):
         DagsterEventType.PIPELINE_SUCCESS,
     ]
 
-    assert event_types(event_log_storage.get_logs_for_run(result.run_id, cursor=1)) == [
-        DagsterEventType.PIPELINE_START,
+    assert event_types(event_log_storage.get_logs_for_run(result.run_id, cursor=0)) == [
         DagsterEventType.ENGINE_EVENT,
         DagsterEventType.STEP_START,
         DagsterEventType.STEP_OUTPUT,
@@ -227,6 +226,21 @@ def test_basic_get_logs_for_run_cursor(conn_string):
         DagsterEventType.PIPELINE_SUCCESS,
     ]
 
+    assert event_types(event_log_storage.get_logs_for_run(result.run_id, cursor=1)) == [
+        DagsterEventType.STEP_START,
+        DagsterEventType.STEP_OUTPUT,
+        DagsterEventType.STEP_SUCCESS,
+        DagsterEventType.ENGINE_EVENT,
+        DagsterEventType.PIPELINE_SUCCESS,
+    ]
+
+    assert event_types(event_log_storage.get_logs_for_run(result.run_id, cursor=1, limit=2)) == [
+        DagsterEventType.STEP_START,
+        DagsterEventType.STEP_OUTPUT,
+    ]
+
+    assert event_log_storage.get_event_count(result.run_id) == 7
+
 
 def test_basic_get_logs_for_run_multiple_runs(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
@@ -300,12 +314,10 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(conn_string):
         event_log_storage.store_event(event)
 
     out_events_one = event_log_storage.get_logs_for_run(result_one.run_id, cursor=1)
-    assert len(out_events_one) == 7
+    assert len(out_events_one) == 5
 
     assert set(event_types(out_events_one)) == set(
         [
-            DagsterEventType.PIPELINE_START,
-            DagsterEventType.ENGINE_EVENT,
             DagsterEventType.STEP_START,
             DagsterEventType.STEP_OUTPUT,
             DagsterEventType.STEP_SUCCESS,
@@ -317,13 +329,10 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(conn_string):
     assert set(map(lambda e: e.run_id, out_events_one)) == {result_one.run_id}
 
     out_events_two = event_log_storage.get_logs_for_run(result_two.run_id, cursor=2)
-    assert len(out_events_two) == 7
+    assert len(out_events_two) == 4
     assert set(event_types(out_events_two)) == set(
         [
-            DagsterEventType.PIPELINE_START,
-            DagsterEventType.ENGINE_EVENT,
             DagsterEventType.STEP_OUTPUT,
-            DagsterEventType.STEP_START,
             DagsterEventType.STEP_SUCCESS,
             DagsterEventType.ENGINE_EVENT,
             DagsterEventType.PIPELINE_SUCCESS,
@@ -333,6 +342,37 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(conn_string):
     assert set(map(lambda e: e.run_id, out_events_two)) == {result_two.run_id}
 
 
+def test_get_stats_for_runs(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = gather_events(_solids)
+    event_log_storage.store_events(events_one)
+
+    events_two, result_two = gather_events(_solids)
+    event_log_storage.store_events(events_two)
+
+    stats_one = event_log_storage.get_stats_for_run(result_one.run_id)
+    assert stats_one.run_id == result_one.run_id
+    assert stats_one.steps_succeeded == 1
+    assert stats_one.start_time is not None
+    assert stats_one.end_time is not None
+
+    stats = event_log_storage.get_stats_for_runs(
+        [result_one.run_id, result_two.run_id, 'not_a_run']
+    )
+    assert stats[result_one.run_id] == stats_one
+    assert stats[result_two.run_id].steps_succeeded == 1
+    assert stats['not_a_run'].steps_succeeded == 0
+    assert stats['not_a_run'].start_time is None
+
+
 def test_listen_notify_single_run_event(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 
@@ -442,3 +482,33 @@ def test_listen_notify_filter_run_event(conn_string):
 
     finally:
         del event_log_storage
+
+
+def test_listen_notify_events_in_order(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    event_list = []
+
+    run_id = str(uuid.uuid4())
+
+    event_log_storage.event_watcher.watch_run(run_id, 0, event_list.append)
+
+    try:
+        events, _ = gather_events(_solids, run_config=RunConfig(run_id=run_id))
+        # Events stored in one batch are notified together, and fetched with a single query
+        event_log_storage.store_events(events)
+
+        start = time.time()
+        while len(event_list) < 7 and time.time() - start < TEST_TIMEOUT:
+            pass
+
+        assert [event.message for event in event_list] == [event.message for event in events]
+    finally:
+        del event_log_storage